@@ -0,0 +1,165 @@
+"""
+uzycie
+python3 batch_convert.py <plik|katalog|wzorzec> [...] [--format csv,xlsx,parquet] [--workers N] [--force] [--incremental]
+
+Konwertuje wiele plików z wynikami naraz, rozdzielając je na pulę procesów
+(domyślnie jeden na rdzeń). Katalogi są przeszukiwane pod kątem plików
+*_linkedin_profiles.json / .jsonl. Pliki, których wynik jest nowszy od
+wejścia, są pomijane (chyba że podano --force). Z --incremental eksport CSV
+i XLSX obejmuje tylko rekordy dodane od poprzedniej konwersji.
+"""
+import argparse
+import contextlib
+import glob
+import importlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+# format -> (moduł, funkcja, rozszerzenie wyniku)
+CONVERTERS = {
+    'csv': ('json_to_csv', 'json_to_csv', '.csv'),
+    'xlsx': ('json_to_xml', 'json_to_xlsx', '.xlsx'),
+    'parquet': ('json_to_parquet', 'json_to_parquet', '.parquet'),
+}
+DIRECTORY_PATTERNS = ['*_linkedin_profiles.json', '*_linkedin_profiles.jsonl']
+INCREMENTAL_FORMATS = {'csv', 'xlsx'}
+
+
+def expand_inputs(patterns):
+    """Rozwija katalogi i wzorce glob do listy plików (bez duplikatów, w kolejności)"""
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for directory_pattern in DIRECTORY_PATTERNS:
+                files.extend(sorted(glob.glob(os.path.join(pattern, directory_pattern))))
+        else:
+            matches = sorted(glob.glob(pattern, recursive=True))
+            files.extend(matches or [pattern])
+    return list(dict.fromkeys(files))
+
+
+def dedupe_by_output(files):
+    """Zostawia jedno wejście na plik wynikowy.
+
+    q.json i q.jsonl dają ten sam wynik (i ten sam plik .tmp), więc
+    konwertowane równolegle nadpisywałyby się nawzajem. Wygrywa plik
+    zmodyfikowany najpóźniej; pominięte są wypisywane.
+    """
+    chosen = {}
+    for json_filename in files:
+        base_name = os.path.splitext(json_filename)[0]
+        current = chosen.get(base_name)
+        if current is None or _mtime(json_filename) > _mtime(current):
+            chosen[base_name] = json_filename
+    for json_filename in files:
+        if json_filename not in chosen.values():
+            winner = chosen[os.path.splitext(json_filename)[0]]
+            print(f"⚠️ Pominięto {json_filename}: ten sam plik wynikowy co nowszy {winner}")
+    return [json_filename for json_filename in files if json_filename in chosen.values()]
+
+
+def _mtime(filename):
+    return os.path.getmtime(filename) if os.path.exists(filename) else 0
+
+
+def output_filename(json_filename, output_format):
+    return os.path.splitext(json_filename)[0] + CONVERTERS[output_format][2]
+
+
+def is_up_to_date(json_filename, output_format):
+    output = output_filename(json_filename, output_format)
+    return (os.path.exists(output) and os.path.exists(json_filename)
+            and os.path.getmtime(output) >= os.path.getmtime(json_filename))
+
+
+def convert_file(json_filename, output_format, incremental=False):
+    """Uruchamiane w procesie roboczym; zwraca wynik konwersji jednego pliku"""
+    module_name, function_name, _ = CONVERTERS[output_format]
+    converter = getattr(importlib.import_module(module_name), function_name)
+    kwargs = {'incremental': True} if incremental and output_format in INCREMENTAL_FORMATS else {}
+
+    messages = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(messages):
+            rows = converter(json_filename, **kwargs)
+        error = None if rows is not None else messages.getvalue().strip().lstrip("❌⚠️ ")
+    except Exception as e:
+        rows, error = None, f"{type(e).__name__}: {e}"
+
+    return {
+        'file': json_filename,
+        'format': output_format,
+        'rows': rows or 0,
+        'bytes': os.path.getsize(json_filename) if os.path.exists(json_filename) else 0,
+        'seconds': time.perf_counter() - start,
+        'error': error,
+    }
+
+
+def _rates(result):
+    seconds = max(result['seconds'], 1e-9)
+    return result['bytes'] / (1 << 20) / seconds, result['rows'] / seconds
+
+
+def batch_convert(patterns, formats=('csv',), workers=None, force=False, incremental=False):
+    """Konwertuje wszystkie pasujące pliki i zwraca listę wyników"""
+    workers = workers or os.cpu_count() or 1
+    files = dedupe_by_output(expand_inputs(patterns))
+
+    tasks = []
+    skipped = 0
+    for json_filename in files:
+        for output_format in formats:
+            if not force and is_up_to_date(json_filename, output_format):
+                skipped += 1
+                continue
+            tasks.append((json_filename, output_format, incremental))
+
+    print(f"📂 Plików: {len(files)}, zadań: {len(tasks)}, pominięto aktualnych: {skipped}, procesów: {workers}")
+
+    results = []
+    start = time.perf_counter()
+    if tasks:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            futures = [executor.submit(convert_file, *task) for task in tasks]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if result['error']:
+                    print(f"❌ {result['file']} [{result['format']}]: {result['error']}")
+                else:
+                    mb_per_second, rows_per_second = _rates(result)
+                    print(f"✅ {result['file']} [{result['format']}]: {result['rows']} wierszy, "
+                          f"{result['seconds']:.2f} s, {mb_per_second:.1f} MB/s, {rows_per_second:.0f} wierszy/s")
+    wall_seconds = max(time.perf_counter() - start, 1e-9)
+
+    converted = [result for result in results if not result['error']]
+    total_rows = sum(result['rows'] for result in converted)
+    total_mb = sum(result['bytes'] for result in converted) / (1 << 20)
+    print(f"📊 Skonwertowano {len(converted)}/{len(tasks)} (błędy: {len(tasks) - len(converted)}), "
+          f"{total_rows} wierszy, {total_mb:.1f} MB w {wall_seconds:.2f} s - "
+          f"{total_mb / wall_seconds:.1f} MB/s, {total_rows / wall_seconds:.0f} wierszy/s")
+    return results
+
+
+# --- ENTRY POINT ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Równoległa konwersja wielu plików z wynikami")
+    parser.add_argument("inputs", nargs="+", help="pliki, katalogi lub wzorce glob")
+    parser.add_argument("--format", default="csv", help="csv, xlsx, parquet lub kilka po przecinku")
+    parser.add_argument("--workers", type=int, help="liczba procesów (domyślnie liczba rdzeni)")
+    parser.add_argument("--force", action="store_true", help="konwertuj także pliki z aktualnym wynikiem")
+    parser.add_argument("--incremental", action="store_true", help="CSV/XLSX: tylko rekordy dodane od ostatniej konwersji")
+    args = parser.parse_args()
+
+    output_formats = [f.strip() for f in args.format.split(",") if f.strip()]
+    unknown = [f for f in output_formats if f not in CONVERTERS]
+    if unknown:
+        parser.error(f"nieznany format: {', '.join(unknown)}")
+
+    batch_convert(args.inputs, formats=output_formats, workers=args.workers, force=args.force,
+                  incremental=args.incremental)
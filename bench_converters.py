@@ -0,0 +1,159 @@
+"""
+LinkedIn Bot - Converter Benchmark
+
+Generates synthetic profile files and runs each converter in a separate
+process, reporting throughput and peak RSS of that process.
+
+python3 bench_converters.py [--records N] [--formats array,jsonl] [--converters csv,csv-legacy,xlsx,...] [--workdir DIR]
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def _legacy_json_to_csv(json_filename):
+    """Pre-streaming converter: whole file in memory, header from the first record"""
+    with open(json_filename, 'r', encoding='utf-8') as f:
+        if json_filename.endswith(".jsonl"):
+            data = [json.loads(line) for line in f if line.strip()]
+        else:
+            data = json.load(f)
+    with open(os.path.splitext(json_filename)[0] + '.csv', 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=data[0].keys(), extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(data)
+    return len(data)
+
+
+def _streaming_json_to_csv(json_filename):
+    from json_to_csv import json_to_csv
+    return json_to_csv(json_filename)
+
+
+def _streaming_json_to_csv_fixed_header(json_filename):
+    from json_to_csv import json_to_csv
+    return json_to_csv(json_filename, fieldnames=["name", "title", "current_company", "location", "profile_url"])
+
+
+def _streaming_json_to_xlsx(json_filename):
+    from json_to_xml import json_to_xlsx
+    return json_to_xlsx(json_filename)
+
+
+def _in_memory_json_to_xlsx(json_filename):
+    from json_to_xml import json_to_xlsx
+    return json_to_xlsx(json_filename, streaming=False)
+
+
+def _json_to_parquet(json_filename):
+    from json_to_parquet import json_to_parquet
+    return json_to_parquet(json_filename)
+
+
+CONVERTERS = {
+    "csv": _streaming_json_to_csv,
+    "csv-fixed": _streaming_json_to_csv_fixed_header,
+    "csv-legacy": _legacy_json_to_csv,
+    "xlsx": _streaming_json_to_xlsx,
+    "xlsx-in-memory": _in_memory_json_to_xlsx,
+    "parquet": _json_to_parquet,
+}
+
+
+def generate_profiles_file(filename, record_count, file_format):
+    """Writes record_count synthetic profiles; every 50th one carries an extra key"""
+    with open(filename, 'w', encoding='utf-8') as f:
+        if file_format == "array":
+            f.write("[\n")
+        for i in range(record_count):
+            profile = {
+                "name": f"Osoba {i}",
+                "title": "Security Engineer" if i % 3 else "Software Developer",
+                "location": "Kraków, Małopolskie, Polska",
+                "current_company": f"Firma {i % 997}",
+                "profile_url": f"https://www.linkedin.com/in/osoba-{i}"
+            }
+            if i % 50 == 0:
+                profile["headline_extra"] = "Open to work"
+            line = json.dumps(profile, ensure_ascii=False)
+            if file_format == "array":
+                f.write(line + (",\n" if i < record_count - 1 else "\n"))
+            else:
+                f.write(line + "\n")
+        if file_format == "array":
+            f.write("]\n")
+
+
+def run_child(converter_name, filename):
+    """Runs one conversion in this process and prints its measurements as JSON"""
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            rows = CONVERTERS[converter_name](filename)
+    except ImportError as e:
+        # Optional dependency (e.g. pyarrow for parquet) is not installed
+        print(json.dumps({"unavailable": str(e)}))
+        return
+    elapsed = time.perf_counter() - start
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # macOS reports ru_maxrss in bytes, Linux in kilobytes
+        peak_rss_kb /= 1024
+    print(json.dumps({"rows": rows, "seconds": elapsed, "peak_rss_kb": peak_rss_kb}))
+
+
+def measure(converter_name, filename):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", converter_name, filename],
+        check=True, capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON converters")
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--formats", default="array,jsonl")
+    parser.add_argument("--converters", default=",".join(CONVERTERS))
+    parser.add_argument("--workdir", help="where to keep generated files (default: temporary directory)")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="converter_bench_")
+    os.makedirs(workdir, exist_ok=True)
+
+    print(f"{'converter':<16}{'input':<8}{'MB':>9}{'rows':>10}{'seconds':>10}{'MB/s':>9}{'rows/s':>11}{'peak RSS MB':>13}")
+    for file_format in args.formats.split(","):
+        filename = os.path.join(workdir, f"bench_profiles.{'json' if file_format == 'array' else 'jsonl'}")
+        generate_profiles_file(filename, args.records, file_format)
+        size_mb = os.path.getsize(filename) / (1 << 20)
+
+        for converter_name in args.converters.split(","):
+            result = measure(converter_name, filename)
+            if "unavailable" in result:
+                print(f"{converter_name:<16}{file_format:<8}  unavailable: {result['unavailable']}")
+                continue
+            seconds = result["seconds"] or 1e-9
+            rows = result["rows"] or 0
+            print(f"{converter_name:<16}{file_format:<8}{size_mb:>9.1f}{rows:>10}{seconds:>10.2f}"
+                  f"{size_mb / seconds:>9.1f}{rows / seconds:>11.0f}{result['peak_rss_kb'] / 1024:>13.1f}")
+
+    if not args.workdir:
+        print(f"Generated files kept in {workdir}")
+
+
+# --- ENTRY POINT ---
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+LinkedIn Bot - Crawl Checkpoint Module
+
+Per-query progress of a people search crawl, written atomically after every
+page so an interrupted crawl can resume where it stopped.
+"""
+import json
+import os
+import time
+
+from login import LoggerSetup, Utils
+
+
+class CrawlCheckpoint:
+    def __init__(self, query, filename=None):
+        self.query = query
+        self.filename = filename or Utils.create_filename_from_query(query, extension="checkpoint.json")
+        self.last_completed_page = 0
+        self.result_url = None
+        self.seen_urls = set()
+        self.logger = LoggerSetup.get_logger("CrawlCheckpoint")
+
+    @classmethod
+    def load(cls, query, filename=None):
+        """Returns the saved checkpoint for the query, or None"""
+        checkpoint = cls(query, filename)
+        if not os.path.exists(checkpoint.filename):
+            return None
+
+        try:
+            with open(checkpoint.filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            checkpoint.logger.warning(f"Ignoring unreadable checkpoint {checkpoint.filename}: {e}")
+            return None
+
+        checkpoint.last_completed_page = data.get("last_completed_page", 0)
+        checkpoint.result_url = data.get("result_url")
+        checkpoint.seen_urls = set(data.get("seen_urls", []))
+        return checkpoint
+
+    def save(self):
+        """Writes the checkpoint atomically (temp file + fsync + rename)"""
+        data = {
+            "query": self.query,
+            "last_completed_page": self.last_completed_page,
+            "result_url": self.result_url,
+            "seen_urls": sorted(self.seen_urls),
+            "updated_at": time.time()
+        }
+        temp_filename = self.filename + ".tmp"
+        with open(temp_filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_filename, self.filename)
+
+    def mark_page_completed(self, page, result_url, profile_urls):
+        self.last_completed_page = page
+        self.result_url = result_url
+        self.seen_urls.update(url for url in profile_urls if url)
+        self.save()
+
+    def clear(self):
+        """Removes the checkpoint once the crawl has finished"""
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
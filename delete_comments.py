@@ -6,16 +6,209 @@ import time
 from typing import Set
 
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import StaleElementReferenceException
 
 from login import Config, LoggerSetup, Utils
+from selector_cache import SelectorCache
+from deletion_ledger import DeletionLedger
+
+
+ARTICLE_SELECTORS = [
+    "article.comments-comment-entity",
+    "article[data-id]",
+    "article[class*='comment']",
+    "//article[contains(@class, 'comments-comment')]",
+    "//article[@data-id]"
+]
+
+ACTOR_SELECTORS = [
+    ".comments-comment-meta__actor",
+    "div[class*='comment-meta__actor']",
+    "div[class*='actor']",
+    "//div[contains(@class, 'actor')]",
+    "//a[contains(@class, 'actor')]"
+]
+
+# DOM helpers shared by the comment scripts below. XPath selectors are
+# evaluated relative to the given scope. resolveId applies the same ID
+# fallback chain as the per-element path: data-id, then id / article-id /
+# comment-id, then an id-<...> class. The comment index (ID -> live article
+# element) lives on window together with the article selector it was built
+# with. A MutationObserver queues the element nodes added since then - once
+# for the index (added) and once for streaming harvests (unharvested) - so
+# both can look at new nodes only instead of rescanning the page; removed
+# articles are detected through isConnected. With an XPath article selector
+# (no Element.matches) the scripts fall back to full scans.
+COMMENT_DOM_HELPERS = """
+const isXPath = (selector) => selector.startsWith('/') || selector.startsWith('(');
+const findAll = (scope, selector) => {
+    if (isXPath(selector)) {
+        const xpath = selector.startsWith('//') && scope !== document ? '.' + selector : selector;
+        const result = document.evaluate(xpath, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+    }
+    return Array.from(scope.querySelectorAll(selector));
+};
+const resolveId = (article) => {
+    let id = article.getAttribute('data-id');
+    if (!id) {
+        for (const attr of ['id', 'article-id', 'comment-id']) {
+            id = article.getAttribute(attr);
+            if (id) break;
+        }
+    }
+    if (!id) {
+        const match = /id-([a-zA-Z0-9_-]+)/.exec(article.getAttribute('class') || '');
+        if (match) id = match[1];
+    }
+    return id || null;
+};
+const findArticles = (scope, articleSelectors) => {
+    for (let i = 0; i < articleSelectors.length; i++) {
+        let articles = [];
+        try { articles = findAll(scope, articleSelectors[i]); } catch (e) { continue; }
+        if (articles.length) return [i, articles];
+    }
+    return [-1, []];
+};
+const commentIndex = () => {
+    let index = window.__linkedinBotCommentIndex;
+    if (!index) {
+        // unharvested is only filled while a streaming harvest drains it
+        index = {map: new Map(), selector: null, dirty: true, builds: 0, added: [], unharvested: [], streaming: false};
+        new MutationObserver(records => {
+            for (const record of records) {
+                for (const node of record.addedNodes) {
+                    if (node.nodeType !== Node.ELEMENT_NODE) continue;
+                    index.added.push(node);
+                    if (index.streaming) index.unharvested.push(node);
+                    index.dirty = true;
+                }
+            }
+        }).observe(document.body, {childList: true, subtree: true});
+        window.__linkedinBotCommentIndex = index;
+    }
+    return index;
+};
+const canTrackAdded = (index) => Boolean(index && index.selector && !isXPath(index.selector));
+const indexArticles = (selector, articles) => {
+    const index = commentIndex();
+    index.map = new Map();
+    for (const article of articles) {
+        const id = resolveId(article);
+        if (id) index.map.set(id, article);
+    }
+    index.selector = selector;
+    index.added = [];
+    index.dirty = false;
+    index.builds += 1;
+    return index;
+};
+// Articles at or under the queued nodes (emptying the queue), added to the index
+const takeArticles = (index, queue) => {
+    const articles = [];
+    for (const node of index[queue]) {
+        if (!node.isConnected) continue;
+        if (node.matches(index.selector)) articles.push(node);
+        articles.push(...node.querySelectorAll(index.selector));
+    }
+    index[queue] = [];
+    for (const article of articles) {
+        const id = resolveId(article);
+        if (id) index.map.set(id, article);
+    }
+    return articles;
+};
+"""
+
+# Reads author text and comment ID of comment articles in one round trip
+# (first article selector that matches anything, first matching actor
+# selector per article) and builds the comment index from the same articles.
+# With onlyUnseen, only nodes added since the previous call are examined once
+# the index exists, so a streaming batch costs time proportional to the batch
+# rather than to everything loaded so far; articles returned before are marked
+# with data-bot-seen and skipped. Added nodes are only queued for harvesting
+# after an onlyUnseen call; a full harvest stops queueing them.
+# arguments: [container element or null, article selectors, actor selectors, onlyUnseen]
+COMMENT_HARVEST_SCRIPT = COMMENT_DOM_HELPERS + """
+const [root, articleSelectors, actorSelectors, onlyUnseen] = arguments;
+let index = window.__linkedinBotCommentIndex;
+let articles;
+if (onlyUnseen && canTrackAdded(index) && articleSelectors.includes(index.selector)) {
+    articles = takeArticles(index, 'unharvested');
+    if (root) articles = articles.filter(article => root.contains(article));
+} else {
+    const [selectorIndex, allArticles] = findArticles(root || document, articleSelectors);
+    index = indexArticles(selectorIndex >= 0 ? articleSelectors[selectorIndex] : null, allArticles);
+    index.unharvested = [];
+    articles = allArticles;
+}
+index.streaming = Boolean(onlyUnseen);
+
+if (onlyUnseen) {
+    articles = articles.filter(article => {
+        if (article.hasAttribute('data-bot-seen')) return false;
+        article.setAttribute('data-bot-seen', '1');
+        return true;
+    });
+}
+
+const comments = articles.map(article => {
+    let author = '';
+    let actorSelector = -1;
+    for (let i = 0; i < actorSelectors.length; i++) {
+        let actor = null;
+        try { actor = findAll(article, actorSelectors[i])[0]; } catch (e) { continue; }
+        if (actor) {
+            author = actor.innerText || actor.textContent || '';
+            actorSelector = i;
+            break;
+        }
+    }
+    return {author: author, id: resolveId(article), actorSelector: actorSelector};
+});
+return {articleSelector: index.selector ? articleSelectors.indexOf(index.selector) : -1, comments: comments};
+"""
+
+# Returns the live article element for a comment ID from the comment index,
+# first adding articles from nodes added since the last update (or rebuilding
+# the index when added nodes cannot be tracked).
+# arguments: [comment ID, article selectors]
+COMMENT_LOOKUP_SCRIPT = COMMENT_DOM_HELPERS + """
+const [commentId, articleSelectors] = arguments;
+let index = window.__linkedinBotCommentIndex;
+if (canTrackAdded(index)) {
+    if (index.dirty) {
+        takeArticles(index, 'added');
+        index.dirty = false;
+    }
+} else if (!index || index.dirty) {
+    const [selectorIndex, articles] = findArticles(document, articleSelectors);
+    index = indexArticles(selectorIndex >= 0 ? articleSelectors[selectorIndex] : null, articles);
+}
+const article = index.map.get(commentId);
+if (!article || !article.isConnected) {
+    index.map.delete(commentId);
+    return null;
+}
+return article;
+"""
 
 
 class LinkedInCommentHandler:
-    def __init__(self, driver):
+    def __init__(self, driver, selector_cache=None, ledger=None):
         self.driver = driver
+        self.selector_cache = selector_cache or SelectorCache.shared()
+        self.ledger = ledger or DeletionLedger()
+        self.seen_comment_ids = set()
+        self.last_failure_reason = None
+        # Set by load_all_pages and gather_damian_comment_ids
+        self.load_failed = False
+        self.listing_complete = False
+        self.listed_comment_ids = set()
         self.logger = LoggerSetup.get_logger("LinkedInCommentHandler")
 
     def expand_replies(self):
@@ -41,48 +234,87 @@ class LinkedInCommentHandler:
             except Exception as e:
                 self.logger.debug(f"Failed to click 'See previous replies' button: {e}")
 
-    def load_all_pages(self):
+    def load_all_pages(self) -> bool:
+        """Loads every comment batch; returns True only when the load is confirmed complete.
+
+        Complete means no "Show more" click failed and, after scrolling to the
+        bottom and letting lazy loading settle, no "Show more" button is left.
+        """
+        self.load_failed = False
         while True:
             self.expand_replies()
+            if self.load_more_comments():
+                continue
+            if self.finished_loading():
+                return True
+            if self.load_failed:
+                self.logger.warning("Loading comments stopped on an error - the listing may be incomplete")
+                return False
+
+    def finished_loading(self) -> bool:
+        """Once load_more_comments returns False: True when nothing is left to load.
+
+        False straight away after a failed click; otherwise scrolls to the
+        bottom, lets lazy loading settle and checks that no "Show more" button
+        has appeared.
+        """
+        if self.load_failed:
+            return False
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        Utils.random_delay(2, 3)
+        return self.find_load_more_button() is None
+
+    def find_load_more_button(self):
+        """The "Show more" button, or None"""
+        # More general approach to finding "Show more" button
+        load_more_selectors = [
+            ".scaffold-finite-scroll__load-button",
+            "button.scaffold-finite-scroll__load-button",
+            "//button[contains(text(), 'Pokaż więcej') or contains(text(), 'Show more') or contains(text(), 'Load more')]"
+        ]
+        
+        load_more_button = None
+        for selector in self.selector_cache.order("comments:load_more", load_more_selectors):
+            try:
+                if selector.startswith("//"):
+                    elements = self.driver.find_elements(By.XPATH, selector)
+                else:
+                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                
+                if elements:
+                    load_more_button = elements[0]
+                    self.selector_cache.record_win("comments:load_more", selector, load_more_selectors)
+                    break
+            except Exception:
+                continue
+        
+        return load_more_button
+
+    def load_more_comments(self) -> bool:
+        """Clicks "Show more" once; returns False when there is nothing more to load.
+
+        A click that fails also returns False and sets load_failed.
+        """
+        load_more_button = self.find_load_more_button()
+        if not load_more_button:
+            return False
+
+        try:
+            # Scroll to button
+            self.driver.execute_script("arguments[0].scrollIntoView(true);", load_more_button)
+            Utils.random_delay(0.5, 1)
             
-            # More general approach to finding "Show more" button
-            load_more_selectors = [
-                ".scaffold-finite-scroll__load-button",
-                "button.scaffold-finite-scroll__load-button",
-                "//button[contains(text(), 'Pokaż więcej') or contains(text(), 'Show more') or contains(text(), 'Load more')]"
-            ]
-            
-            load_more_button = None
-            for selector in load_more_selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = self.driver.find_elements(By.XPATH, selector)
-                    else:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    if elements:
-                        load_more_button = elements[0]
-                        break
-                except Exception:
-                    continue
+            # Click button
+            self.driver.execute_script("arguments[0].click();", load_more_button)
+            Utils.random_delay(1.5, 2.5)
             
-            if load_more_button:
-                try:
-                    # Scroll to button
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", load_more_button)
-                    Utils.random_delay(0.5, 1)
-                    
-                    # Click button
-                    self.driver.execute_script("arguments[0].click();", load_more_button)
-                    Utils.random_delay(1.5, 2.5)
-                    
-                    # Add random page scrolling for better human simulation
-                    Utils.random_scroll(self.driver)
-                except Exception as e:
-                    self.logger.warning(f"Failed to click 'Show more results': {e}")
-                    break
-            else:
-                break
+            # Add random page scrolling for better human simulation
+            Utils.random_scroll(self.driver)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to click 'Show more results': {e}")
+            self.load_failed = True
+            return False
 
     def find_comments_container(self):
         """Finds the comments container using multiple strategies"""
@@ -94,23 +326,59 @@ class LinkedInCommentHandler:
             "//div[contains(@class, 'comments-container')]"
         ]
         
-        for selector in container_selectors:
-            try:
-                if selector.startswith("//"):
-                    container = Utils.wait_and_find_element(self.driver, By.XPATH, selector, timeout=5)
-                else:
-                    container = Utils.wait_and_find_element(self.driver, By.CSS_SELECTOR, selector, timeout=5)
-                
-                if container:
-                    return container
-            except Exception:
-                continue
-        
-        return None
+        _, container = Utils.wait_for_any(
+            self.driver, container_selectors, timeout=10,
+            selector_cache=self.selector_cache, page_type="comments:container"
+        )
+        return container
+
+    def harvest_comment_records(self, container, only_unseen=False):
+        """Reads author text and ID of every comment article with a single script call.
+
+        With only_unseen, articles returned by an earlier call are skipped; once
+        the comment index exists only nodes added since the previous call are
+        examined.
+        Returns a list of {"author", "id"} dicts, or None when the script fails
+        so the caller can fall back to per-element lookups.
+        """
+        article_selectors = self.selector_cache.order("comments:articles", ARTICLE_SELECTORS)
+        actor_selectors = self.selector_cache.order("comments:actor", ACTOR_SELECTORS)
+        try:
+            result = self.driver.execute_script(
+                COMMENT_HARVEST_SCRIPT, container, article_selectors, actor_selectors, only_unseen
+            )
+        except Exception as e:
+            self.logger.warning(f"Comment harvesting script failed, using per-element lookups: {e}")
+            return None
+
+        if not result:
+            return None
+        if result.get("articleSelector", -1) < 0:
+            self.logger.error("No comment articles found")
+            return []
+
+        article_selector = article_selectors[result["articleSelector"]]
+        self.selector_cache.record_win("comments:articles", article_selector, ARTICLE_SELECTORS)
+        comments = result.get("comments") or []
+        self.logger.info(f"Found {len(comments)} comments using selector: {article_selector}")
+
+        actor_indexes = [c["actorSelector"] for c in comments if c.get("actorSelector", -1) >= 0]
+        if actor_indexes:
+            winner = max(set(actor_indexes), key=actor_indexes.count)
+            self.selector_cache.record_win("comments:actor", actor_selectors[winner], ACTOR_SELECTORS)
+
+        return [{"author": c.get("author") or "", "id": c.get("id")} for c in comments]
 
     def gather_damian_comment_ids(self) -> Set[str]:
-        comment_ids = set()
-        self.load_all_pages()
+        """Author's comment IDs on the fully loaded comments page.
+
+        listed_comment_ids holds the IDs of every listed comment, whoever the
+        author. listing_complete tells whether it covers every comment, i.e.
+        the load was confirmed complete and the harvest script returned articles.
+        """
+        self.listing_complete = False
+        self.listed_comment_ids = set()
+        load_complete = self.load_all_pages()
 
         # Find comments container
         container = self.find_comments_container()
@@ -119,17 +387,27 @@ class LinkedInCommentHandler:
             self.logger.error("Comments container not found")
             return set()
 
-        # More general approach to finding comment articles
-        article_selectors = [
-            "article.comments-comment-entity",
-            "article[data-id]",
-            "article[class*='comment']",
-            "//article[contains(@class, 'comments-comment')]",
-            "//article[@data-id]"
-        ]
-        
+        records = self.harvest_comment_records(container)
+        if records is None:
+            # The per-element path only reads IDs of the author's articles
+            comment_ids = self.gather_comment_ids_per_element(container)
+        else:
+            # Collecting author's comment IDs
+            comment_ids = {record["id"] for record in records if record["id"] and Config.AUTOR in record["author"]}
+            self.logger.debug(f"Found author's comments: {sorted(comment_ids)}")
+            self.listed_comment_ids = {record["id"] for record in records if record["id"]}
+            # An empty listing more likely means broken selectors than no comments
+            self.listing_complete = load_complete and bool(self.listed_comment_ids)
+
+        self.selector_cache.save()
+        return comment_ids
+
+    def gather_comment_ids_per_element(self, container) -> Set[str]:
+        """Fallback: reads every article with individual WebDriver calls"""
+        comment_ids = set()
+
         articles = []
-        for selector in article_selectors:
+        for selector in self.selector_cache.order("comments:articles", ARTICLE_SELECTORS):
             try:
                 if selector.startswith("//"):
                     articles = container.find_elements(By.XPATH, selector)
@@ -137,6 +415,7 @@ class LinkedInCommentHandler:
                     articles = container.find_elements(By.CSS_SELECTOR, selector)
                 
                 if articles:
+                    self.selector_cache.record_win("comments:articles", selector, ARTICLE_SELECTORS)
                     self.logger.info(f"Found {len(articles)} comments using selector: {selector}")
                     break
             except Exception:
@@ -149,17 +428,8 @@ class LinkedInCommentHandler:
         # Collecting author's comment IDs
         for article in articles:
             try:
-                # More general approach to finding the author section
-                actor_selectors = [
-                    ".comments-comment-meta__actor",
-                    "div[class*='comment-meta__actor']",
-                    "div[class*='actor']",
-                    "//div[contains(@class, 'actor')]",
-                    "//a[contains(@class, 'actor')]"
-                ]
-                
                 actor_section = None
-                for selector in actor_selectors:
+                for selector in self.selector_cache.order("comments:actor", ACTOR_SELECTORS):
                     try:
                         if selector.startswith("//"):
                             actor_section = article.find_element(By.XPATH, selector)
@@ -167,6 +437,7 @@ class LinkedInCommentHandler:
                             actor_section = article.find_element(By.CSS_SELECTOR, selector)
                         
                         if actor_section:
+                            self.selector_cache.record_win("comments:actor", selector, ACTOR_SELECTORS)
                             break
                     except Exception:
                         continue
@@ -199,18 +470,28 @@ class LinkedInCommentHandler:
             except StaleElementReferenceException:
                 self.logger.debug("Element became stale during processing")
             except Exception as e:
-                self.logger.warning(f"gather_damian_comment_ids: Failed to read article ID: {e}")
+                self.logger.warning(f"gather_comment_ids_per_element: Failed to read article ID: {e}")
 
         return comment_ids
 
+    def lookup_article(self, comment_id: str):
+        """Looks the article up in the in-page comment index (one script call)"""
+        try:
+            return self.driver.execute_script(
+                COMMENT_LOOKUP_SCRIPT, comment_id, self.selector_cache.order("comments:articles", ARTICLE_SELECTORS)
+            )
+        except Exception as e:
+            self.logger.debug(f"Comment index lookup failed for {comment_id}: {e}")
+            return None
+
     def find_article_by_id(self, comment_id: str):
         """Finds an article based on comment ID - with multiple method handling"""
+        article = self.lookup_article(comment_id)
+        if article is not None:
+            return article
+
         try:
-            # Scroll to top of page
-            self.driver.execute_script("window.scrollTo(0, 0)")
-            Utils.random_delay(0.5, 1.5)
-            
-            # Try different selectors
+            # Not in the index - try different selectors
             selectors = [
                 f"article.comments-comment-entity[data-id='{comment_id}']",
                 f"article[data-id='{comment_id}']",
@@ -219,7 +500,9 @@ class LinkedInCommentHandler:
                 f"//article[contains(@class, 'comment')][@id='{comment_id}']"
             ]
             
-            for selector in selectors:
+            # Selectors embed the comment ID, so cache them by their template
+            selector_key = lambda selector: selector.replace(comment_id, "{comment_id}")
+            for selector in self.selector_cache.order("comments:article_by_id", selectors, key=selector_key):
                 try:
                     if selector.startswith("//"):
                         article = self.driver.find_element(By.XPATH, selector)
@@ -227,6 +510,7 @@ class LinkedInCommentHandler:
                         article = self.driver.find_element(By.CSS_SELECTOR, selector)
                     
                     if article:
+                        self.selector_cache.record_win("comments:article_by_id", selector, selectors, key=selector_key)
                         return article
                 except Exception:
                     continue
@@ -248,7 +532,7 @@ class LinkedInCommentHandler:
             "//button[contains(@aria-label, 'More actions')]"
         ]
         
-        for selector in options_selectors:
+        for selector in self.selector_cache.order("comments:options_button", options_selectors):
             try:
                 if selector.startswith("//"):
                     options_button = article.find_element(By.XPATH, selector)
@@ -256,6 +540,7 @@ class LinkedInCommentHandler:
                     options_button = article.find_element(By.CSS_SELECTOR, selector)
                 
                 if options_button:
+                    self.selector_cache.record_win("comments:options_button", selector, options_selectors)
                     return options_button
             except Exception:
                 continue
@@ -272,10 +557,11 @@ class LinkedInCommentHandler:
             "//div[contains(@class, 'dropdown__item')]//span[contains(text(), 'Usuń')]"
         ]
         
-        for selector in delete_selectors:
+        for selector in self.selector_cache.order("comments:delete_button", delete_selectors):
             try:
                 delete_buttons = self.driver.find_elements(By.XPATH, selector)
                 if delete_buttons:
+                    self.selector_cache.record_win("comments:delete_button", selector, delete_selectors)
                     return delete_buttons[0]
             except Exception:
                 continue
@@ -292,20 +578,19 @@ class LinkedInCommentHandler:
             "//div[contains(@class, 'confirmation')]//button[contains(text(), 'Usuń')]"
         ]
         
-        for selector in confirm_selectors:
-            try:
-                confirm_button = Utils.wait_and_find_element(self.driver, By.XPATH, selector, timeout=5)
-                if confirm_button:
-                    return confirm_button
-            except Exception:
-                continue
-        
-        return None
+        _, confirm_button = Utils.wait_for_any(
+            self.driver, confirm_selectors, timeout=5, clickable=True,
+            selector_cache=self.selector_cache, page_type="comments:confirm_button"
+        )
+        return confirm_button
 
     def delete_comment_by_id(self, comment_id: str) -> bool:
+        """Deletes one comment; on failure the cause is left in last_failure_reason"""
+        self.last_failure_reason = None
         article = self.find_article_by_id(comment_id)
         if not article:
             self.logger.warning(f"Article with ID not found: {comment_id}")
+            self.last_failure_reason = "article not found"
             return False
 
         try:
@@ -317,6 +602,7 @@ class LinkedInCommentHandler:
             options_button = self.find_options_button(article)
             if not options_button:
                 self.logger.warning(f"Options button not found for comment {comment_id}")
+                self.last_failure_reason = "options button not found"
                 return False
                 
             # Click options button
@@ -327,6 +613,7 @@ class LinkedInCommentHandler:
             delete_button = self.find_delete_button()
             if not delete_button:
                 self.logger.warning(f"No 'Delete' button for comment {comment_id}")
+                self.last_failure_reason = "delete button not found"
                 return False
                 
             # Click "Delete" button
@@ -337,52 +624,140 @@ class LinkedInCommentHandler:
             confirm_btn = self.find_confirm_delete_button()
             if not confirm_btn:
                 self.logger.warning(f"Confirmation button not found for comment {comment_id}")
+                self.last_failure_reason = "confirmation button not found"
                 return False
 
             # Click confirmation button
             self.driver.execute_script("arguments[0].click();", confirm_btn)
-            Utils.random_delay(1.5, 2.5)
+
+            # The deletion only counts once LinkedIn removes the article node
+            if not self.wait_for_article_removal(article):
+                self.logger.warning(f"Comment {comment_id} is still on the page after confirmation")
+                self.last_failure_reason = "article not removed after confirmation"
+                return False
+            Utils.random_delay(0.5, 1)
             return True
 
         except Exception as e:
             self.logger.error(f"Error deleting comment {comment_id}: {e}")
+            self.last_failure_reason = f"error: {e}"
             return False
 
-    def delete_comments_with_retry(self, comment_ids: Set[str]):
-        to_remove = set(comment_ids)
-        max_passes = 3
+    def wait_for_article_removal(self, article, timeout=8) -> bool:
+        """True once the article node is detached from the DOM (stale) or hidden"""
+        def removed(driver):
+            try:
+                return not article.is_displayed()
+            except StaleElementReferenceException:
+                return True
 
-        for pass_index in range(1, max_passes+1):
-            if not to_remove:
-                self.logger.info("No more comments to delete. Finished!")
-                break
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(removed)
+            return True
+        except Exception:
+            return False
+
+    def dismiss_open_menus(self):
+        """Closes a dropdown or confirmation dialog left open by a failed attempt"""
+        try:
+            self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+        except Exception as e:
+            self.logger.debug(f"Could not dismiss open menus: {e}")
 
-            self.logger.info(f"Deleting comments (pass {pass_index}/{max_passes}). Remaining: {len(to_remove)}")
+    def reload_comments_page(self) -> bool:
+        """Full reload: opens the comments page again and loads every batch.
 
-            failed_this_round = set()
+        Returns True when the load is confirmed complete.
+        """
+        self.driver.get(Config.COMMENTS_URL)
+        Utils.random_delay(3, 5)
+        return self.load_all_pages()
 
+    def drop_unlisted(self, comment_ids: Set[str]) -> Set[str]:
+        """After a complete reload, records comments no longer listed as deleted and returns the rest"""
+        container = self.find_comments_container()
+        if not container:
+            return comment_ids
+        records = self.harvest_comment_records(container)
+        listed = {record["id"] for record in records or [] if record["id"]}
+        if not listed:
+            # Nothing readable was listed - the selectors failed, not the comments
+            return comment_ids
+
+        for cid in comment_ids - listed:
+            self.logger.info(f"Comment {cid} is no longer listed, treating it as deleted")
+            self.ledger.mark_deleted(cid, reason="no longer listed")
+        return comment_ids & listed
+
+    def settle_pending(self, pending: Set[str]):
+        """Settles pending comments that a complete listing does not show as the author's.
+
+        Those missing from the listing are gone and recorded as deleted; those
+        listed under another author are skipped rather than deleted.
+        """
+        for cid in pending - self.listed_comment_ids:
+            self.ledger.mark_deleted(cid, reason="no longer listed")
+        for cid in pending & self.listed_comment_ids:
+            self.logger.warning(f"Comment {cid} is listed under another author, skipping it")
+            self.ledger.mark_skipped(cid, reason="listed under another author")
+
+    def delete_and_record(self, comment_id: str) -> bool:
+        """Deletes a comment and records the outcome in the ledger"""
+        if self.delete_comment_by_id(comment_id):
+            self.logger.info(f"Comment {comment_id} deleted")
+            self.ledger.mark_deleted(comment_id)
+            return True
+        self.ledger.mark_failed(comment_id, self.last_failure_reason)
+        return False
+
+    def delete_comments_with_retry(self, comment_ids: Set[str], max_stalled_rounds=2, max_reloads=2):
+        """Deletes the given comments, retrying failures in place.
+
+        Each round looks every remaining article up again (through the comment
+        index) on the page as it is. The comments page is only reloaded in full
+        when max_stalled_rounds rounds in a row delete nothing - or straight
+        away when none of the remaining articles can be found any more.
+        """
+        to_remove = set(comment_ids)
+        round_index = 0
+        stalled_rounds = 0
+        reloads = 0
+
+        while to_remove:
+            round_index += 1
+            self.logger.info(f"Deleting comments (round {round_index}). Remaining: {len(to_remove)}")
+
+            deleted_this_round = 0
+            reasons = set()
             for cid in list(to_remove):
-                success = self.delete_comment_by_id(cid)
-                if success:
-                    self.logger.info(f"Comment {cid} deleted")
+                if self.delete_and_record(cid):
                     to_remove.remove(cid)
+                    deleted_this_round += 1
                 else:
-                    # Failed to delete, will try in next pass
-                    failed_this_round.add(cid)
+                    reasons.add(self.last_failure_reason)
+                    self.dismiss_open_menus()
 
-            if len(failed_this_round) == len(to_remove):
-                self.logger.info("Refreshing page because no additional comments were deleted")
-                self.driver.refresh()
-                Utils.random_delay(3, 5)
-            else:
-                # Refresh and reload to "revive" the DOM
-                self.driver.refresh()
-                Utils.random_delay(3, 5)
+            if not to_remove:
+                self.logger.info("No more comments to delete. Finished!")
+                break
 
-                # After refreshing, go to COMMENTS_URL again
-                self.driver.get(Config.COMMENTS_URL)
-                Utils.random_delay(3, 5)
-                self.load_all_pages()
+            stalled_rounds = 0 if deleted_this_round else stalled_rounds + 1
+            # Articles missing from the page will not turn up without reloading it
+            if stalled_rounds < max_stalled_rounds and reasons != {"article not found"}:
+                continue
+
+            if reloads >= max_reloads:
+                self.logger.warning(f"Retries stalled after {reloads} full reloads, giving up")
+                break
+            reloads += 1
+            stalled_rounds = 0
+            self.logger.info(f"In-place retries stalled, reloading the comments page ({reloads}/{max_reloads})")
+            # Missing comments only count as gone when the whole listing was loaded
+            if self.reload_comments_page():
+                to_remove = self.drop_unlisted(to_remove)
+
+        self.selector_cache.save()
+        self.selector_cache.log_stats()
 
         if to_remove:
             self.logger.warning("Failed to delete the following comments:")
@@ -391,15 +766,126 @@ class LinkedInCommentHandler:
         else:
             self.logger.info("All comments have been deleted")
 
-    def find_and_delete_comments(self):
-        self.driver.get(Config.COMMENTS_URL)
-        Utils.random_delay(2, 4)
+    def harvest_new_comment_ids(self) -> Set[str]:
+        """Author's comment IDs among articles loaded since the previous call.
 
-        comment_ids = self.gather_damian_comment_ids()
-        if not comment_ids:
-            self.logger.info("No Damian's comments found to delete")
-            return
+        Adds the IDs of every harvested comment to listed_comment_ids; a batch
+        that can only be read per element clears listing_complete.
+        """
+        container = self.find_comments_container()
+        if not container:
+            self.logger.error("Comments container not found")
+            self.listing_complete = False
+            return set()
+
+        records = self.harvest_comment_records(container, only_unseen=True)
+        if records is None:
+            comment_ids = self.gather_comment_ids_per_element(container)
+            self.listing_complete = False
+        else:
+            comment_ids = {record["id"] for record in records if record["id"] and Config.AUTOR in record["author"]}
+            self.listed_comment_ids.update(record["id"] for record in records if record["id"])
+
+        new_ids = comment_ids - self.seen_comment_ids
+        self.seen_comment_ids.update(new_ids)
+        return new_ids
+
+    def stream_delete_comments(self, max_passes=3) -> Set[str]:
+        """Deletes the author's comments batch by batch, before loading the next batch.
+
+        Only articles loaded since the previous batch are scanned. Deleting
+        comments can shift the server-side paging, so the comments page is
+        walked again until a pass deletes nothing. listed_comment_ids and
+        listing_complete describe the last pass, as gather_damian_comment_ids
+        does for a single load; only a pass that deleted nothing can be
+        complete. Returns the IDs that could not be deleted.
+        """
+        failed = set()
+        for pass_index in range(1, max_passes + 1):
+            if pass_index > 1:
+                self.driver.get(Config.COMMENTS_URL)
+                Utils.random_delay(2, 4)
+
+            self.load_failed = False
+            self.listed_comment_ids = set()
+            self.listing_complete = True
+            deleted_this_pass = 0
+            batch_index = 0
+            finished = False
+            while True:
+                self.expand_replies()
+                batch = self.ledger.filter_new(self.harvest_new_comment_ids())
+                batch_index += 1
+                if batch:
+                    self.logger.info(f"Pass {pass_index}, batch {batch_index}: {len(batch)} comments to delete")
+                for cid in batch:
+                    if self.delete_and_record(cid):
+                        deleted_this_pass += 1
+                    else:
+                        failed.add(cid)
+
+                if finished:
+                    break
+                if self.load_more_comments():
+                    continue
+                if self.load_failed:
+                    self.logger.warning("Loading comments stopped on an error - the listing may be incomplete")
+                    self.listing_complete = False
+                    break
+                # When loading has finished, one more batch picks up what the final scroll loaded
+                finished = self.finished_loading()
+
+            # Deletions can shift comments past the walk, and an empty listing more
+            # likely means broken selectors than no comments
+            self.listing_complete = (
+                self.listing_complete and deleted_this_pass == 0 and bool(self.listed_comment_ids)
+            )
+            self.logger.info(f"Streaming pass {pass_index}: deleted {deleted_this_pass} comments")
+            if deleted_this_pass == 0:
+                break
+            # Failed IDs are retried separately; the next pass should only find skipped ones
+            self.seen_comment_ids = set(failed)
 
-        self.logger.info(f"Collected {len(comment_ids)} of Damian's comments to delete")
-        self.delete_comments_with_retry(comment_ids)
-        
\ No newline at end of file
+        self.selector_cache.save()
+        return failed
+
+    def find_and_delete_comments(self, streaming=False):
+        self.ledger.start_run()
+        try:
+            self.driver.get(Config.COMMENTS_URL)
+            Utils.random_delay(2, 4)
+
+            if streaming:
+                failed = self.stream_delete_comments()
+                # Pending comments from earlier runs that the stream did not list as the author's
+                pending = self.ledger.pending_ids() - failed
+                if pending and self.listing_complete:
+                    self.settle_pending(pending)
+                elif pending:
+                    self.logger.info(
+                        f"{len(pending)} comments pending from earlier runs were not listed - "
+                        f"run without streaming to resume them"
+                    )
+                if failed:
+                    self.logger.info(f"Retrying {len(failed)} comments that failed during streaming")
+                    self.delete_comments_with_retry(failed)
+                else:
+                    self.selector_cache.log_stats()
+                    self.logger.info("All listed comments have been deleted")
+                return
+
+            # Delete the listed comments and resume the pending ones
+            comment_ids = self.ledger.filter_new(self.gather_damian_comment_ids())
+            pending = self.ledger.pending_ids() - comment_ids
+            if self.listing_complete:
+                self.settle_pending(pending)
+            else:
+                comment_ids |= pending
+            if not comment_ids:
+                self.logger.info("No Damian's comments found to delete")
+                return
+
+            self.logger.info(f"Collected {len(comment_ids)} of Damian's comments to delete")
+            self.delete_comments_with_retry(comment_ids)
+        finally:
+            self.ledger.finish_run()
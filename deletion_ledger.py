@@ -0,0 +1,149 @@
+"""
+LinkedIn Bot - Comment Deletion Ledger Module
+
+SQLite ledger of every comment the bot tried to delete: its state (found,
+deleted, failed or skipped, with reason) and timestamps, so later runs resume
+the pending ones. A comment recorded as deleted or skipped that is listed on
+the page as the author's again is reopened. Each run's throughput is recorded
+as well.
+"""
+import sqlite3
+import time
+
+from logger_setup import LoggerSetup
+
+
+DEFAULT_LEDGER_FILE = "deletion_ledger.sqlite3"
+
+FOUND = "found"
+DELETED = "deleted"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+class DeletionLedger:
+    def __init__(self, filename=DEFAULT_LEDGER_FILE):
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS comments (
+                comment_id TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                reason TEXT,
+                attempts INTEGER DEFAULT 0,
+                first_seen REAL,
+                updated_at REAL,
+                deleted_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_comments_state ON comments(state);
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY,
+                started_at REAL,
+                finished_at REAL,
+                found INTEGER DEFAULT 0,
+                deleted INTEGER DEFAULT 0,
+                failed INTEGER DEFAULT 0,
+                reopened INTEGER DEFAULT 0
+            );
+        """)
+        self.connection.commit()
+        self.run_id = None
+        self.run_started = None
+        self.counts = {"found": 0, "deleted": 0, "failed": 0, "reopened": 0}
+        self.logger = LoggerSetup.get_logger("DeletionLedger")
+
+    def start_run(self):
+        self.run_started = time.perf_counter()
+        self.counts = {"found": 0, "deleted": 0, "failed": 0, "reopened": 0}
+        cursor = self.connection.execute("INSERT INTO runs (started_at) VALUES (?)", (time.time(),))
+        self.connection.commit()
+        self.run_id = cursor.lastrowid
+        return self.run_id
+
+    def pending_ids(self):
+        """Comments found or failed in earlier runs and not deleted yet"""
+        return {row[0] for row in self.connection.execute(
+            "SELECT comment_id FROM comments WHERE state IN (?, ?)", (FOUND, FAILED)
+        )}
+
+    def filter_new(self, comment_ids):
+        """Records the IDs listed on the page and returns them all as still to delete.
+
+        A comment listed on the page exists, so one recorded as deleted (e.g.
+        inferred from a listing it was missing from) goes back to found, and so
+        does one skipped because it was listed under another author.
+        """
+        now = time.time()
+        remaining = set()
+        for comment_id in comment_ids:
+            remaining.add(comment_id)
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO comments (comment_id, state, first_seen, updated_at) VALUES (?, ?, ?, ?)",
+                (comment_id, FOUND, now, now)
+            )
+            self.counts["found"] += cursor.rowcount
+            cursor = self.connection.execute(
+                """UPDATE comments SET state = ?, reason = ?, updated_at = ?, deleted_at = NULL
+                   WHERE comment_id = ? AND state = ?""",
+                (FOUND, "listed again after deletion", now, comment_id, DELETED)
+            )
+            if cursor.rowcount:
+                self.counts["reopened"] += 1
+                self.logger.warning(f"Comment {comment_id} was recorded as deleted but is listed again - reopening it")
+            self.connection.execute(
+                "UPDATE comments SET state = ?, reason = ?, updated_at = ? WHERE comment_id = ? AND state = ?",
+                (FOUND, "listed as the author's again", now, comment_id, SKIPPED)
+            )
+        self.connection.commit()
+        return remaining
+
+    def mark_deleted(self, comment_id, reason=None):
+        """reason notes how the deletion was established, e.g. "no longer listed" """
+        now = time.time()
+        self.connection.execute(
+            """UPDATE comments SET state = ?, reason = ?, attempts = attempts + 1,
+               updated_at = ?, deleted_at = ? WHERE comment_id = ?""",
+            (DELETED, reason, now, now, comment_id)
+        )
+        self.connection.commit()
+        self.counts["deleted"] += 1
+
+    def mark_failed(self, comment_id, reason):
+        self.connection.execute(
+            "UPDATE comments SET state = ?, reason = ?, attempts = attempts + 1, updated_at = ? WHERE comment_id = ?",
+            (FAILED, reason, time.time(), comment_id)
+        )
+        self.connection.commit()
+        self.counts["failed"] += 1
+
+    def mark_skipped(self, comment_id, reason):
+        """Takes the comment out of the pending ones without deleting it"""
+        self.connection.execute(
+            "UPDATE comments SET state = ?, reason = ?, updated_at = ? WHERE comment_id = ?",
+            (SKIPPED, reason, time.time(), comment_id)
+        )
+        self.connection.commit()
+
+    def finish_run(self):
+        """Stores the run's counts and logs its deletion throughput"""
+        if self.run_id is None:
+            return
+        elapsed = time.perf_counter() - self.run_started
+        self.connection.execute(
+            "UPDATE runs SET finished_at = ?, found = ?, deleted = ?, failed = ?, reopened = ? WHERE id = ?",
+            (time.time(), self.counts["found"], self.counts["deleted"], self.counts["failed"],
+             self.counts["reopened"], self.run_id)
+        )
+        self.connection.commit()
+        per_minute = self.counts["deleted"] / elapsed * 60 if elapsed else 0
+        self.logger.info(
+            f"Deletion run {self.run_id}: {self.counts['deleted']} deleted, {self.counts['failed']} failed attempts, "
+            f"{self.counts['found']} newly found, {self.counts['reopened']} reopened, "
+            f"{len(self.pending_ids())} still pending - {elapsed:.0f}s, {per_minute:.1f} deletions/min"
+        )
+        self.run_id = None
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
@@ -0,0 +1,166 @@
+"""
+LinkedIn Bot - Incremental Export State Module
+
+Sidecar state kept next to an exported file (<output>.export_state.json)
+recording how much of the source file was exported and a hash of that part,
+so the next export can convert only the records added since.
+"""
+import hashlib
+import json
+import os
+import time
+
+from json_stream import CHUNK_SIZE, detect_format, iter_json_array
+
+
+STATE_SUFFIX = ".export_state.json"
+
+
+class ExportState:
+    def __init__(self, output_filename):
+        self.output_filename = output_filename
+        self.filename = output_filename + STATE_SUFFIX
+        self.source_format = None
+        self.record_count = 0
+        self.byte_offset = 0
+        self.prefix_hash = None
+        self.fieldnames = None
+        self.output_size = None
+
+    @classmethod
+    def load(cls, output_filename):
+        """Returns the saved state for the output file, or None"""
+        state = cls(output_filename)
+        if not os.path.exists(state.filename):
+            return None
+        try:
+            with open(state.filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        state.source_format = data.get("source_format")
+        state.record_count = data.get("record_count", 0)
+        state.byte_offset = data.get("byte_offset", 0)
+        state.prefix_hash = data.get("prefix_hash")
+        state.fieldnames = data.get("fieldnames")
+        state.output_size = data.get("output_size")
+        return state
+
+    def update(self, reader, fieldnames=None):
+        """Takes over the position reached by a DeltaReader and saves the state"""
+        self.source_format = reader.source_format
+        self.record_count = reader.record_count
+        self.byte_offset = reader.byte_offset
+        self.prefix_hash = reader.hash.hexdigest()
+        self.fieldnames = list(fieldnames) if fieldnames is not None else None
+        self.output_size = os.path.getsize(self.output_filename)
+        self.save()
+
+    def save(self):
+        """Writes the state atomically (temp file + rename)"""
+        data = {
+            "source_format": self.source_format,
+            "record_count": self.record_count,
+            "byte_offset": self.byte_offset,
+            "prefix_hash": self.prefix_hash,
+            "fieldnames": self.fieldnames,
+            "output_size": self.output_size,
+            "updated_at": time.time()
+        }
+        temp_filename = self.filename + ".tmp"
+        with open(temp_filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_filename, self.filename)
+
+
+class DeltaReader:
+    """Iterates the records of a source file that the last export did not cover.
+
+    JSON Lines sources are tracked by byte offset and a hash of the raw bytes
+    before it, so the exported part is hashed but not parsed again. JSON array
+    sources (rewritten as a whole by the writer) are tracked by record count
+    and a hash of the exported records.
+
+    Without a state, or when verify() fails, all records are returned.
+    """
+    def __init__(self, json_filename, state=None):
+        self.json_filename = json_filename
+        self.source_format = detect_format(json_filename)
+        self.state = state if state and state.source_format == self.source_format else None
+        self._reset()
+
+    def _reset(self):
+        self.hash = hashlib.sha256()
+        self.record_count = 0
+        self.byte_offset = 0
+        self._records = None
+
+    def _hash_record(self, record):
+        self.hash.update(json.dumps(record, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        self.hash.update(b"\n")
+
+    def verify(self):
+        """True when the source still starts with what was exported last time"""
+        if self.state is None or not self.state.prefix_hash:
+            return False
+
+        if self.source_format == "jsonl":
+            matched = self._hash_jsonl_prefix(self.state.byte_offset)
+        else:
+            matched = self._hash_array_prefix(self.state.record_count)
+
+        if matched and self.hash.hexdigest() == self.state.prefix_hash:
+            self.record_count = self.state.record_count
+            self.byte_offset = self.state.byte_offset
+            return True
+        self._reset()
+        return False
+
+    def _hash_jsonl_prefix(self, byte_offset):
+        if os.path.getsize(self.json_filename) < byte_offset:
+            return False
+        with open(self.json_filename, 'rb') as f:
+            remaining = byte_offset
+            while remaining:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    return False
+                self.hash.update(chunk)
+                remaining -= len(chunk)
+        return True
+
+    def _hash_array_prefix(self, record_count):
+        self._records = iter_json_array(self.json_filename)
+        for _ in range(record_count):
+            record = next(self._records, None)
+            if record is None:
+                return False
+            self._hash_record(record)
+        return True
+
+    def __iter__(self):
+        if self.source_format == "jsonl":
+            yield from self._iter_jsonl()
+            return
+
+        records = self._records or iter_json_array(self.json_filename)
+        for record in records:
+            self._hash_record(record)
+            self.record_count += 1
+            yield record
+
+    def _iter_jsonl(self):
+        with open(self.json_filename, 'rb') as f:
+            f.seek(self.byte_offset)
+            for line in f:
+                # A line without newline may still be being written - leave it for the next run
+                if not line.endswith(b"\n"):
+                    break
+                self.hash.update(line)
+                self.byte_offset += len(line)
+                line = line.strip()
+                if not line:
+                    continue
+                self.record_count += 1
+                yield json.loads(line)
@@ -1,8 +1,6 @@
 """
 LinkedIn Bot - People Search Module
 """
-import json
-import os
 import re
 import random
 import time
@@ -15,14 +13,113 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 
 from login import LoggerSetup, Utils
+from profile_sink import create_profile_sink, profile_output_filename
+from selector_cache import SelectorCache
+from lean_browsing import PageMetrics
+from network_capture import NetworkCapture
+from crawl_checkpoint import CrawlCheckpoint
+from profile_index import ProfileIndex
+from profile_parser import (
+    TITLE_KEYWORDS,
+    clean_name,
+    clean_profile_data,
+    extract_company,
+    is_ad_text,
+    parse_search_results_html,
+    profile_from_card_record,
+)
+
+# Outcomes of navigate_to_next_page
+NEXT_PAGE = "moved"
+LAST_PAGE = "last_page"
+NAVIGATION_FAILED = "error"
+
+
+# Walks every result card in a single round trip and returns the raw texts
+# the per-element path would otherwise read one WebDriver call at a time.
+# arguments: [profile selector, title selector, location selector, summary selector, title keywords]
+PROFILE_CARDS_SCRIPT = """
+const [profileSelector, titleSelector, locationSelector, summarySelector, titleKeywords] = arguments;
+const textOf = (el) => (el && el.innerText ? el.innerText : '').trim();
+const firstText = (root, selector) => {
+    if (!selector) return '';
+    try {
+        const el = root.querySelector(selector);
+        return el ? (el.innerText || '') : '';
+    } catch (e) {
+        return '';
+    }
+};
+
+let cards = [];
+if (profileSelector) {
+    try { cards = Array.from(document.querySelectorAll(profileSelector)); } catch (e) { cards = []; }
+}
+if (!cards.length) {
+    cards = Array.from(document.querySelectorAll('li')).filter(li => li.querySelector("a[href*='/in/']"));
+}
+if (!cards.length) {
+    cards = Array.from(document.querySelectorAll("ul[class*='list-style-none'] > li"));
+}
+
+return cards.map(card => {
+    let nameText = '';
+    let href = '';
+    for (const link of card.querySelectorAll("a[href*='/in/']")) {
+        const linkText = link.innerText || '';
+        const linkHref = link.href || '';
+        if (linkText && linkHref && linkHref.includes('/in/')) {
+            nameText = linkText;
+            href = linkHref;
+            break;
+        }
+    }
+
+    const titleTexts = Array.from(card.querySelectorAll('div.t-14.t-black.t-normal')).map(textOf);
+    const keywordTexts = Array.from(card.querySelectorAll('div'))
+        .filter(div => Array.from(div.childNodes).some(node =>
+            node.nodeType === Node.TEXT_NODE && titleKeywords.some(k => node.textContent.includes(k))))
+        .map(textOf);
+
+    return {
+        text: card.innerText || '',
+        has_link: !!card.querySelector("a[href*='/in/']"),
+        name_text: nameText,
+        href: href,
+        title_texts: titleTexts,
+        discovered_title_text: firstText(card, titleSelector).trim(),
+        keyword_title_texts: keywordTexts,
+        location_text: firstText(card, locationSelector).trim(),
+        summary_text: firstText(card, summarySelector)
+    };
+});
+"""
 
 
 class LinkedInPeopleSearchHandler:
-    def __init__(self, driver, search_query):
+    def __init__(self, driver, search_query, sink=None, sink_mode="jsonl", extraction_mode="script",
+                 selector_cache=None, resume=False, profile_index=None, skip_known=False):
         self.driver = driver
+        self.extraction_mode = extraction_mode
+        self.selector_cache = selector_cache or SelectorCache.shared()
+        self.selectors_from_cache = False
+        self.page_metrics = PageMetrics(driver)
+        self.network_capture = NetworkCapture(driver) if extraction_mode == "network" else None
+        self.resume = resume
+        self.checkpoint = None
+        self.page_card_count = 0
+        self.known_card_count = 0
+        # Result cards seen over the whole crawl, including skipped known ones
+        self.total_card_count = 0
+        self.current_page = None
+        self.crawl_completed = False
+        # Skipping profiles known from earlier runs is opt-in (skip_known)
+        self.profile_index = (profile_index or ProfileIndex()) if skip_known else None
         self.profiles = []
         self.search_query = search_query
-        self.json_filename = Utils.create_filename_from_query(search_query)
+        self.sink = sink
+        self.sink_mode = sink_mode
+        self.json_filename = getattr(sink, "filename", None) or profile_output_filename(search_query, sink_mode)
         self.json_initialized = False
         self.discovered_profile_selector = None
         self.discovered_title_selector = None
@@ -30,9 +127,30 @@ class LinkedInPeopleSearchHandler:
         self.discovered_summary_selector = None
         self.logger = LoggerSetup.get_logger("LinkedInPeopleSearchHandler")
 
-    def discover_selectors(self):
-        """Dynamically discovers selectors for profile elements"""
+    def discover_selectors(self, force=False):
+        """Dynamically discovers selectors for profile elements.
+        
+        Selectors discovered in earlier runs are reused from the selector cache
+        unless `force` is set or they no longer match the page.
+        """
+        if not force:
+            cached = self.selector_cache.get_discovered("people_search")
+            if cached and not self.cached_selectors_match(cached):
+                # The card fallbacks would hide a stale selector - drop it and rediscover
+                self.logger.warning(f"Cached selectors no longer match the page, rediscovering: {cached}")
+                self.selector_cache.invalidate("people_search")
+                cached = None
+            if cached:
+                self.discovered_profile_selector = cached.get("profile")
+                self.discovered_title_selector = cached.get("title")
+                self.discovered_location_selector = cached.get("location")
+                self.discovered_summary_selector = cached.get("summary")
+                self.selectors_from_cache = True
+                self.logger.info(f"Using cached selectors: {cached}")
+                return True
+        
         self.logger.info("Attempting to automatically discover selectors...")
+        self.selectors_from_cache = False
         
         try:
             # First wait for results to load
@@ -122,7 +240,13 @@ class LinkedInPeopleSearchHandler:
                         if classes:
                             self.discovered_summary_selector = f"p.{classes[0]}"
                             self.logger.info(f"Detected summary selector: {self.discovered_summary_selector}")
-                        
+                
+                self.selector_cache.set_discovered("people_search", {
+                    "profile": self.discovered_profile_selector,
+                    "title": self.discovered_title_selector,
+                    "location": self.discovered_location_selector,
+                    "summary": self.discovered_summary_selector
+                })
                 return True
             else:
                 self.logger.error("No profile elements found during selector discovery")
@@ -134,9 +258,35 @@ class LinkedInPeopleSearchHandler:
             self.logger.error(traceback.format_exc())
             return False
 
-    def find_elements_with_retry(self, strategies):
-        """Tries different strategies for finding elements"""
-        for strategy_name, by_method, selector in strategies:
+    def cached_selectors_match(self, cached):
+        """False when the cached profile selector matches nothing on a loaded results page"""
+        if not cached.get("profile"):
+            return True
+        
+        results_container = Utils.wait_and_find_element(
+            self.driver,
+            By.CSS_SELECTOR,
+            "ul[class*='list-style-none']",
+            timeout=10
+        )
+        if not results_container:
+            # Results not loaded - nothing to judge the selectors by
+            return True
+        
+        try:
+            return bool(self.driver.find_elements(By.CSS_SELECTOR, cached["profile"]))
+        except Exception as e:
+            self.logger.debug(f"Cached profile selector {cached['profile']} failed: {e}")
+            return False
+
+    def find_elements_with_retry(self, strategies, page_type=None):
+        """Tries different strategies for finding elements.
+        
+        With a page_type the strategy that won last time is tried first.
+        """
+        ordered = self.selector_cache.order(page_type, strategies, key=lambda s: s[0]) if page_type else strategies
+        for strategy in ordered:
+            strategy_name, by_method, selector = strategy
             try:
                 if not selector:
                     continue
@@ -144,10 +294,14 @@ class LinkedInPeopleSearchHandler:
                 elements = self.driver.find_elements(by_method, selector)
                 if elements and len(elements) > 0:
                     self.logger.info(f"Found elements using strategy: {strategy_name}")
+                    if page_type:
+                        self.selector_cache.record_win(page_type, strategy, strategies, key=lambda s: s[0])
                     return elements
             except Exception as e:
                 self.logger.debug(f"Failed to find elements with strategy {strategy_name}: {e}")
                 continue
+        if page_type:
+            self.selector_cache.record_failure(page_type)
         return []
 
     def extract_text_pattern(self, element_text, pattern_list, default=""):
@@ -186,11 +340,7 @@ class LinkedInPeopleSearchHandler:
                 element_href = name_element.get_attribute("href")
                 
                 if element_text and element_href and '/in/' in element_href:
-                    name_text = re.sub(r'Wyświetl profil użytkownika\s+', '', element_text)
-                    name_text = re.sub(r'[•]\s+\d+\.\s+.*$', '', name_text).strip()
-                    name_text = re.sub(r'<[^>]+>', '', name_text).strip()
-                    
-                    profile_data["name"] = name_text
+                    profile_data["name"] = clean_name(element_text)
                     profile_data["profile_url"] = element_href.split("?")[0]
                     break
             
@@ -245,29 +395,11 @@ class LinkedInPeopleSearchHandler:
                 try:
                     summary_elements = profile_element.find_elements(By.CSS_SELECTOR, self.discovered_summary_selector)
                     if summary_elements and len(summary_elements) > 0:
-                        summary_text = summary_elements[0].text
-                        
-                        # Improved regex to extract company name
-                        company_match = re.search(r'Obecnie:.*?\s+w\s+([^•\n]+)', summary_text, re.IGNORECASE)
-                        if company_match:
-                            profile_data["current_company"] = company_match.group(1).strip()
-                        else:
-                            # Alternative pattern
-                            company_match = re.search(r'Obecnie:.*?([A-Z][a-zA-Z0-9\s]+)$', summary_text)
-                            if company_match:
-                                profile_data["current_company"] = company_match.group(1).strip()
+                        profile_data["current_company"] = extract_company(summary_elements[0].text)
                 except Exception as e:
                     self.logger.debug(f"Error using discovered_summary_selector: {e}")
             
-            # Final data cleaning
-            for key in profile_data:
-                if profile_data[key]:
-                    profile_data[key] = re.sub(r'\n.*$', '', profile_data[key]).strip()
-                    profile_data[key] = re.sub(r'<[^>]+>', '', profile_data[key]).strip()
-            
-            # Final verification - make sure title isn't name
-            if profile_data["title"] == profile_data["name"]:
-                profile_data["title"] = ""
+            clean_profile_data(profile_data)
                 
             self.logger.debug(f"Extracted profile data: {profile_data}")
             
@@ -278,34 +410,165 @@ class LinkedInPeopleSearchHandler:
             
         return profile_data
 
+    def extract_profiles_with_script(self):
+        """Extracts all profile cards on the page with a single execute_script call.
+        
+        Returns None when the script fails so the caller can fall back to the
+        per-element path.
+        """
+        try:
+            records = self.driver.execute_script(
+                PROFILE_CARDS_SCRIPT,
+                self.discovered_profile_selector,
+                self.discovered_title_selector,
+                self.discovered_location_selector,
+                self.discovered_summary_selector,
+                TITLE_KEYWORDS
+            )
+        except Exception as e:
+            self.logger.warning(f"Batched card extraction failed, falling back to per-element path: {e}")
+            return None
+        
+        if not records:
+            self.logger.warning("Batched card extraction returned no cards, falling back to per-element path")
+            return None
+        
+        self.logger.info(f"Extracted {len(records)} potential profile cards in one round trip")
+        
+        profiles = []
+        for i, record in enumerate(records):
+            if is_ad_text(record.get("text")):
+                self.logger.debug(f"Skipping element {i+1}, probably an ad")
+                continue
+            
+            if not record.get("has_link"):
+                self.logger.debug(f"Skipping element {i+1}, no profile link")
+                continue
+            
+            if self.skip_known_card((record.get("href") or "").split("?")[0]):
+                continue
+            
+            profile_data = profile_from_card_record(record)
+            if profile_data["name"] or profile_data["profile_url"]:
+                profiles.append(profile_data)
+            else:
+                self.logger.debug(f"Skipping element {i+1}, couldn't extract basic profile data")
+        
+        return profiles
+
+    def extract_profiles_from_page_source(self):
+        """Extracts all profile cards by parsing page_source locally.
+        
+        Returns None when parsing is not possible so the caller can fall back
+        to the per-element path.
+        """
+        selectors = {
+            "profile": self.discovered_profile_selector,
+            "title": self.discovered_title_selector,
+            "location": self.discovered_location_selector,
+            "summary": self.discovered_summary_selector
+        }
+        
+        try:
+            profiles = parse_search_results_html(self.driver.page_source, selectors, skip_url=self.skip_known_card)
+        except Exception as e:
+            self.logger.warning(f"Offline page parsing failed, falling back to per-element path: {e}")
+            return None
+        
+        if not profiles and not self.known_card_count:
+            self.logger.warning("Offline page parsing found no profiles, falling back to per-element path")
+            return None
+        
+        self.logger.info(f"Parsed {len(profiles)} profiles from page source")
+        return profiles
+
+    def extract_profiles_from_network(self):
+        """Decodes profiles from captured search result JSON responses.
+        
+        Returns None when nothing was captured so the caller can fall back to
+        the DOM extraction paths.
+        """
+        try:
+            profiles = self.network_capture.collect_profiles(skip_url=self.skip_known_card)
+        except Exception as e:
+            self.logger.warning(f"Network capture failed, falling back to DOM extraction: {e}")
+            return None
+        
+        if not profiles and not self.known_card_count:
+            self.logger.warning("No search responses captured, falling back to DOM extraction")
+            return None
+        
+        self.logger.info(f"Decoded {len(profiles)} profiles from captured network responses")
+        return profiles
+
     def init_json_file(self):
-        """Initializes JSON file with empty array"""
+        """Opens the profile output sink"""
         if not self.json_initialized:
-            with open(self.json_filename, 'w', encoding='utf-8') as jsonfile:
-                json.dump([], jsonfile)
+            if self.sink is None:
+                # A resumed crawl continues the output of the interrupted one
+                resumed = self.checkpoint is not None and self.checkpoint.last_completed_page > 0
+                self.sink = create_profile_sink(self.search_query, mode=self.sink_mode, resume=resumed)
+                self.json_filename = self.sink.filename
+            
+            if self.profile_index and getattr(self.sink, "rewrites_output", False):
+                # The rewritten output would lose every profile skipped as known
+                self.logger.warning(
+                    f"Not skipping known profiles: {self.json_filename} is rewritten as a whole on close"
+                )
+                self.profile_index = None
             
             self.json_initialized = True
-            self.logger.info(f"Initialized JSON file: {self.json_filename}")
+            self.logger.info(f"Initialized output file: {self.json_filename}")
 
     def append_profile_to_json(self, profile):
-        """Adds a single profile to JSON file"""
+        """Adds a single profile to the output sink"""
         try:
-            # Read current data
-            profiles = []
-            if os.path.exists(self.json_filename) and os.path.getsize(self.json_filename) > 0:
-                with open(self.json_filename, 'r', encoding='utf-8') as jsonfile:
-                    profiles = json.load(jsonfile)
-            
-            # Add new profile
-            profiles.append(profile)
-            
-            # Save updated data
-            with open(self.json_filename, 'w', encoding='utf-8') as jsonfile:
-                json.dump(profiles, jsonfile, ensure_ascii=False, indent=2)
-                
-            self.logger.info(f"Added to JSON: {profile['name']} - {profile['title']}")
+            self.sink.write(profile, page=self.current_page)
+            self.logger.info(f"Added to output: {profile['name']} - {profile['title']}")
         except Exception as e:
-            self.logger.error(f"Error saving to JSON: {e}")
+            self.logger.error(f"Error saving profile: {e}")
+
+    def emit_profile(self, profile):
+        """Saves a profile unless it was already emitted by an earlier (resumed) run.
+        
+        Returns True when the profile was saved.
+        """
+        if self.checkpoint and profile["profile_url"] in self.checkpoint.seen_urls:
+            self.logger.debug(f"Skipping already collected profile: {profile['profile_url']}")
+            return False
+        
+        status = None
+        if self.profile_index and profile["profile_url"]:
+            status = self.profile_index.classify(profile)
+            if status == "known":
+                self.profile_index.record(profile, self.search_query, status)
+                self.sink.record_hit(profile["profile_url"], page=self.current_page)
+                self.logger.debug(f"Skipping profile known from earlier runs: {profile['profile_url']}")
+                return False
+        
+        self.append_profile_to_json(profile)
+        if status:
+            self.profile_index.record(profile, self.search_query, status)
+        return True
+
+    def skip_known_card(self, url):
+        """True for a card of a profile collected by earlier runs - checked before extraction"""
+        if not (self.profile_index and url and self.profile_index.contains(url)):
+            return False
+        self.profile_index.record({"profile_url": url}, self.search_query, "known")
+        self.sink.record_hit(url, page=self.current_page)
+        self.known_card_count += 1
+        self.logger.debug(f"Skipping profile known from earlier runs: {url}")
+        return True
+
+    def close_sink(self):
+        """Flushes and closes the profile output sink"""
+        if self.sink is None:
+            return
+        try:
+            self.sink.close()
+        except Exception as e:
+            self.logger.error(f"Error closing output sink: {e}")
         
     def process_search_results_page(self):
         """Processes search results page and collects profile data"""
@@ -320,10 +583,43 @@ class LinkedInPeopleSearchHandler:
         
         Utils.random_delay(2, 3)
         
+        # Bytes and load time of everything fetched for this page
+        self.page_metrics.sample(f"page {len(self.page_metrics.samples) + 1}")
+        
         # Initialize JSON file if not exists
         if not self.json_initialized:
             self.init_json_file()
         
+        profiles_found = None
+        self.known_card_count = 0
+        if self.extraction_mode == "network":
+            profiles_found = self.extract_profiles_from_network()
+            if profiles_found is None:
+                profiles_found = self.extract_profiles_with_script()
+        elif self.extraction_mode == "script":
+            profiles_found = self.extract_profiles_with_script()
+        elif self.extraction_mode == "html":
+            profiles_found = self.extract_profiles_from_page_source()
+        
+        if profiles_found is not None:
+            # Known cards skipped before extraction still count as cards on the page
+            self.page_card_count = len(profiles_found) + self.known_card_count
+            profiles_found = [profile_data for profile_data in profiles_found if self.emit_profile(profile_data)]
+            for profile_data in profiles_found:
+                self.logger.info(f"Found profile: {profile_data['name']} - {profile_data['title']}")
+            
+            # Add random page scrolling for better human simulation
+            Utils.random_scroll(self.driver)
+            
+            self.logger.info(f"Found {len(profiles_found)} profiles on page")
+            return profiles_found
+        
+        return self.process_profile_elements()
+
+    def process_profile_elements(self):
+        """Per-element extraction path - one WebDriver call per read"""
+        self.page_card_count = 0
+        
         # Find all profile elements on page
         profile_strategies = [
             ("Discovered selector", By.CSS_SELECTOR, self.discovered_profile_selector),
@@ -334,7 +630,7 @@ class LinkedInPeopleSearchHandler:
         ]
         
         # Find profile elements using different strategies
-        profile_elements = self.find_elements_with_retry(profile_strategies)
+        profile_elements = self.find_elements_with_retry(profile_strategies, "people_search:profiles")
         
         if not profile_elements or len(profile_elements) == 0:
             self.logger.error("No profile elements found on page")
@@ -351,10 +647,10 @@ class LinkedInPeopleSearchHandler:
         for i, profile_element in enumerate(profile_elements):
             try:
                 # Check if element is actually a person profile (not an ad or other element)
-                element_text = profile_element.text.lower()
+                element_text = profile_element.text
                 
                 # Skip elements that are ads or other elements, not profiles
-                if any(keyword in element_text for keyword in ["premium", "reaktywuj", "reactivate", "anuluj w dowolnym momencie"]):
+                if is_ad_text(element_text):
                     self.logger.debug(f"Skipping element {i+1}, probably an ad")
                     continue
                 
@@ -367,15 +663,22 @@ class LinkedInPeopleSearchHandler:
                 except Exception:
                     self.logger.debug(f"Skipping element {i+1}, couldn't find profile link")
                     continue
+                
+                # Skip people already collected by earlier runs before the costly extraction
+                if self.skip_known_card((profile_link.get_attribute("href") or "").split("?")[0]):
+                    self.page_card_count += 1
+                    continue
                     
                 # Extract profile data
                 profile_data = self.extract_profile_data(profile_element)
                 
                 # Add only if name and profile link were extracted
                 if profile_data["name"] or profile_data["profile_url"]:  
-                    profiles_found.append(profile_data)
+                    self.page_card_count += 1
                     # Immediately save to JSON
-                    self.append_profile_to_json(profile_data)
+                    if not self.emit_profile(profile_data):
+                        continue
+                    profiles_found.append(profile_data)
                     self.logger.info(f"Found profile: {profile_data['name']} - {profile_data['title']}")
                     
                     # Add random page scrolling for better human simulation
@@ -396,7 +699,12 @@ class LinkedInPeopleSearchHandler:
         return profiles_found
 
     def navigate_to_next_page(self):
-        """Navigates to next page of results, if available."""
+        """Navigates to next page of results, if available.
+        
+        Returns NEXT_PAGE after moving on, LAST_PAGE when the "Next" button is
+        missing or disabled and NAVIGATION_FAILED when pagination could not be
+        used.
+        """
         try:
             # First wait for pagination to load - use different selectors
             pagination_selectors = [
@@ -406,26 +714,14 @@ class LinkedInPeopleSearchHandler:
                 "//div[contains(@class, 'pagination')]"
             ]
             
-            pagination = None
-            for selector in pagination_selectors:
-                try:
-                    if selector.startswith("//"):
-                        pagination = WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.XPATH, selector))
-                        )
-                    else:
-                        pagination = WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                    
-                    if pagination:
-                        break
-                except TimeoutException:
-                    continue
+            selector, pagination = Utils.wait_for_any(
+                self.driver, pagination_selectors, timeout=10,
+                selector_cache=self.selector_cache, page_type="people_search:pagination"
+            )
             
             if not pagination:
                 self.logger.warning("Pagination not found on page")
-                return False
+                return NAVIGATION_FAILED
             
             # Scroll to pagination
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", pagination)
@@ -442,19 +738,13 @@ class LinkedInPeopleSearchHandler:
             ]
             
             next_button = None
-            for strategy_name, by_method, selector in next_button_strategies:
-                try:
-                    elements = self.driver.find_elements(by_method, selector)
-                    if elements:
-                        next_button = elements[0]
-                        self.logger.info(f"Found 'Next' button using strategy: {strategy_name}")
-                        break
-                except Exception:
-                    continue
+            next_buttons = self.find_elements_with_retry(next_button_strategies, "people_search:next_button")
+            if next_buttons:
+                next_button = next_buttons[0]
             
             if not next_button:
                 self.logger.info("'Next' button not found - reached last page")
-                return False
+                return LAST_PAGE
             
             # Check if button is disabled
             button_classes = next_button.get_attribute("class") or ""
@@ -462,7 +752,7 @@ class LinkedInPeopleSearchHandler:
             
             if "disabled" in button_classes or "artdeco-button--disabled" in button_classes or button_disabled:
                 self.logger.info("'Next' button is disabled - reached last page")
-                return False
+                return LAST_PAGE
                 
             self.logger.info("Moving to next page...")
             # First scroll to button
@@ -515,7 +805,7 @@ class LinkedInPeopleSearchHandler:
             # Add random delay with random scrolling for better simulation
             Utils.random_delay(3, 5)
             Utils.random_scroll(self.driver)
-            return True
+            return NEXT_PAGE
                 
         except Exception as e:
             self.logger.error(f"Problem navigating to next page: {str(e)}")
@@ -535,7 +825,7 @@ class LinkedInPeopleSearchHandler:
                         self.logger.info(f"Attempting direct navigation to URL: {next_url}")
                         self.driver.get(next_url)
                         Utils.random_delay(3, 5)
-                        return True
+                        return NEXT_PAGE
                 else:
                     # Add page=2 parameter to URL
                     separator = "&" if "?" in current_url else "?"
@@ -543,10 +833,10 @@ class LinkedInPeopleSearchHandler:
                     self.logger.info(f"Attempting direct navigation to URL: {next_url}")
                     self.driver.get(next_url)
                     Utils.random_delay(3, 5)
-                    return True
+                    return NEXT_PAGE
             except Exception as e2:
                 self.logger.error(f"Alternative navigation method also failed: {e2}")
-                return False
+            return NAVIGATION_FAILED
 
     def get_total_pages(self):
         """Tries to read total number of result pages"""
@@ -642,20 +932,100 @@ class LinkedInPeopleSearchHandler:
             self.logger.warning(f"Failed to read number of pages: {e}")
             return 100  # Default value if can't read
             
+    def page_url(self, url, page_number):
+        """Builds the URL of the given result page from a result page URL"""
+        if re.search(r'[?&]page=\d+', url):
+            return re.sub(r'([?&])page=\d+', rf'\g<1>page={page_number}', url)
+        separator = "&" if "?" in url else "?"
+        return f"{url}{separator}page={page_number}"
+
+    def resume_from_checkpoint(self):
+        """Jumps to the page after the last completed one of a saved crawl.
+        
+        Returns the page number to continue from, or None when there is
+        nothing to resume.
+        """
+        checkpoint = CrawlCheckpoint.load(self.search_query)
+        if not checkpoint or not checkpoint.result_url:
+            self.logger.info("No checkpoint to resume from - starting a new crawl")
+            return None
+        
+        next_page = checkpoint.last_completed_page + 1
+        self.logger.info(
+            f"Resuming '{self.search_query}' at page {next_page} "
+            f"({len(checkpoint.seen_urls)} profiles already collected)"
+        )
+        self.driver.get(self.page_url(checkpoint.result_url, next_page))
+        Utils.random_delay(2, 4)
+        
+        if "search/results/people" not in self.driver.current_url:
+            self.logger.warning(f"Checkpoint URL did not lead to search results: {self.driver.current_url}")
+            return None
+        
+        self.checkpoint = checkpoint
+        self.discover_selectors()
+        return next_page
+
     def search_and_collect_profiles(self):
         """Searches for profiles and collects data from all available pages"""
-        if not self.search_people(self.search_query):
-            self.logger.error("Failed to search for people")
-            return []
+        start_page = self.resume_from_checkpoint() if self.resume else None
+        
+        if start_page is None:
+            if not self.search_people(self.search_query):
+                self.logger.error("Failed to search for people")
+                return []
+            start_page = 1
+            self.checkpoint = CrawlCheckpoint(self.search_query)
             
+        try:
+            all_profiles = self.collect_profiles_from_all_pages(start_page)
+            # Keep the resume point unless the last results page was reached
+            if self.crawl_completed:
+                self.checkpoint.clear()
+            elif self.checkpoint.last_completed_page:
+                self.logger.warning(
+                    f"Crawl stopped after page {self.checkpoint.last_completed_page} - "
+                    f"run again with --resume to continue (checkpoint: {self.checkpoint.filename})"
+                )
+            return all_profiles
+        finally:
+            self.close_sink()
+            self.selector_cache.save()
+            self.selector_cache.log_stats()
+            self.page_metrics.log_summary()
+            if self.profile_index:
+                self.profile_index.commit()
+                self.profile_index.log_counts()
+
+    def save_checkpoint(self, current_page, page_profiles):
+        """Records the completed page once its profiles are durably written"""
+        try:
+            self.sink.flush()
+            if self.profile_index:
+                self.profile_index.commit()
+            self.checkpoint.mark_page_completed(
+                current_page,
+                self.driver.current_url,
+                [profile["profile_url"] for profile in page_profiles]
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to write checkpoint: {e}")
+
+    def collect_profiles_from_all_pages(self, start_page=1):
+        """Walks result pages starting at the current one and collects profiles"""
         all_profiles = []
-        current_page = 1
+        current_page = start_page
+        self.crawl_completed = False
         total_pages = self.get_total_pages()
         max_pages = min(total_pages, 100)  # Page limit for safety
         
         self.logger.info(f"Found a total of {total_pages} result pages (processing max {max_pages})")
+        if start_page > max_pages:
+            # Resumed past the last page - nothing left to crawl
+            self.crawl_completed = True
         
         while current_page <= max_pages:
+            self.current_page = current_page
             self.logger.info(f"Processing page {current_page} of {total_pages}")
             
             # Add random delay before processing each page
@@ -668,23 +1038,35 @@ class LinkedInPeopleSearchHandler:
             self.logger.info(f"Found {len(page_profiles)} profiles on page {current_page}")
             
             # If no profiles found on page, try again with delay
-            if len(page_profiles) == 0:
+            if self.page_card_count == 0:
                 self.logger.warning(f"No profiles found on page {current_page}, refreshing and retrying")
                 self.driver.refresh()
                 Utils.random_delay(5, 8)
                 
+                # Cached selectors may be out of date - rediscover them
+                if self.selectors_from_cache:
+                    self.discover_selectors(force=True)
+                
                 # Try again
                 page_profiles = self.process_search_results_page()
                 all_profiles.extend(page_profiles)
                 
                 # If still no results, break loop
-                if len(page_profiles) == 0:
+                if self.page_card_count == 0:
                     self.logger.error("Still no profiles after retry, ending processing")
                     break
             
+            self.total_card_count += self.page_card_count
+            self.save_checkpoint(current_page, page_profiles)
+            
             # Go to next page
             if current_page < max_pages:
-                if not self.navigate_to_next_page():
+                navigation = self.navigate_to_next_page()
+                if navigation == LAST_PAGE:
+                    # Fewer result pages than estimated - the crawl is done
+                    self.crawl_completed = True
+                    break
+                if navigation != NEXT_PAGE:
                     self.logger.info("Can't go to next page - end of processing")
                     break
                 
@@ -693,6 +1075,7 @@ class LinkedInPeopleSearchHandler:
                 # Add random delay between pages
                 Utils.random_delay(3, 7)
             else:
+                self.crawl_completed = True
                 break
                 
         self.logger.info(f"Collected data for {len(all_profiles)} profiles from {current_page} pages")
@@ -717,18 +1100,10 @@ class LinkedInPeopleSearchHandler:
             "//input[contains(@placeholder, 'Szukaj') or contains(@placeholder, 'Search')]"
         ]
         
-        search_input = None
-        for selector in search_input_selectors:
-            try:
-                if selector.startswith("//"):
-                    search_input = Utils.wait_and_find_element(self.driver, By.XPATH, selector, timeout=5)
-                else:
-                    search_input = Utils.wait_and_find_element(self.driver, By.CSS_SELECTOR, selector, timeout=5)
-                
-                if search_input:
-                    break
-            except Exception:
-                continue
+        selector, search_input = Utils.wait_for_any(
+            self.driver, search_input_selectors, timeout=10,
+            selector_cache=self.selector_cache, page_type="people_search:search_input"
+        )
         
         if not search_input:
             self.logger.error("Search field not found")
@@ -761,18 +1136,15 @@ class LinkedInPeopleSearchHandler:
                 "//button[contains(text(), 'People')]"
             ]
             
-            found_link = False
-            for selector in people_results_selectors:
-                try:
-                    people_link = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    self.driver.execute_script("arguments[0].click();", people_link)
-                    Utils.random_delay(2, 4)
-                    found_link = True
-                    break
-                except Exception:
-                    continue
+            selector, people_link = Utils.wait_for_any(
+                self.driver, people_results_selectors, timeout=10,
+                selector_cache=self.selector_cache, page_type="people_search:people_results_link"
+            )
+            
+            found_link = people_link is not None
+            if found_link:
+                self.driver.execute_script("arguments[0].click();", people_link)
+                Utils.random_delay(2, 4)
                     
             if not found_link:
                 # Check if already on people results page
@@ -0,0 +1,358 @@
+"""
+LinkedIn Bot - Job Service Module
+
+Long-running service that keeps logged-in browsers warm and runs
+find-people / delete-comments jobs submitted over localhost HTTP.
+
+python3 job_service.py [--port 8765] [--workers 1] [--lean] [--headless]
+                      [--keep-finished 1000] [--finished-ttl 86400]
+
+Endpoints:
+POST   /jobs        {"action": "find-people", "query": "Security Engineer", "sink": "sqlite"}
+GET    /jobs        all jobs
+GET    /jobs/<id>   status and result of one job
+DELETE /jobs/<id>   cancel a queued job
+GET    /health      worker and queue state
+"""
+import argparse
+import json
+import queue
+import threading
+import time
+import traceback
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from logger_setup import LoggerSetup
+from main import LinkedInCommandInvoker, build_command, create_driver, log_in
+
+
+DEFAULT_PORT = 8765
+HEALTH_CHECK_INTERVAL = 60
+# Finished jobs are kept for GET /jobs until either limit drops them
+DEFAULT_KEEP_FINISHED = 1000
+DEFAULT_FINISHED_TTL = 24 * 3600
+FINISHED_STATUSES = ("succeeded", "failed", "invalid", "cancelled")
+
+
+class Job:
+    def __init__(self, params):
+        self.id = uuid.uuid4().hex[:12]
+        self.params = params
+        self.status = "queued"
+        self.worker = None
+        self.result = None
+        self.record = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "params": self.params,
+            "status": self.status,
+            "worker": self.worker,
+            "result": self.result,
+            "record": self.record,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+
+class DriverWorker(threading.Thread):
+    """Owns one logged-in browser and runs jobs from the shared queue on it.
+
+    Each worker uses its own Chrome profile directory; a browser that stops
+    responding is replaced (and logged in again) before the next job.
+    """
+    def __init__(self, index, service):
+        super().__init__(name=f"driver-worker-{index}", daemon=True)
+        self.index = index
+        self.service = service
+        self.driver = None
+        self.invoker = None
+        self.state = "starting"
+        self.jobs_done = 0
+        self.restarts = 0
+        self.logger = LoggerSetup.get_logger(self.name)
+
+    def start_driver(self):
+        self.stop_driver()
+        self.state = "starting"
+        self.driver = create_driver(self.service.args, profile_name=f"service-{self.index}")
+        if not log_in(self.driver):
+            self.stop_driver()
+            self.state = "login failed"
+            return False
+        self.invoker = LinkedInCommandInvoker(self.driver)
+        self.state = "idle"
+        return True
+
+    def stop_driver(self):
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                self.logger.debug(f"Problem closing browser: {e}")
+        self.driver = None
+        self.invoker = None
+
+    def is_healthy(self):
+        if not self.driver:
+            return False
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Browser is not responding: {e}")
+            return False
+
+    def ensure_driver(self):
+        if self.is_healthy():
+            return True
+        if self.driver:
+            self.restarts += 1
+        try:
+            return self.start_driver()
+        except Exception as e:
+            self.logger.error(f"Could not start browser: {e}")
+            self.stop_driver()
+            self.state = "down"
+            return False
+
+    def run(self):
+        self.ensure_driver()
+        while not self.service.stopping.is_set():
+            try:
+                job = self.service.jobs_queue.get(timeout=HEALTH_CHECK_INTERVAL)
+            except queue.Empty:
+                # Keep the idle browser alive and logged in
+                self.ensure_driver()
+                continue
+            if job is None:
+                break
+            # A job cancelled while it waited in the queue is skipped
+            if not self.service.claim(job, self.name):
+                continue
+            self.run_job(job)
+        self.stop_driver()
+        self.state = "stopped"
+
+    def run_job(self, job):
+        """Runs a job claimed by this worker"""
+        if not self.ensure_driver():
+            job.status = "failed"
+            job.result = f"Browser unavailable ({self.state})"
+            job.finished_at = time.time()
+            return
+
+        self.state = "busy"
+        try:
+            command = build_command(self.driver, job.params, self.service.args)
+            job.result = self.invoker.execute_command(command)
+            job.record = self.invoker.last_record
+            job.status = job.record["status"]
+        except ValueError as e:
+            job.status = "invalid"
+            job.result = str(e)
+        except Exception as e:
+            self.logger.error(f"Job {job.id} crashed: {e}\n{traceback.format_exc()}")
+            job.status = "failed"
+            job.result = str(e)
+        finally:
+            job.finished_at = time.time()
+            self.jobs_done += 1
+            self.state = "idle"
+
+
+class JobService:
+    def __init__(self, args):
+        self.args = args
+        self.jobs = {}
+        self.jobs_lock = threading.Lock()
+        self.jobs_queue = queue.Queue()
+        self.stopping = threading.Event()
+        self.workers = [DriverWorker(index, self) for index in range(1, args.workers + 1)]
+        self.logger = LoggerSetup.get_logger("JobService")
+
+    def start(self):
+        for worker in self.workers:
+            worker.start()
+
+    def submit(self, params):
+        if not isinstance(params, dict) or not params.get("action"):
+            raise ValueError("Job must be a JSON object with an 'action'")
+        job = Job(params)
+        with self.jobs_lock:
+            self._prune_finished()
+            self.jobs[job.id] = job
+        self.jobs_queue.put(job)
+        self.logger.info(f"Queued job {job.id}: {params}")
+        return job
+
+    def get(self, job_id):
+        with self.jobs_lock:
+            return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        with self.jobs_lock:
+            self._prune_finished()
+            return [job.to_dict() for job in self.jobs.values()]
+
+    def _prune_finished(self):
+        """Forgets finished jobs past the TTL and the oldest beyond the retention limit.
+
+        Called with jobs_lock held; queued and running jobs are never dropped.
+        """
+        finished = sorted(
+            (job for job in self.jobs.values() if job.status in FINISHED_STATUSES and job.finished_at),
+            key=lambda job: job.finished_at
+        )
+        expired_before = time.time() - self.args.finished_ttl
+        excess = len(finished) - self.args.keep_finished
+        for position, job in enumerate(finished):
+            if position < excess or job.finished_at < expired_before:
+                del self.jobs[job.id]
+
+    def claim(self, job, worker_name):
+        """Moves a queued job to running; False when it was cancelled first"""
+        with self.jobs_lock:
+            if job.status != "queued":
+                return False
+            job.status = "running"
+            job.worker = worker_name
+            job.started_at = time.time()
+            return True
+
+    def cancel(self, job_id):
+        """Cancels a job that no worker has claimed yet"""
+        with self.jobs_lock:
+            job = self.jobs.get(job_id)
+            if job and job.status == "queued":
+                job.status = "cancelled"
+                job.finished_at = time.time()
+                return True
+            return False
+
+    def health(self):
+        return {
+            "queued": sum(1 for job in self.list_jobs() if job["status"] == "queued"),
+            "workers": [
+                {"name": w.name, "state": w.state, "jobs_done": w.jobs_done, "restarts": w.restarts}
+                for w in self.workers
+            ]
+        }
+
+    def stop(self):
+        self.stopping.set()
+        for _ in self.workers:
+            self.jobs_queue.put(None)
+        for worker in self.workers:
+            worker.join(timeout=30)
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    service = None
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _job_id(self):
+        parts = self.path.rstrip("/").split("/")
+        return parts[2] if len(parts) == 3 and parts[1] == "jobs" else None
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/jobs":
+            self._send(200, self.service.list_jobs())
+        elif self.path.rstrip("/") == "/health":
+            self._send(200, self.service.health())
+        elif self._job_id():
+            job = self.service.get(self._job_id())
+            if job:
+                self._send(200, job.to_dict())
+            else:
+                self._send(404, {"error": "unknown job"})
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/jobs":
+            self._send(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            job = self.service.submit(json.loads(self.rfile.read(length) or b"{}"))
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+            return
+        self._send(202, job.to_dict())
+
+    def do_DELETE(self):
+        job_id = self._job_id()
+        if job_id and self.service.cancel(job_id):
+            self._send(200, self.service.get(job_id).to_dict())
+        elif job_id and self.service.get(job_id):
+            self._send(409, {"error": "job is not queued"})
+        else:
+            self._send(404, {"error": "unknown job"})
+
+    def log_message(self, format, *args):
+        LoggerSetup.get_logger("JobService").debug(format % args)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="LinkedIn Bot job service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=1, help="number of warm, logged-in browsers")
+    parser.add_argument("--sink", default="jsonl", help="default find-people output")
+    parser.add_argument("--skip-known", action="store_true", help="default: skip profiles known from earlier runs")
+    parser.add_argument(
+        "--extraction-mode", default="script", choices=["script", "html", "network", "element"],
+        help="default find-people extraction; jobs can request network only when it is network"
+    )
+    parser.add_argument("--stream-delete", action="store_true", help="default delete-comments mode")
+    parser.add_argument("--lean", action="store_true")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument(
+        "--keep-finished", type=int, default=DEFAULT_KEEP_FINISHED,
+        help="finished/cancelled jobs kept for GET /jobs"
+    )
+    parser.add_argument(
+        "--finished-ttl", type=float, default=DEFAULT_FINISHED_TTL,
+        help="seconds a finished/cancelled job is kept"
+    )
+    args = parser.parse_args()
+    # Jobs may override it, but an always-on service starts fresh crawls by default
+    args.resume = False
+    return args
+
+
+def main():
+    args = parse_args()
+    logger = LoggerSetup.get_logger("JobService")
+    service = JobService(args)
+    service.start()
+
+    JobRequestHandler.service = service
+    server = ThreadingHTTPServer((args.host, args.port), JobRequestHandler)
+    logger.info(f"Job service listening on http://{args.host}:{args.port} with {args.workers} worker(s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down")
+    finally:
+        server.server_close()
+        service.stop()
+
+
+# --- ENTRY POINT ---
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+LinkedIn Bot - Streaming JSON Reader Module
+
+Reads profile files record by record in bounded memory, for both formats the
+bot writes: a JSON array (people search .json output) and JSON Lines (.jsonl).
+"""
+import json
+
+
+CHUNK_SIZE = 1 << 20
+WHITESPACE = " \t\r\n"
+
+
+def detect_format(filename):
+    """Returns 'array' when the file holds a JSON array, 'jsonl' otherwise"""
+    with open(filename, 'r', encoding='utf-8-sig') as f:
+        while True:
+            char = f.read(1)
+            if not char:
+                return "jsonl"
+            if char in WHITESPACE:
+                continue
+            return "array" if char == "[" else "jsonl"
+
+
+def iter_jsonl(filename):
+    with open(filename, 'r', encoding='utf-8-sig') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise json.JSONDecodeError(f"{e.msg} (line {line_number})", e.doc, e.pos) from None
+
+
+def iter_json_array(filename, chunk_size=CHUNK_SIZE):
+    """Yields the elements of a top-level JSON array without loading the whole file.
+
+    The file is read in chunks and each element is decoded with raw_decode.
+    An element counts as complete only once the separator after it has been
+    read; otherwise (e.g. the "1" of a "1e5" cut at the chunk boundary) it is
+    decoded again once more data has been read.
+    """
+    decoder = json.JSONDecoder()
+    with open(filename, 'r', encoding='utf-8-sig') as f:
+        buffer = ""
+        while True:
+            chunk = f.read(chunk_size)
+            buffer = (buffer + chunk).lstrip(WHITESPACE)
+            if buffer or not chunk:
+                break
+        if not buffer.startswith("["):
+            raise json.JSONDecodeError("Expected a JSON array", buffer, 0)
+        pos = 1
+        eof = False
+        # True after a ',' - the array may not end or hold another ',' before the next element
+        value_required = False
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+            if pos >= len(buffer):
+                if eof:
+                    raise json.JSONDecodeError("Unterminated JSON array", buffer, pos)
+                buffer = f.read(chunk_size)
+                eof = not buffer
+                pos = 0
+                continue
+            if buffer[pos] == "]":
+                if value_required:
+                    raise json.JSONDecodeError("Trailing ',' in JSON array", buffer, pos)
+                return
+            if buffer[pos] == ",":
+                raise json.JSONDecodeError("Expected an element, got ','", buffer, pos)
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                item, end = None, len(buffer)
+
+            after = end
+            while after < len(buffer) and buffer[after] in WHITESPACE:
+                after += 1
+            if after >= len(buffer) or buffer[after] not in ",]":
+                if eof:
+                    message = "Unterminated JSON array" if after >= len(buffer) else "Expected ',' or ']'"
+                    raise json.JSONDecodeError(message, buffer, after)
+                # Element may continue in the next chunk - keep only its tail
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+
+            yield item
+            if buffer[after] == "]":
+                return
+            pos = after + 1
+            value_required = True
+
+
+def iter_records(filename):
+    """Yields records of a JSON array or JSON Lines file"""
+    if detect_format(filename) == "array":
+        return iter_json_array(filename)
+    return iter_jsonl(filename)
+
+
+def union_fieldnames(filename, preferred=None):
+    """All keys used by any record, in first-seen order (preferred keys first).
+
+    Costs one extra streaming pass over the file.
+    """
+    fieldnames = dict.fromkeys(preferred or [])
+    for record in iter_records(filename):
+        if isinstance(record, dict):
+            fieldnames.update(dict.fromkeys(record))
+    return list(fieldnames)
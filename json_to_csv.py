@@ -1,43 +1,133 @@
 """
-uzycie 
-python3 json_to_csv.py <nazwa_pliku.json>
+uzycie
+python3 json_to_csv.py <nazwa_pliku.json|nazwa_pliku.jsonl> [--fields pole1,pole2,...] [--batch-size N] [--incremental]
+
+Plik jest czytany strumieniowo (tablica JSON lub JSON Lines), więc pamięć nie
+rośnie wraz z rozmiarem pliku. Bez --fields nagłówek to suma kluczy ze
+wszystkich rekordów (dodatkowy przebieg po pliku).
+
+Z --incremental stan eksportu trafia do pliku <nazwa>.csv.export_state.json,
+a kolejne uruchomienia dopisują do CSV tylko nowe rekordy.
 """
+import argparse
 import json
 import csv
 import os
-import sys
 
-def json_to_csv(json_filename):
+from export_state import DeltaReader, ExportState
+from json_stream import iter_records, union_fieldnames
+
+DEFAULT_BATCH_SIZE = 1000
+WRITE_BUFFER_SIZE = 1 << 20
+
+def _write_batches(writer, records, batch_size):
+    """Zapisuje rekordy partiami i zwraca liczbę wierszy"""
+    row_count = 0
+    batch = []
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        batch.append(record)
+        if len(batch) >= batch_size:
+            writer.writerows(batch)
+            row_count += len(batch)
+            batch = []
+    writer.writerows(batch)
+    return row_count + len(batch)
+
+class _NewColumns(Exception):
+    """Rekord z kluczem spoza nagłówka istniejącego CSV"""
+
+def _check_columns(records, fieldnames):
+    """Przepuszcza rekordy, przerywając na pierwszym z nową kolumną"""
+    known = set(fieldnames)
+    for record in records:
+        if isinstance(record, dict) and not known.issuperset(record):
+            raise _NewColumns(", ".join(key for key in record if key not in known))
+        yield record
+
+def _can_append(csv_filename, state, fieldnames):
+    """Dopisywanie ma sens tylko do nienaruszonego CSV z tym samym nagłówkiem"""
+    if state is None or not state.fieldnames or not os.path.exists(csv_filename):
+        return False
+    if fieldnames is not None and list(fieldnames) != state.fieldnames:
+        return False
+    # CSV mniejszy niż po ostatnim eksporcie = zmieniony ręcznie
+    return os.path.getsize(csv_filename) >= (state.output_size or 0)
+
+def json_to_csv(json_filename, fieldnames=None, batch_size=DEFAULT_BATCH_SIZE, incremental=False):
+    """Konwertuje plik JSON/JSONL do CSV i zwraca liczbę zapisanych wierszy (None przy błędzie).
+
+    incremental=True dopisuje tylko rekordy dodane od poprzedniego eksportu
+    (zwracana jest wtedy liczba dopisanych wierszy). Gdy nagłówek nie jest
+    podany, a nowe rekordy mają kolumny spoza nagłówka CSV, plik jest
+    budowany od nowa.
+    """
     # Sprawdź czy plik istnieje
     if not os.path.exists(json_filename):
         print(f"❌ Plik '{json_filename}' nie istnieje.")
-        return
+        return None
 
     # Wygeneruj nazwę pliku CSV
     base_name = os.path.splitext(json_filename)[0]
     csv_filename = base_name + '.csv'
 
-    # Wczytaj dane z pliku JSON
+    state = (ExportState.load(csv_filename) or ExportState(csv_filename)) if incremental else None
+
     try:
-        with open(json_filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        reader = DeltaReader(json_filename, state) if incremental else None
+        if incremental and _can_append(csv_filename, state, fieldnames) and reader.verify():
+            # Obetnij ewentualnie przerwane dopisywanie z poprzedniego uruchomienia
+            with open(csv_filename, 'r+b') as f:
+                f.truncate(state.output_size)
+            # Przy stałym nagłówku (--fields) nadmiarowe klucze są celowo pomijane
+            records = reader if fieldnames is not None else _check_columns(reader, state.fieldnames)
+            try:
+                with open(csv_filename, 'a', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                    writer = csv.DictWriter(f, fieldnames=state.fieldnames, extrasaction='ignore')
+                    row_count = _write_batches(writer, records, batch_size)
+            except _NewColumns as e:
+                # Nagłówka nie da się zmienić przez dopisywanie - pełna przebudowa
+                print(f"⚠️ Nowe kolumny w danych ({e}), CSV zostanie zbudowany od nowa.")
+                reader = DeltaReader(json_filename)
+            else:
+                state.update(reader, state.fieldnames)
+                print(f"✅ Dopisano {row_count} nowych wierszy do pliku: {csv_filename}")
+                return row_count
+
+        # Nagłówek: podany na sztywno albo suma kluczy wszystkich rekordów
+        if fieldnames is None:
+            fieldnames = union_fieldnames(json_filename)
+        if not fieldnames:
+            print("⚠️ Plik JSON jest pusty lub ma niepoprawną strukturę.")
+            return None
+
+        # Zapisz do pliku CSV partiami (plik tymczasowy podmieniany na końcu)
+        temp_filename = csv_filename + '.tmp'
+        with open(temp_filename, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+            row_count = _write_batches(writer, reader if incremental else iter_records(json_filename), batch_size)
+        os.replace(temp_filename, csv_filename)
+        if incremental:
+            state.update(reader, fieldnames)
     except json.JSONDecodeError as e:
         print(f"❌ Błąd wczytywania JSON: {e}")
-        return
+        if os.path.exists(csv_filename + '.tmp'):
+            os.remove(csv_filename + '.tmp')
+        return None
 
-    # Zapisz do pliku CSV
-    if isinstance(data, list) and data:
-        with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
-        print(f"✅ Zapisano do pliku: {csv_filename}")
-    else:
-        print("⚠️ Plik JSON jest pusty lub ma niepoprawną strukturę.")
+    print(f"✅ Zapisano {row_count} wierszy do pliku: {csv_filename}")
+    return row_count
 
 # --- ENTRY POINT ---
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Użycie: python json_to_csv.py <nazwa_pliku.json>")
-    else:
-        json_to_csv(sys.argv[1])
+    parser = argparse.ArgumentParser(description="Konwersja JSON/JSONL do CSV")
+    parser.add_argument("json_filename", help="plik .json (tablica) lub .jsonl")
+    parser.add_argument("--fields", help="stały nagłówek, np. name,title,location")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--incremental", action="store_true", help="dopisz tylko rekordy dodane od ostatniego eksportu")
+    args = parser.parse_args()
+
+    fields = args.fields.split(",") if args.fields else None
+    json_to_csv(args.json_filename, fieldnames=fields, batch_size=args.batch_size, incremental=args.incremental)
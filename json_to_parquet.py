@@ -0,0 +1,100 @@
+"""
+uzycie
+python3 json_to_parquet.py <nazwa_pliku.json|nazwa_pliku.jsonl> [--query "zapytanie"] [--compression zstd] [--batch-size N]
+
+Zapisuje kolumny FIELD_ORDER oraz metadane (zapytanie, czas zebrania danych)
+do skompresowanego pliku Parquet ze słownikowym kodowaniem kolumn tekstowych.
+Dane są przetwarzane strumieniowo, partiami rekordów.
+"""
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from json_stream import iter_records
+from json_to_xml import FIELD_ORDER
+
+DEFAULT_BATCH_SIZE = 50000
+DEFAULT_COMPRESSION = 'zstd'
+FILENAME_SUFFIX = '_linkedin_profiles'
+
+SCHEMA = pa.schema(
+    [pa.field(field, pa.string()) for field in FIELD_ORDER] + [
+        pa.field('query', pa.string()),
+        pa.field('collected_at', pa.timestamp('s', tz='UTC')),
+    ]
+)
+
+def query_from_filename(json_filename):
+    """Odtwarza zapytanie z nazwy pliku <zapytanie>_linkedin_profiles.json"""
+    base_name = os.path.splitext(os.path.basename(json_filename))[0]
+    if base_name.endswith(FILENAME_SUFFIX):
+        base_name = base_name[:-len(FILENAME_SUFFIX)]
+    return base_name.replace('_', ' ')
+
+def _record_batch(records, query, collected_at):
+    columns = [[item.get(field) for item in records] for field in FIELD_ORDER]
+    columns.append([query] * len(records))
+    columns.append([collected_at] * len(records))
+    return pa.RecordBatch.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, SCHEMA)],
+        schema=SCHEMA
+    )
+
+def json_to_parquet(json_filename, query=None, compression=DEFAULT_COMPRESSION, batch_size=DEFAULT_BATCH_SIZE):
+    """Konwertuje plik JSON/JSONL do Parquet i zwraca liczbę zapisanych wierszy (None przy błędzie)"""
+    if not os.path.exists(json_filename):
+        print(f"❌ Plik '{json_filename}' nie istnieje.")
+        return None
+
+    base_name = os.path.splitext(json_filename)[0]
+    parquet_filename = base_name + '.parquet'
+    temp_filename = parquet_filename + '.tmp'
+
+    query = query or query_from_filename(json_filename)
+    # Czas zebrania danych = ostatnia modyfikacja pliku wejściowego
+    collected_at = datetime.fromtimestamp(os.path.getmtime(json_filename), tz=timezone.utc)
+    schema = SCHEMA.with_metadata({
+        'query': query,
+        'collected_at': collected_at.isoformat(),
+        'source_file': os.path.basename(json_filename),
+    })
+
+    row_count = 0
+    try:
+        with pq.ParquetWriter(temp_filename, schema, compression=compression, use_dictionary=True) as writer:
+            batch = []
+            for item in iter_records(json_filename):
+                if not isinstance(item, dict):
+                    continue
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    writer.write_batch(_record_batch(batch, query, collected_at))
+                    row_count += len(batch)
+                    batch = []
+            if batch:
+                writer.write_batch(_record_batch(batch, query, collected_at))
+                row_count += len(batch)
+        os.replace(temp_filename, parquet_filename)
+    except json.JSONDecodeError as e:
+        print(f"❌ Błąd wczytywania JSON: {e}")
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        return None
+
+    print(f"✅ Zapisano {row_count} wierszy do pliku: {parquet_filename}")
+    return row_count
+
+# --- ENTRY POINT ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Konwersja JSON/JSONL do Parquet")
+    parser.add_argument("json_filename", help="plik .json (tablica) lub .jsonl")
+    parser.add_argument("--query", help="zapytanie zapisywane w metadanych (domyślnie z nazwy pliku)")
+    parser.add_argument("--compression", default=DEFAULT_COMPRESSION)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    json_to_parquet(args.json_filename, query=args.query, compression=args.compression, batch_size=args.batch_size)
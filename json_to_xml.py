@@ -1,50 +1,232 @@
+"""
+uzycie
+python3 json_to_xml.py <nazwa_pliku.json|nazwa_pliku.jsonl> [--in-memory] [--incremental]
+
+Domyślnie plik wejściowy jest czytany strumieniowo, a XLSX zapisywany przez
+skoroszyt openpyxl w trybie write-only. Po przekroczeniu limitu wierszy
+Excela dane przechodzą do kolejnego arkusza (Data, Data 2, ...).
+
+Z --incremental stan eksportu trafia do pliku <nazwa>.xlsx.export_state.json,
+a rekordy dodane od ostatniego eksportu lądują w nowym arkuszu
+("Nowe <data>"). Nowy arkusz jest dopisywany do archiwum XLSX bez wczytywania
+skoroszytu - istniejące arkusze są tylko kopiowane strumieniowo (koszt
+kopiowania nadal rośnie z rozmiarem pliku, ale bez parsowania XML i bez
+trzymania skoroszytu w pamięci).
+"""
+import argparse
+import itertools
 import json
 import os
-import sys
+import re
+import shutil
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from xml.sax.saxutils import quoteattr
 from openpyxl import Workbook
 
+from export_state import DeltaReader, ExportState
+from json_stream import iter_records
+
 # Zaktualizowana kolejność kolumn - dodano 'title'
 FIELD_ORDER = ['name', 'title', 'current_company', 'location', 'profile_url']
 
-def json_to_xlsx(json_filename):
+# Limit wierszy arkusza Excela (łącznie z nagłówkiem)
+EXCEL_MAX_ROWS = 1048576
+
+# Części pakietu XLSX zmieniane przy dopisywaniu arkusza
+WORKBOOK_PART = 'xl/workbook.xml'
+WORKBOOK_RELS_PART = 'xl/_rels/workbook.xml.rels'
+CONTENT_TYPES_PART = '[Content_Types].xml'
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+WORKSHEET_REL_TYPE = REL_NS + '/worksheet'
+WORKSHEET_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml'
+COPY_CHUNK_SIZE = 1 << 20
+
+def _sheet_title(index, prefix='Data'):
+    return prefix if index == 1 else f'{prefix} {index}'
+
+def _write_rows(wb, records, max_rows, first_sheet=None, title_prefix='Data'):
+    """Zapisuje rekordy w kolejnych arkuszach po max_rows wierszy; zwraca liczbę wierszy"""
+    rows_per_sheet = max_rows - 1
+    sheet_index = 1
+    ws = first_sheet or wb.create_sheet()
+    ws.title = _sheet_title(sheet_index, title_prefix)
+    ws.append(FIELD_ORDER)
+    sheet_rows = 0
+    row_count = 0
+
+    for item in records:
+        if not isinstance(item, dict):
+            continue
+        if sheet_rows >= rows_per_sheet:
+            sheet_index += 1
+            ws = wb.create_sheet(_sheet_title(sheet_index, title_prefix))
+            ws.append(FIELD_ORDER)
+            sheet_rows = 0
+        ws.append([item.get(field, "") for field in FIELD_ORDER])
+        sheet_rows += 1
+        row_count += 1
+
+    return row_count
+
+def _delta_sheet_prefix(sheetnames):
+    """Unikalna nazwa arkusza z nowymi rekordami (limit Excela: 31 znaków)"""
+    prefix = f"Nowe {datetime.now():%Y-%m-%d %H.%M}"
+    candidate = prefix
+    counter = 1
+    while any(name == candidate or name.startswith(candidate + ' ') for name in sheetnames):
+        counter += 1
+        candidate = f"{prefix}-{counter}"
+    return candidate
+
+def _sheet_parts(package):
+    """Lista (nazwa arkusza, ścieżka części w archiwum) w kolejności skoroszytu"""
+    workbook = ET.fromstring(package.read(WORKBOOK_PART))
+    rels = ET.fromstring(package.read(WORKBOOK_RELS_PART))
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels}
+    parts = []
+    for sheet in workbook.iter(f'{{{MAIN_NS}}}sheet'):
+        target = targets[sheet.get(f'{{{REL_NS}}}id')]
+        part = target.lstrip('/') if target.startswith('/') else 'xl/' + target
+        parts.append((sheet.get('name'), part))
+    return parts
+
+def _copy_entry(source, info, target, data=None, name=None):
+    """Kopiuje wpis archiwum strumieniowo (albo zapisuje w nim podane dane)"""
+    new_info = zipfile.ZipInfo(name or info.filename, date_time=info.date_time)
+    new_info.compress_type = info.compress_type
+    new_info.external_attr = info.external_attr
+    if data is not None:
+        target.writestr(new_info, data)
+        return
+    new_info.file_size = info.file_size
+    with source.open(info) as src, target.open(new_info, 'w') as dst:
+        shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
+def _merge_sheets(xlsx_filename, delta_filename):
+    """Dopisuje arkusze skoroszytu delta_filename na końcu xlsx_filename.
+
+    Zmieniane są tylko workbook.xml, jego relacje i [Content_Types].xml;
+    pozostałe części są kopiowane bez parsowania.
+    """
+    temp_filename = xlsx_filename + '.tmp'
+    with zipfile.ZipFile(delta_filename) as delta, zipfile.ZipFile(xlsx_filename) as source:
+        workbook_xml = source.read(WORKBOOK_PART).decode('utf-8')
+        rels_xml = source.read(WORKBOOK_RELS_PART).decode('utf-8')
+        types_xml = source.read(CONTENT_TYPES_PART).decode('utf-8')
+        part_names = set(source.namelist())
+
+        sheet_id = max((int(i) for i in re.findall(r'\bsheetId="(\d+)"', workbook_xml)), default=0)
+        rel_id = max((int(i) for i in re.findall(r'\bId="rId(\d+)"', rels_xml)), default=0)
+        sheets, relationships, overrides, added = [], [], [], []
+        number = 1
+        for title, delta_part in _sheet_parts(delta):
+            while f'xl/worksheets/sheet{number}.xml' in part_names:
+                number += 1
+            part = f'xl/worksheets/sheet{number}.xml'
+            part_names.add(part)
+            sheet_id += 1
+            rel_id += 1
+            sheets.append(f'<sheet xmlns:r="{REL_NS}" name={quoteattr(title)} sheetId="{sheet_id}" r:id="rId{rel_id}"/>')
+            relationships.append(f'<Relationship Type="{WORKSHEET_REL_TYPE}" Target="/{part}" Id="rId{rel_id}"/>')
+            overrides.append(f'<Override PartName="/{part}" ContentType="{WORKSHEET_CONTENT_TYPE}"/>')
+            added.append((part, delta_part))
+
+        changed = {
+            WORKBOOK_PART: workbook_xml.replace('</sheets>', ''.join(sheets) + '</sheets>', 1),
+            WORKBOOK_RELS_PART: rels_xml.replace('</Relationships>', ''.join(relationships) + '</Relationships>', 1),
+            CONTENT_TYPES_PART: types_xml.replace('</Types>', ''.join(overrides) + '</Types>', 1),
+        }
+        with zipfile.ZipFile(temp_filename, 'w', zipfile.ZIP_DEFLATED) as target:
+            for info in source.infolist():
+                _copy_entry(source, info, target, changed.get(info.filename))
+            for part, delta_part in added:
+                _copy_entry(delta, delta.getinfo(delta_part), target, name=part)
+    os.replace(temp_filename, xlsx_filename)
+
+def _append_delta_sheet(xlsx_filename, reader, max_rows):
+    """Dopisuje nowe rekordy jako nowy arkusz istniejącego pliku; zwraca liczbę wierszy.
+
+    Nowe wiersze są zapisywane skoroszytem write-only do pliku pomocniczego,
+    a jego arkusze dołączane do archiwum XLSX - bez load_workbook, więc
+    pamięć i parsowanie zależą od liczby nowych rekordów, nie od rozmiaru pliku.
+    """
+    records = iter(reader)
+    first = next(records, None)
+    if first is None:
+        return 0
+
+    with zipfile.ZipFile(xlsx_filename) as package:
+        sheetnames = [title for title, _ in _sheet_parts(package)]
+
+    delta_filename = xlsx_filename + '.delta.tmp'
+    wb = Workbook(write_only=True)
+    row_count = _write_rows(wb, itertools.chain([first], records), max_rows,
+                            title_prefix=_delta_sheet_prefix(sheetnames))
+    wb.save(delta_filename)
+    try:
+        _merge_sheets(xlsx_filename, delta_filename)
+    finally:
+        os.remove(delta_filename)
+    return row_count
+
+def json_to_xlsx(json_filename, streaming=True, max_rows=EXCEL_MAX_ROWS, incremental=False):
+    """Konwertuje plik JSON/JSONL do XLSX i zwraca liczbę zapisanych wierszy (None przy błędzie).
+
+    streaming=False to dotychczasowa ścieżka: cały JSON i cały skoroszyt w pamięci.
+    incremental=True (tylko w trybie strumieniowym) dodaje rekordy nowe od
+    poprzedniego eksportu jako osobny arkusz i zwraca ich liczbę.
+    """
     if not os.path.exists(json_filename):
         print(f"❌ Plik '{json_filename}' nie istnieje.")
-        return
+        return None
 
     base_name = os.path.splitext(json_filename)[0]
     xlsx_filename = base_name + '.xlsx'
 
-    # Wczytanie danych JSON
+    incremental = incremental and streaming
+    state = (ExportState.load(xlsx_filename) or ExportState(xlsx_filename)) if incremental else None
+
     try:
-        with open(json_filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        reader = DeltaReader(json_filename, state) if incremental else None
+        if (incremental and os.path.exists(xlsx_filename)
+                and os.path.getsize(xlsx_filename) == state.output_size and reader.verify()):
+            row_count = _append_delta_sheet(xlsx_filename, reader, max_rows)
+            state.update(reader)
+            print(f"✅ Dodano {row_count} nowych wierszy do pliku: {xlsx_filename}")
+            return row_count
+
+        if streaming:
+            # Skoroszyt write-only: wiersze trafiają od razu do pliku tymczasowego
+            wb = Workbook(write_only=True)
+            row_count = _write_rows(wb, reader if incremental else iter_records(json_filename), max_rows)
+        else:
+            # Wczytanie danych JSON
+            with open(json_filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, list):
+                print("❌ Nieprawidłowa struktura JSON – oczekiwana lista obiektów.")
+                return None
+            wb = Workbook()
+            row_count = _write_rows(wb, data, max_rows, first_sheet=wb.active)
     except json.JSONDecodeError as e:
         print(f"❌ Błąd wczytywania JSON: {e}")
-        return
-
-    if not isinstance(data, list):
-        print("❌ Nieprawidłowa struktura JSON – oczekiwana lista obiektów.")
-        return
-
-    # Tworzenie pliku Excel
-    wb = Workbook()
-    ws = wb.active
-    ws.title = 'Data'
-
-    # Nagłówki
-    ws.append(FIELD_ORDER)
-
-    # Wiersze danych
-    for item in data:
-        row = [item.get(field, "") for field in FIELD_ORDER]
-        ws.append(row)
+        return None
 
     wb.save(xlsx_filename)
-    print(f"✅ Zapisano do pliku: {xlsx_filename}")
+    if incremental:
+        state.update(reader)
+    print(f"✅ Zapisano {row_count} wierszy do pliku: {xlsx_filename}")
+    return row_count
 
 # --- ENTRY POINT ---
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Użycie: python json_to_xlsx.py <nazwa_pliku.json>")
-    else:
-        json_to_xlsx(sys.argv[1])
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Konwersja JSON/JSONL do XLSX")
+    parser.add_argument("json_filename", help="plik .json (tablica) lub .jsonl")
+    parser.add_argument("--in-memory", action="store_true", help="dotychczasowy tryb bez strumieniowania")
+    parser.add_argument("--incremental", action="store_true", help="dodaj tylko rekordy nowe od ostatniego eksportu")
+    args = parser.parse_args()
+
+    json_to_xlsx(args.json_filename, streaming=not args.in_memory, incremental=args.incremental)
@@ -0,0 +1,122 @@
+"""
+LinkedIn Bot - Lean Browsing Module
+
+Request blocking for the "lean" DriverFactory profile and per-page transfer
+metrics used to measure its effect.
+"""
+from logger_setup import LoggerSetup
+
+
+# URL patterns (Network.setBlockedURLs wildcard syntax) per blockable resource type
+RESOURCE_TYPE_URL_PATTERNS = {
+    "image": [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*media.licdn.com/dms/image/*"
+    ],
+    "media": ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*dms.licdn.com/playlist/*"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf"],
+    "tracking": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*px.ads.linkedin.com*", "*snap.licdn.com/li.lms-analytics*", "*linkedin.com/li/track*"
+    ],
+}
+
+LEAN_BLOCKED_RESOURCE_TYPES = ["image", "media", "font", "tracking"]
+
+# Collects transfer stats of everything loaded since the previous call and
+# resets the resource timing buffer. Cross-origin responses without
+# Timing-Allow-Origin report a transfer size of 0, so bytes are a lower bound.
+PAGE_METRICS_SCRIPT = """
+let state = window.__botPageMetrics;
+if (!state) {
+    state = window.__botPageMetrics = {navigationCounted: false};
+    performance.setResourceTimingBufferSize(5000);
+}
+const entries = performance.getEntriesByType('resource').slice();
+const navigation = performance.getEntriesByType('navigation')[0];
+if (navigation && !state.navigationCounted) {
+    entries.push(navigation);
+    state.navigationCounted = true;
+}
+let transferBytes = 0;
+let decodedBytes = 0;
+let start = null;
+let end = 0;
+for (const entry of entries) {
+    transferBytes += entry.transferSize || 0;
+    decodedBytes += entry.decodedBodySize || 0;
+    start = start === null ? entry.startTime : Math.min(start, entry.startTime);
+    end = Math.max(end, entry.responseEnd || 0);
+}
+performance.clearResourceTimings();
+return {
+    requests: entries.length,
+    transfer_bytes: transferBytes,
+    decoded_bytes: decodedBytes,
+    load_ms: start === null ? 0 : Math.round(end - start),
+    dom_nodes: document.getElementsByTagName('*').length
+};
+"""
+
+
+def blocked_url_patterns(resource_types=None, extra_patterns=None):
+    """URL patterns to block for the given resource types plus custom patterns"""
+    patterns = []
+    for resource_type in resource_types or []:
+        patterns.extend(RESOURCE_TYPE_URL_PATTERNS.get(resource_type, []))
+    patterns.extend(extra_patterns or [])
+    return patterns
+
+
+def apply_request_blocking(driver, patterns):
+    """Blocks matching requests through the DevTools Network domain"""
+    if not patterns:
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    LoggerSetup.get_logger("LeanBrowsing").info(f"Blocking {len(patterns)} URL patterns")
+
+
+class PageMetrics:
+    """Per-page transfer size and load time, sampled via the Resource Timing API"""
+    def __init__(self, driver):
+        self.driver = driver
+        self.samples = []
+        self.logger = LoggerSetup.get_logger("PageMetrics")
+
+    def sample(self, label=""):
+        try:
+            metrics = self.driver.execute_script(PAGE_METRICS_SCRIPT)
+        except Exception as e:
+            self.logger.debug(f"Failed to sample page metrics: {e}")
+            return None
+
+        metrics["label"] = label
+        self.samples.append(metrics)
+        self.logger.info(
+            f"Page metrics {label}: {metrics['transfer_bytes'] / 1024:.0f} KiB transferred "
+            f"({metrics['decoded_bytes'] / 1024:.0f} KiB decoded) in {metrics['requests']} requests, "
+            f"{metrics['load_ms']} ms, {metrics['dom_nodes']} DOM nodes"
+        )
+        return metrics
+
+    def summary(self):
+        if not self.samples:
+            return {}
+        pages = len(self.samples)
+        return {
+            "pages": pages,
+            "transfer_bytes": sum(m["transfer_bytes"] for m in self.samples),
+            "avg_transfer_bytes": sum(m["transfer_bytes"] for m in self.samples) / pages,
+            "avg_load_ms": sum(m["load_ms"] for m in self.samples) / pages,
+            "requests": sum(m["requests"] for m in self.samples),
+        }
+
+    def log_summary(self):
+        summary = self.summary()
+        if summary:
+            self.logger.info(
+                f"Page metrics over {summary['pages']} pages: "
+                f"{summary['transfer_bytes'] / 1024 / 1024:.1f} MiB total, "
+                f"{summary['avg_transfer_bytes'] / 1024:.0f} KiB and {summary['avg_load_ms']:.0f} ms per page"
+            )
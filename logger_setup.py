@@ -0,0 +1,16 @@
+"""
+LinkedIn Bot - Logger Setup Module
+"""
+import logging
+
+
+# Logger setup
+class LoggerSetup:
+    @staticmethod
+    def get_logger(name):
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        return logging.getLogger(name)
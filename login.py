@@ -1,40 +1,70 @@
 """
 LinkedIn Bot - Login and Utilities Module
 """
+import json
+import os
 import time
 import random
 import re
-import logging
 from typing import List, Set, Dict, Tuple, Optional
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     StaleElementReferenceException,
+    JavascriptException,
     NoSuchElementException,
     TimeoutException,
+    SessionNotCreatedException,
 )
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.options import Options
 
+from logger_setup import LoggerSetup  # re-exported: modules import it from login
+from selector_cache import SelectorCache
+from lean_browsing import LEAN_BLOCKED_RESOURCE_TYPES, apply_request_blocking, blocked_url_patterns
+
 
 # Configuration
 
 
-# Logger setup
-class LoggerSetup:
-    @staticmethod
-    def get_logger(name):
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        return logging.getLogger(name)
+# Local state used by DriverFactory
+CHROMEDRIVER_CACHE_FILE = "chromedriver_path.json"
+CHROME_PROFILES_DIR = "chrome_profiles"
+LAUNCH_METRICS_FILE = "launch_metrics.jsonl"
+# The launch summary averages only the tail of the metrics file
+LAUNCH_HISTORY_BYTES = 64 * 1024
+
+
+# Evaluates every candidate selector in one round trip and returns the index
+# and element of the first match (in list order), or null.
+# arguments: [selectors, clickable, root element or null]
+ANY_SELECTOR_SCRIPT = """
+const [selectors, clickable, root] = arguments;
+const scope = root || document;
+const usable = (el) => {
+    if (!clickable) return true;
+    return el.getClientRects().length > 0 && !el.disabled && getComputedStyle(el).visibility !== 'hidden';
+};
+for (let i = 0; i < selectors.length; i++) {
+    const selector = selectors[i];
+    let el = null;
+    try {
+        if (selector.startsWith('/') || selector.startsWith('(') || selector.startsWith('./')) {
+            el = document.evaluate(selector, scope, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        } else {
+            el = scope.querySelector(selector);
+        }
+    } catch (e) {
+        continue;
+    }
+    if (el && usable(el)) return [i, el];
+}
+return null;
+"""
 
 
 # Utility functions
@@ -64,16 +94,135 @@ class Utils:
             return None
 
     @staticmethod
-    def create_filename_from_query(query):
-        """Creates a JSON filename based on the search query"""
+    def wait_for_any(driver, selectors, timeout=10, clickable=False, root=None,
+                     selector_cache=None, page_type=None, poll_frequency=0.25):
+        """Waits for the first of several CSS/XPath selectors to match.
+        
+        All candidates are probed in a single execute_script per poll under one
+        overall deadline, instead of one WebDriverWait per selector. Selectors
+        starting with '/' or '(' are treated as XPath. With a selector cache and
+        page_type the proven winner is probed first and the match is recorded.
+        
+        Returns (selector, element) or (None, None) on timeout.
+        """
+        ordered = selector_cache.order(page_type, selectors) if selector_cache and page_type else list(selectors)
+        
+        try:
+            # The probe script can hit detached nodes while the page re-renders - poll again
+            wait = WebDriverWait(
+                driver, timeout, poll_frequency=poll_frequency,
+                ignored_exceptions=(StaleElementReferenceException, JavascriptException)
+            )
+            index, element = wait.until(
+                lambda d: d.execute_script(ANY_SELECTOR_SCRIPT, ordered, clickable, root)
+            )
+        except TimeoutException:
+            logger = LoggerSetup.get_logger("Utils")
+            logger.debug(f"None of {len(ordered)} selectors matched within {timeout}s: {ordered}")
+            if selector_cache and page_type:
+                selector_cache.record_failure(page_type)
+            return None, None
+        
+        selector = ordered[index]
+        if selector_cache and page_type:
+            selector_cache.record_win(page_type, selector, selectors)
+        return selector, element
+
+    @staticmethod
+    def create_filename_from_query(query, extension="json"):
+        """Creates an output filename based on the search query"""
         clean_query = re.sub(r'[^\w\s-]', '', query.lower()).strip().replace(' ', '_')
-        return f"{clean_query}_linkedin_profiles.json"
+        return f"{clean_query}_linkedin_profiles.{extension}"
 
 
 # Driver factory
 class DriverFactory:
+    # None disables writing the metrics file (e.g. in worker processes that report to a parent)
+    launch_metrics_file = LAUNCH_METRICS_FILE
+
+    @staticmethod
+    def resolve_chromedriver_path(pin_driver=False, refresh=False):
+        """Returns (chromedriver path, cache hit).
+        
+        With pin_driver the path resolved by ChromeDriverManager is kept in a
+        local cache file and reused while the binary still exists, skipping
+        version resolution and downloads on later launches. refresh ignores
+        the cached path and pins a freshly resolved one.
+        """
+        if pin_driver and not refresh and os.path.exists(CHROMEDRIVER_CACHE_FILE):
+            try:
+                with open(CHROMEDRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    cached_path = json.load(f).get("path")
+                if cached_path and os.access(cached_path, os.X_OK):
+                    return cached_path, True
+            except (OSError, ValueError):
+                pass
+        
+        path = ChromeDriverManager().install()
+        if pin_driver:
+            with open(CHROMEDRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({"path": path, "resolved_at": time.time()}, f)
+        return path, False
+
+    @staticmethod
+    def record_launch_metrics(metrics):
+        """Appends launch timings to the metrics file and logs recent cold vs warm averages"""
+        logger = LoggerSetup.get_logger("DriverFactory")
+        logger.info(
+            f"Chrome launched ({metrics['start_type']} start) in {metrics['total_seconds']:.2f}s: "
+            f"driver resolution {metrics['resolve_seconds']:.2f}s, browser start {metrics['browser_start_seconds']:.2f}s"
+        )
+        
+        metrics_file = DriverFactory.launch_metrics_file
+        if not metrics_file:
+            return
+        
+        try:
+            with open(metrics_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(metrics) + "\n")
+            
+            totals = {}
+            for entry in DriverFactory.recent_launch_metrics(metrics_file):
+                totals.setdefault(entry["start_type"], []).append(entry["total_seconds"])
+            summary = ", ".join(
+                f"{start_type}: {sum(values) / len(values):.2f}s avg over {len(values)}"
+                for start_type, values in sorted(totals.items())
+            )
+            logger.info(f"Recent launches - {summary}")
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Failed to record launch metrics: {e}")
+
+    @staticmethod
+    def recent_launch_metrics(metrics_file):
+        """Entries in the last LAUNCH_HISTORY_BYTES of the metrics file"""
+        with open(metrics_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            start = max(0, f.tell() - LAUNCH_HISTORY_BYTES)
+            f.seek(start)
+            lines = f.read().splitlines()
+        if start:
+            # The first line was cut by the seek
+            lines = lines[1:]
+        return [json.loads(line) for line in lines if line.strip()]
+
     @staticmethod
-    def create_chrome_driver():
+    def create_chrome_driver(profile_name=None, pin_driver=False, lean=False, headless=False,
+                             blocked_resource_types=None, blocked_url_patterns_extra=None,
+                             capture_network=False):
+        """Creates a Chrome driver.
+        
+        profile_name - reuse a named persistent --user-data-dir so disk caches
+                       stay warm between runs (None = throwaway profile)
+        pin_driver   - reuse the cached chromedriver path instead of resolving it
+        lean         - block resource types the scraper never reads (images,
+                       media, fonts, tracking by default) via DevTools
+        headless     - run without a visible window
+        blocked_resource_types / blocked_url_patterns_extra - override or
+                       extend what the lean profile blocks
+        capture_network - enable the DevTools performance log read by NetworkCapture
+        """
+        launch_started = time.perf_counter()
+        
         options = Options()
         options.add_argument("--start-maximized")
         options.add_argument("--disable-notifications")
@@ -87,8 +236,47 @@ class DriverFactory:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
 
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+        if capture_network:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        if headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
+
+        blocked_patterns = []
+        if lean:
+            resource_types = LEAN_BLOCKED_RESOURCE_TYPES if blocked_resource_types is None else blocked_resource_types
+            blocked_patterns = blocked_url_patterns(resource_types, blocked_url_patterns_extra)
+            if "image" in resource_types:
+                # Cap image loading at the renderer level too, for images the URL patterns miss
+                options.add_argument("--blink-settings=imagesEnabled=false")
+                options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+        profile_warm = False
+        if profile_name:
+            user_data_dir = os.path.abspath(os.path.join(CHROME_PROFILES_DIR, profile_name))
+            profile_warm = os.path.isdir(user_data_dir)
+            os.makedirs(user_data_dir, exist_ok=True)
+            options.add_argument(f"--user-data-dir={user_data_dir}")
+
+        resolve_started = time.perf_counter()
+        driver_path, driver_cached = DriverFactory.resolve_chromedriver_path(pin_driver)
+        resolve_seconds = time.perf_counter() - resolve_started
+        
+        browser_started = time.perf_counter()
+        try:
+            driver = webdriver.Chrome(service=Service(driver_path), options=options)
+        except SessionNotCreatedException:
+            if not driver_cached:
+                raise
+            # Chrome was updated since the path was pinned - resolve again
+            driver_path, driver_cached = DriverFactory.resolve_chromedriver_path(pin_driver, refresh=True)
+            driver = webdriver.Chrome(service=Service(driver_path), options=options)
+        browser_start_seconds = time.perf_counter() - browser_started
+        
+        apply_request_blocking(driver, blocked_patterns)
+        driver.lean_profile = lean
+        driver.network_capture_enabled = capture_network
         
         # Hide webdriver flag in JS
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -97,12 +285,25 @@ class DriverFactory:
         driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: function() { return [1, 2, 3, 4, 5]; }});")
         driver.execute_script("Object.defineProperty(navigator, 'languages', {get: function() { return ['pl-PL', 'pl', 'en-US', 'en']; }});")
         
+        driver.launch_metrics = {
+            "launched_at": time.time(),
+            "profile": profile_name,
+            "start_type": "warm" if driver_cached and profile_warm else "cold",
+            "driver_cached": driver_cached,
+            "profile_warm": profile_warm,
+            "resolve_seconds": round(resolve_seconds, 3),
+            "browser_start_seconds": round(browser_start_seconds, 3),
+            "total_seconds": round(time.perf_counter() - launch_started, 3)
+        }
+        DriverFactory.record_launch_metrics(driver.launch_metrics)
+        
         return driver
 
 
 class LinkedInLoginHandler:
-    def __init__(self, driver):
+    def __init__(self, driver, selector_cache=None):
         self.driver = driver
+        self.selector_cache = selector_cache or SelectorCache.shared()
         self.logger = LoggerSetup.get_logger("LinkedInLoginHandler")
 
     def apply_anti_bot_measures(self):
@@ -152,21 +353,20 @@ class LinkedInLoginHandler:
             "//button[contains(text(), 'Sign in')]"
         ]
         
-        for selector in selectors:
-            try:
-                if selector.startswith("//"):
-                    login_button = Utils.wait_and_find_element(self.driver, By.XPATH, selector)
-                else:
-                    login_button = Utils.wait_and_find_element(self.driver, By.CSS_SELECTOR, selector)
-                
-                if login_button:
-                    self.driver.execute_script("arguments[0].click();", login_button)
-                    Utils.random_delay(2, 4)
-                    return True
-            except Exception:
-                continue
+        selector, login_button = Utils.wait_for_any(
+            self.driver, selectors, timeout=15,
+            selector_cache=self.selector_cache, page_type="login:auth_wall"
+        )
+        if not login_button:
+            return False
         
-        return False
+        try:
+            self.driver.execute_script("arguments[0].click();", login_button)
+            Utils.random_delay(2, 4)
+            return True
+        except Exception as e:
+            self.logger.debug(f"Failed to click auth wall button {selector}: {e}")
+            return False
 
     def handle_challenge(self):
         self.logger.info("Waiting for potential challenge/captcha resolution...")
@@ -185,7 +385,7 @@ class LinkedInLoginHandler:
             # Short delay to ensure page is loaded
             Utils.random_delay(2, 4)
             
-            # Find email field - try multiple selectors
+            # Find email field - probe the specific selectors at once
             email_selectors = [
                 'input[name="session_key"]',
                 'input[id="username"]',
@@ -194,44 +394,24 @@ class LinkedInLoginHandler:
                 '//input[contains(@class, "login-email")]'
             ]
             
-            # First search for email field and wait until it's interactive
-            email_input = None
-            for selector in email_selectors:
-                try:
-                    if selector.startswith("//"):
-                        email_input_elem = WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.XPATH, selector))
-                        )
-                    else:
-                        email_input_elem = WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                    
-                    # Make sure the element is visible and can be interacted with
-                    if email_input_elem.get_attribute("id"):
-                        email_input = WebDriverWait(self.driver, 10).until(
-                            EC.element_to_be_clickable((By.ID, email_input_elem.get_attribute("id")))
-                        )
-                    else:
-                        email_input = email_input_elem
-                    
-                    if email_input:
-                        self.logger.info(f"Found email field using selector: {selector}")
-                        break
-                except Exception as e:
-                    self.logger.debug(f"Email field not found with selector {selector}: {e}")
-                    continue
+            # Wait until the email field is present and interactive
+            selector, email_input = Utils.wait_for_any(
+                self.driver, email_selectors, timeout=10, clickable=True,
+                selector_cache=self.selector_cache, page_type="login:email"
+            )
+            
+            if not email_input:
+                # Generic last resort - probed only now so it cannot beat a specific field that renders
+                # later, and kept out of the selector cache
+                selector, email_input = Utils.wait_for_any(
+                    self.driver, ["//input[@type='text' or @type='email']"], timeout=2, clickable=True
+                )
             
             if not email_input:
-                # Last attempt - find any text field
-                try:
-                    email_input = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, "//input[@type='text' or @type='email']"))
-                    )
-                    self.logger.info("Found email field using fallback selector")
-                except Exception as e:
-                    self.logger.error(f"Could not find email field after multiple attempts: {e}")
-                    return False
+                self.logger.error("Could not find email field after multiple attempts")
+                return False
+            
+            self.logger.info(f"Found email field using selector: {selector}")
             
             # Clear field before typing
             email_input.clear()
@@ -265,43 +445,16 @@ class LinkedInLoginHandler:
                 '//input[contains(@class, "login-password")]'
             ]
             
-            password_input = None
-            for selector in password_selectors:
-                try:
-                    if selector.startswith("//"):
-                        password_input_elem = WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((By.XPATH, selector))
-                        )
-                    else:
-                        password_input_elem = WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                    
-                    # Make sure the element is visible and can be interacted with
-                    if password_input_elem.get_attribute("id"):
-                        password_input = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((By.ID, password_input_elem.get_attribute("id")))
-                        )
-                    else:
-                        password_input = password_input_elem
-                    
-                    if password_input:
-                        self.logger.info(f"Found password field using selector: {selector}")
-                        break
-                except Exception as e:
-                    self.logger.debug(f"Password field not found with selector {selector}: {e}")
-                    continue
+            selector, password_input = Utils.wait_for_any(
+                self.driver, password_selectors, timeout=5, clickable=True,
+                selector_cache=self.selector_cache, page_type="login:password"
+            )
             
             if not password_input:
-                # Last attempt - find any password field
-                try:
-                    password_input = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, "//input[@type='password']"))
-                    )
-                    self.logger.info("Found password field using fallback selector")
-                except Exception as e:
-                    self.logger.error(f"Could not find password field after multiple attempts: {e}")
-                    return False
+                self.logger.error("Could not find password field after multiple attempts")
+                return False
+            
+            self.logger.info(f"Found password field using selector: {selector}")
             
             # Clear field before typing
             password_input.clear()
@@ -328,29 +481,17 @@ class LinkedInLoginHandler:
                 '//button[contains(text(), "Sign in")]'
             ]
             
-            submit_button = None
-            for selector in submit_selectors:
-                try:
-                    if selector.startswith("//"):
-                        submit_button = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((By.XPATH, selector))
-                        )
-                    else:
-                        submit_button = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                    
-                    if submit_button:
-                        self.logger.info(f"Found login button using selector: {selector}")
-                        break
-                except Exception as e:
-                    self.logger.debug(f"Login button not found with selector {selector}: {e}")
-                    continue
+            selector, submit_button = Utils.wait_for_any(
+                self.driver, submit_selectors, timeout=5, clickable=True,
+                selector_cache=self.selector_cache, page_type="login:submit"
+            )
             
             if not submit_button:
                 self.logger.error("Could not find 'Login' button after multiple attempts")
                 return False
             
+            self.logger.info(f"Found login button using selector: {selector}")
+            
             # Add random delay before clicking
             Utils.random_delay(1, 2)
             
@@ -367,6 +508,8 @@ class LinkedInLoginHandler:
             # Login verification
             is_logged_in = any(marker in self.driver.current_url for marker in ["/feed", "/in/", "mynetwork"])
             
+            self.selector_cache.save()
+            
             if is_logged_in:
                 self.logger.info("Logged in successfully!")
                 
@@ -1,12 +1,24 @@
 """
 LinkedIn Bot - Main Module
+
+Interactive: python3 main.py
+Batch:       python3 main.py --jobs jobs.txt [--report run_report.json]
+
+A jobs file holds one job per line - "find-people <query>", "delete-comments"
+or a JSON object such as {"action": "find-people", "query": "...", "sink": "sqlite"} -
+or a JSON array of such objects. Blank lines and lines starting with # are skipped.
 """
+import argparse
+import json
+import time
 import traceback
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from login import Config, LoggerSetup, DriverFactory, LinkedInLoginHandler, Utils
 from delete_comments import LinkedInCommentHandler
 from find_people import LinkedInPeopleSearchHandler
+from session_store import SessionStore
 
 
 # Command Pattern implementation
@@ -16,52 +28,293 @@ class Command(ABC):
     def execute(self):
         pass
 
+    def details(self):
+        """Machine-readable description of the command and its outcome"""
+        return {}
+
 
 class DeleteCommentsCommand(Command):
-    def __init__(self, driver):
+    def __init__(self, driver, streaming=False):
         self.driver = driver
+        self.streaming = streaming
         self.logger = LoggerSetup.get_logger("DeleteCommentsCommand")
         
     def execute(self):
         self.logger.info("Executing delete comments command")
         comment_handler = LinkedInCommentHandler(self.driver)
-        comment_handler.find_and_delete_comments()
+        comment_handler.find_and_delete_comments(streaming=self.streaming)
         return "Comments deletion completed"
 
+    def details(self):
+        return {"action": "delete-comments", "streaming": self.streaming}
+
 
 class FindPeopleCommand(Command):
-    def __init__(self, driver, search_query):
+    def __init__(self, driver, search_query, sink_mode="jsonl", resume=False, extraction_mode="script",
+                 skip_known=False):
         self.driver = driver
         self.search_query = search_query
+        self.sink_mode = sink_mode
+        self.resume = resume
+        self.extraction_mode = extraction_mode
+        self.skip_known = skip_known
+        self.profile_count = None
+        self.output_file = None
+        self.crawl_completed = None
         self.logger = LoggerSetup.get_logger("FindPeopleCommand")
         
     def execute(self):
         self.logger.info(f"Executing find people command for query: {self.search_query}")
-        people_handler = LinkedInPeopleSearchHandler(self.driver, self.search_query)
+        people_handler = LinkedInPeopleSearchHandler(
+            self.driver, self.search_query, sink_mode=self.sink_mode, resume=self.resume,
+            extraction_mode=self.extraction_mode, skip_known=self.skip_known
+        )
         profiles = people_handler.search_and_collect_profiles()
+        self.profile_count = len(profiles)
+        self.output_file = people_handler.json_filename
+        self.crawl_completed = people_handler.crawl_completed
+        if not people_handler.total_card_count and not people_handler.crawl_completed:
+            # The search failed or no result page could be read
+            raise RuntimeError(f"No search results collected for query '{self.search_query}'")
         return f"Found {len(profiles)} profiles. Data saved to {people_handler.json_filename}"
 
+    def details(self):
+        return {
+            "action": "find-people",
+            "query": self.search_query,
+            "sink": self.sink_mode,
+            "skip_known": self.skip_known,
+            "profiles": self.profile_count,
+            "crawl_completed": self.crawl_completed,
+            "output": self.output_file
+        }
+
 
 # Command invoker
 class LinkedInCommandInvoker:
     def __init__(self, driver):
         self.driver = driver
+        self.history = []
         self.logger = LoggerSetup.get_logger("LinkedInCommandInvoker")
         
     def execute_command(self, command):
+        """Runs the command and appends its status and timing to history"""
         self.logger.info(f"Invoking command: {command.__class__.__name__}")
+        started_at = time.time()
+        start = time.perf_counter()
         try:
             result = command.execute()
+            status = "succeeded"
             self.logger.info(f"Command executed successfully: {result}")
-            return result
         except Exception as e:
             self.logger.error(f"Command execution failed: {e}")
-            import traceback
             self.logger.error(traceback.format_exc())
-            return f"Command execution failed: {str(e)}"
+            result = f"Command execution failed: {str(e)}"
+            status = "failed"
+
+        self.history.append({
+            "command": command.__class__.__name__,
+            "status": status,
+            "result": result,
+            "started_at": started_at,
+            "seconds": round(time.perf_counter() - start, 3),
+            **command.details()
+        })
+        return result
+
+    @property
+    def last_record(self):
+        return self.history[-1] if self.history else None
+
+
+def log_in(driver, session_store=None):
+    """Logs the driver in, reusing a stored session when it is still valid"""
+    logger = LoggerSetup.get_logger("Main")
+    session_store = session_store or SessionStore()
+    
+    if session_store.restore(driver):
+        return True
+    
+    # Stale cookies from a rejected session must not leak into the login form
+    driver.delete_all_cookies()
+    
+    # Go to LinkedIn login page
+    driver.get("https://www.linkedin.com/login")
+    Utils.random_delay(2, 4)
+    
+    # Check if page loaded
+    current_url = driver.current_url
+    logger.info(f"Page loaded: {current_url}")
+    
+    # Login to LinkedIn
+    login_handler = LinkedInLoginHandler(driver)
+    
+    if not login_handler.login(Config.EMAIL, Config.PASSWORD):
+        return False
+    
+    session_store.save(driver)
+    return True
+
+
+def create_driver(args, profile_name="default", capture_network=None):
+    """Creates the browser driver configured by the command line flags.
+    
+    capture_network defaults to --extraction-mode network.
+    """
+    if capture_network is None:
+        capture_network = args.extraction_mode == "network"
+    return DriverFactory.create_chrome_driver(
+        profile_name=profile_name, pin_driver=True, lean=args.lean, headless=args.headless,
+        capture_network=capture_network
+    )
+
+
+def build_command(driver, job, args):
+    """Creates the command for a job dict ({"action": ..., ...}); flags give the defaults"""
+    action = job.get("action", "").lower()
+    if action in ("1", "delete-comment", "delete-comments"):
+        return DeleteCommentsCommand(driver, streaming=job.get("streaming", args.stream_delete))
+    if action in ("2", "find-people"):
+        if not job.get("query"):
+            raise ValueError("find-people job without a query")
+        extraction_mode = job.get("extraction_mode", args.extraction_mode)
+        if extraction_mode == "network" and not getattr(driver, "network_capture_enabled", False):
+            # find_people would silently fall back to DOM extraction
+            raise ValueError(
+                "extraction_mode 'network' needs a browser started with network capture "
+                "(--extraction-mode network)"
+            )
+        return FindPeopleCommand(
+            driver, job["query"],
+            sink_mode=job.get("sink", args.sink),
+            resume=job.get("resume", args.resume),
+            extraction_mode=extraction_mode,
+            skip_known=job.get("skip_known", args.skip_known)
+        )
+    raise ValueError(f"Unknown action: {action or '(none)'}")
+
+
+def load_jobs(filename):
+    """Reads a jobs file (see module docstring) into a list of job dicts"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if content.lstrip().startswith("["):
+        return json.loads(content)
+
+    jobs = []
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("{"):
+            jobs.append(json.loads(line))
+        else:
+            action, _, query = line.partition(" ")
+            jobs.append({"action": action, "query": query.strip()})
+    return jobs
+
+
+def run_batch(args):
+    """Runs every job from the jobs file on one logged-in driver and writes the run report"""
+    logger = LoggerSetup.get_logger("Main")
+    jobs = load_jobs(args.jobs)
+    report_filename = args.report or f"run_report_{datetime.now():%Y%m%d_%H%M%S}.json"
+    report = {"jobs_file": args.jobs, "started_at": time.time(), "login": None, "jobs": []}
+    run_start = time.perf_counter()
+    driver = None
+
+    try:
+        # One driver serves every job, so capture traffic if any job reads it
+        driver = create_driver(args, capture_network=args.extraction_mode == "network" or any(
+            isinstance(job, dict) and job.get("extraction_mode") == "network" for job in jobs
+        ))
+        report["driver_launch"] = getattr(driver, "launch_metrics", None)
+
+        login_start = time.perf_counter()
+        logged_in = log_in(driver)
+        report["login"] = {
+            "status": "succeeded" if logged_in else "failed",
+            "seconds": round(time.perf_counter() - login_start, 3)
+        }
+
+        invoker = LinkedInCommandInvoker(driver)
+        for index, job in enumerate(jobs, 1):
+            if not logged_in:
+                report["jobs"].append({"index": index, "status": "skipped", "job": job})
+                continue
+            try:
+                command = build_command(driver, job, args)
+            except ValueError as e:
+                logger.error(f"Job {index}: {e}")
+                report["jobs"].append({"index": index, "status": "invalid", "error": str(e), "job": job})
+                continue
+
+            logger.info(f"Job {index}/{len(jobs)}: {job}")
+            invoker.execute_command(command)
+            report["jobs"].append({"index": index, **invoker.last_record})
+    except Exception as e:
+        logger.critical(f"Batch run aborted: {e}")
+        logger.critical(f"Error details:\n{traceback.format_exc()}")
+        report["error"] = str(e)
+    finally:
+        if driver:
+            try:
+                driver.quit()
+                logger.info("Browser has been closed")
+            except Exception as qe:
+                logger.error(f"Problem closing browser: {qe}")
+
+        report["finished_at"] = time.time()
+        report["seconds"] = round(time.perf_counter() - run_start, 3)
+        report["summary"] = {
+            status: sum(1 for job in report["jobs"] if job["status"] == status)
+            for status in ("succeeded", "failed", "invalid", "skipped")
+        }
+        with open(report_filename, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        logger.info(f"Run report saved to {report_filename}: {report['summary']}")
+
+    return report
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="LinkedIn Bot")
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="continue an interrupted find-people crawl from its checkpoint"
+    )
+    parser.add_argument(
+        "--sink", default="jsonl",
+        help="find-people output: jsonl, json, sqlite or a combination such as jsonl+sqlite"
+    )
+    parser.add_argument(
+        "--skip-known", action="store_true",
+        help="skip find-people profiles collected by earlier runs (not applied to the json sink)"
+    )
+    parser.add_argument(
+        "--extraction-mode", default="script", choices=["script", "html", "network", "element"],
+        help="how find-people reads result cards"
+    )
+    parser.add_argument(
+        "--stream-delete", action="store_true",
+        help="delete comments batch by batch while loading them instead of loading everything first"
+    )
+    parser.add_argument("--lean", action="store_true", help="block images, media, fonts and trackers")
+    parser.add_argument("--headless", action="store_true", help="run Chrome without a window")
+    parser.add_argument("--jobs", help="run the jobs from this file non-interactively on one login")
+    parser.add_argument("--report", help="run report path for --jobs (default: run_report_<timestamp>.json)")
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
+    if args.jobs:
+        report = run_batch(args)
+        if report.get("error") or any(job["status"] != "succeeded" for job in report["jobs"]):
+            raise SystemExit(1)
+        return
+
     logger = LoggerSetup.get_logger("Main")
     driver = None
     try:
@@ -72,21 +325,11 @@ def main():
         action = input("Select action (1/2): ").strip()
         
         # Create browser driver
-        driver = DriverFactory.create_chrome_driver()
+        driver = create_driver(args)
         logger.info("Chrome browser launched")
         
-        # Go to LinkedIn login page
-        driver.get("https://www.linkedin.com/login")
-        Utils.random_delay(2, 4)
-        
-        # Check if page loaded
-        current_url = driver.current_url
-        logger.info(f"Page loaded: {current_url}")
-        
-        # Login to LinkedIn
-        login_handler = LinkedInLoginHandler(driver)
-        
-        if not login_handler.login(Config.EMAIL, Config.PASSWORD):
+        # Login to LinkedIn (restores a saved session when possible)
+        if not log_in(driver):
             logger.error("Login failed")
             return
         
@@ -94,17 +337,13 @@ def main():
         invoker = LinkedInCommandInvoker(driver)
         
         # Execute selected action using Command pattern
-        if action == "1" or action.lower() == "delete-comment":
-            # Delete comments command
-            command = DeleteCommentsCommand(driver)
-            invoker.execute_command(command)
-        elif action == "2" or action.lower() == "find-people":
-            # Find people command
-            search_query = input("Enter search phrase (e.g. 'Security Engineer'): ").strip()
-            command = FindPeopleCommand(driver, search_query)
-            invoker.execute_command(command)
-        else:
-            logger.error("Unknown action")
+        job = {"action": action}
+        if action == "2" or action.lower() == "find-people":
+            job["query"] = input("Enter search phrase (e.g. 'Security Engineer'): ").strip()
+        try:
+            invoker.execute_command(build_command(driver, job, args))
+        except ValueError as e:
+            logger.error(str(e))
 
         input("Press Enter to close the browser...")
     except Exception as e:
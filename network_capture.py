@@ -0,0 +1,175 @@
+"""
+LinkedIn Bot - Network Capture Module
+
+Captures the JSON responses that render people search results from the
+browser's DevTools performance log and decodes them into profile records,
+without touching the DOM.
+
+Decoding recorded responses (fixtures):
+python3 network_capture.py <response.json> [<response.json> ...]
+"""
+import base64
+import json
+import os
+import re
+import sys
+
+from logger_setup import LoggerSetup
+from profile_parser import clean_profile_data, extract_company
+
+
+# Responses that carry search result cards (not typeahead or search history queries)
+SEARCH_RESPONSE_PATTERNS = [
+    re.compile(r"/voyager/api/graphql\?(?:.*&)?queryId=voyagerSearchDashClusters\b", re.IGNORECASE),
+    re.compile(r"/voyager/api/search/", re.IGNORECASE),
+]
+ENTITY_RESULT_TYPE_SUFFIX = "EntityResultViewModel"
+
+
+def _text(value):
+    """Text of a LinkedIn TextViewModel ({"text": ...}) or plain string"""
+    if isinstance(value, dict):
+        return value.get("text") or ""
+    return value or ""
+
+
+def _is_entity_result(node):
+    node_type = node.get("$type") or node.get("_type") or ""
+    if node_type:
+        return node_type.endswith(ENTITY_RESULT_TYPE_SUFFIX)
+    # Non-normalized GraphQL responses omit $type on nested results
+    return "navigationUrl" in node and "title" in node and "primarySubtitle" in node
+
+
+def _walk(node):
+    if isinstance(node, dict):
+        if _is_entity_result(node):
+            yield node
+        for value in node.values():
+            yield from _walk(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _walk(item)
+
+
+def decode_search_response(payload, skip_url=None):
+    """Decodes a search results JSON response into profile records.
+
+    Works on both normalized (`included` array) and nested GraphQL payloads;
+    only results linking to a person profile (/in/) are returned. Results
+    whose profile URL `skip_url` returns True for are not decoded.
+    """
+    profiles = []
+    seen_urls = set()
+
+    for entity in _walk(payload):
+        profile_url = (entity.get("navigationUrl") or "").split("?")[0]
+        if "/in/" not in profile_url or profile_url in seen_urls:
+            continue
+        seen_urls.add(profile_url)
+        if skip_url and skip_url(profile_url):
+            continue
+
+        profile_data = {
+            "name": _text(entity.get("title")),
+            "title": _text(entity.get("primarySubtitle")),
+            "location": _text(entity.get("secondarySubtitle")),
+            "current_company": extract_company(_text(entity.get("summary"))),
+            "profile_url": profile_url
+        }
+        profiles.append(clean_profile_data(profile_data))
+
+    return profiles
+
+
+class NetworkCapture:
+    """Collects search result responses from the driver's performance log.
+
+    Requires a driver created with performance logging enabled
+    (DriverFactory.create_chrome_driver(capture_network=True)).
+    fixture_dir, when set, receives a copy of every captured response.
+    """
+    def __init__(self, driver, fixture_dir=None):
+        self.driver = driver
+        self.fixture_dir = fixture_dir
+        self.pending = {}
+        self.seen_urls = set()
+        self.captured_count = 0
+        self.logger = LoggerSetup.get_logger("NetworkCapture")
+
+    def _matches(self, url):
+        return any(pattern.search(url) for pattern in SEARCH_RESPONSE_PATTERNS)
+
+    def drain_responses(self):
+        """Returns JSON payloads of search responses finished since the last call"""
+        payloads = []
+        for entry in self.driver.get_log("performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+
+            method = message.get("method")
+            params = message.get("params", {})
+
+            if method == "Network.responseReceived":
+                url = params.get("response", {}).get("url", "")
+                if self._matches(url):
+                    self.pending[params["requestId"]] = url
+            elif method == "Network.loadingFinished" and params.get("requestId") in self.pending:
+                request_id = params["requestId"]
+                url = self.pending.pop(request_id)
+                payload = self._response_body(request_id, url)
+                if payload is not None:
+                    payloads.append(payload)
+            elif method == "Network.loadingFailed":
+                self.pending.pop(params.get("requestId"), None)
+
+        return payloads
+
+    def _response_body(self, request_id, url):
+        try:
+            body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            text = body["body"]
+            if body.get("base64Encoded"):
+                text = base64.b64decode(text).decode("utf-8")
+            payload = json.loads(text)
+        except Exception as e:
+            self.logger.debug(f"Could not read response body for {url}: {e}")
+            return None
+
+        self.captured_count += 1
+        if self.fixture_dir:
+            os.makedirs(self.fixture_dir, exist_ok=True)
+            fixture_path = os.path.join(self.fixture_dir, f"search_response_{self.captured_count:04d}.json")
+            with open(fixture_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+        return payload
+
+    def collect_profiles(self, skip_url=None):
+        """Decodes newly captured responses into profiles not returned before.
+
+        skip_url(url) is asked once per new profile URL, before decoding it.
+        """
+        def skipped(url):
+            if url in self.seen_urls:
+                return True
+            self.seen_urls.add(url)
+            return bool(skip_url and skip_url(url))
+
+        profiles = []
+        for payload in self.drain_responses():
+            profiles.extend(decode_search_response(payload, skip_url=skipped))
+        return profiles
+
+
+# --- ENTRY POINT ---
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python network_capture.py <response.json> [<response.json> ...]")
+        sys.exit(1)
+
+    for fixture_path in sys.argv[1:]:
+        with open(fixture_path, 'r', encoding='utf-8') as f:
+            for profile_data in decode_search_response(json.load(f)):
+                print(json.dumps(profile_data, ensure_ascii=False))
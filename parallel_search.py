@@ -0,0 +1,400 @@
+"""
+LinkedIn Bot - Parallel People Search Module
+
+Runs people searches on several browsers at once. Each worker process owns
+its own browser, Chrome profile, session file and login. The parent hands
+out one query at a time to idle workers, never running more than
+--max-concurrent at once. Found profiles go back to the parent process,
+which deduplicates them (within the run and, with --skip-known, against the
+profile index) and writes them to one shared sink. Shared state files (selector cache, launch
+metrics, profile index, output) are written by the parent only.
+
+python3 parallel_search.py --queries queries.txt [--workers 3] [--max-concurrent 2] [--output NAME] [--sink jsonl] [--skip-known]
+python3 parallel_search.py --query "Security Engineer" --query "DevOps Engineer" --workers 2
+"""
+import argparse
+import collections
+import multiprocessing
+import queue
+import time
+import traceback
+import uuid
+
+from login import DriverFactory, LoggerSetup
+from profile_index import ProfileIndex, normalize_profile_url
+from profile_sink import ProfileSink, create_profile_sink
+from selector_cache import SelectorCache
+
+
+RESULT_POLL_INTERVAL = 1
+LOGIN_FAILED_EXIT_CODE = 2
+MAX_QUERY_ATTEMPTS = 2
+FLUSH_ACK_TIMEOUT = 60
+
+
+class QueueProfileSink(ProfileSink):
+    """Forwards profiles from a worker process to the parent's shared sink.
+
+    flush() waits until the parent has written and flushed everything sent
+    before it, so the worker's crawl checkpoint only advances past pages
+    whose profiles are durable.
+    """
+    def __init__(self, result_queue, ack_queue, worker, query, filename):
+        self.result_queue = result_queue
+        self.ack_queue = ack_queue
+        self.worker = worker
+        self.query = query
+        self.filename = filename
+
+    def write(self, profile, page=None):
+        self.result_queue.put(("profile", self.query, page, profile))
+
+    def flush(self):
+        token = uuid.uuid4().hex
+        self.result_queue.put(("flush", self.worker, token))
+        deadline = time.time() + FLUSH_ACK_TIMEOUT
+        while time.time() < deadline:
+            try:
+                # Acks of earlier, timed-out flushes are skipped
+                if self.ack_queue.get(timeout=max(deadline - time.time(), 0.01)) == token:
+                    return
+            except queue.Empty:
+                break
+        raise RuntimeError(f"Parent did not confirm writing the profiles within {FLUSH_ACK_TIMEOUT}s")
+
+
+def _driver_alive(driver):
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+def worker_main(index, args, task_queue, ack_queue, result_queue, output_filename):
+    """Worker process: one browser, queries from task_queue until a None sentinel.
+
+    output_filename is the file the parent's shared sink writes, reported as
+    the output of every query.
+    """
+    # Imported here so the parent process does not need a browser stack
+    from find_people import LinkedInPeopleSearchHandler
+    from main import create_driver, log_in
+    from session_store import SessionStore
+
+    logger = LoggerSetup.get_logger(f"ParallelWorker-{index}")
+    profile_name = f"parallel-{index}"
+    # Files shared between workers are persisted by the parent: launch metrics
+    # and selector cache learning are sent over the result queue instead
+    DriverFactory.launch_metrics_file = None
+    selector_cache = SelectorCache.shared(persist=False)
+    session_store = SessionStore(filename=f"linkedin_session.{profile_name}.bin")
+    driver = None
+
+    def start_browser():
+        nonlocal driver
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        driver = create_driver(args, profile_name=profile_name)
+        result_queue.put(("launch_metrics", index, driver.launch_metrics))
+        return log_in(driver, session_store)
+
+    try:
+        if not start_browser():
+            result_queue.put(("login_failed", index))
+            raise SystemExit(LOGIN_FAILED_EXIT_CODE)
+        result_queue.put(("ready", index))
+
+        while True:
+            query = task_queue.get()
+            if query is None:
+                break
+
+            # Health check before every query - replace a browser that died meanwhile
+            if not _driver_alive(driver):
+                logger.warning("Browser is not responding, restarting it")
+                result_queue.put(("browser_restarted", index))
+                if not start_browser():
+                    result_queue.put(("finished", index, query, "failed", 0, 0.0, "login failed after restart"))
+                    result_queue.put(("login_failed", index))
+                    raise SystemExit(LOGIN_FAILED_EXIT_CODE)
+
+            start = time.perf_counter()
+            try:
+                handler = LinkedInPeopleSearchHandler(
+                    driver, query,
+                    sink=QueueProfileSink(result_queue, ack_queue, index, query, output_filename),
+                    extraction_mode=args.extraction_mode,
+                    selector_cache=selector_cache,
+                    resume=args.resume
+                )
+                profiles = handler.search_and_collect_profiles()
+                status, count, error = "succeeded", len(profiles), None
+            except Exception as e:
+                logger.error(f"Query '{query}' failed: {e}\n{traceback.format_exc()}")
+                status, count, error = "failed", 0, str(e)
+            result_queue.put(("selector_cache", index, selector_cache.snapshot()))
+            result_queue.put(("finished", index, query, status, count, time.perf_counter() - start, error))
+    finally:
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+class ParallelPeopleSearch:
+    def __init__(self, args, queries):
+        self.args = args
+        self.queries = list(dict.fromkeys(q for q in queries if q))
+        self.max_concurrent = args.max_concurrent or args.workers
+        self.context = multiprocessing.get_context("spawn")
+        self.result_queue = self.context.Queue()
+        self.task_queues = {}
+        self.ack_queues = {}
+        self.pending = collections.deque(self.queries)
+        self.processes = {}
+        self.idle_workers = set()
+        self.restarts = {}
+        self.in_flight = {}
+        self.attempts = {}
+        self.results = {}
+        self.disabled_workers = set()
+        self.seen_urls = set()
+        self.written = 0
+        self.duplicates = 0
+        self.output_filename = None
+        self.selector_cache = SelectorCache.shared()
+        self.logger = LoggerSetup.get_logger("ParallelPeopleSearch")
+
+    def start_worker(self, index):
+        # Fresh queues, so nothing meant for a dead process is picked up by its replacement
+        self.task_queues[index] = self.context.Queue()
+        self.ack_queues[index] = self.context.Queue()
+        self.idle_workers.discard(index)
+        process = self.context.Process(
+            target=worker_main, name=f"parallel-worker-{index}",
+            args=(index, self.args, self.task_queues[index], self.ack_queues[index], self.result_queue,
+                  self.output_filename)
+        )
+        process.start()
+        self.processes[index] = process
+
+    def dispatch(self):
+        """Hands pending queries to idle workers while fewer than max_concurrent are running.
+
+        Concurrency is tracked here rather than with a semaphore shared by the
+        workers, so a worker that dies mid-query cannot leak a slot.
+        """
+        while self.pending and self.idle_workers and len(self.in_flight) < self.max_concurrent:
+            worker = min(self.idle_workers)
+            self.idle_workers.remove(worker)
+            query = self.pending.popleft()
+            self.in_flight[worker] = query
+            self.task_queues[worker].put(query)
+
+    def handle_profile(self, query, page, profile, sink, index):
+        url = normalize_profile_url(profile.get("profile_url"))
+        if not url or url in self.seen_urls:
+            self.duplicates += 1
+            return
+        self.seen_urls.add(url)
+
+        if index:
+            status = index.classify(profile)
+            index.record(profile, query, status)
+            if status == "known":
+                sink.record_hit(profile["profile_url"], page=page)
+                self.duplicates += 1
+                return
+        sink.write(profile, page=page)
+        self.written += 1
+
+    def handle_message(self, message, sink, index):
+        kind = message[0]
+        if kind == "profile":
+            self.handle_profile(*message[1:], sink, index)
+        elif kind == "flush":
+            # Profiles sent before the flush are already handled - make them durable, then ack
+            _, worker, token = message
+            sink.flush()
+            if index:
+                index.commit()
+            self.ack_queues[worker].put(token)
+        elif kind == "finished":
+            _, worker, query, status, count, seconds, error = message
+            self.in_flight.pop(worker, None)
+            self.idle_workers.add(worker)
+            self.results[query] = {
+                "status": status, "profiles": count, "seconds": round(seconds, 2), "worker": worker, "error": error
+            }
+            self.logger.info(f"[worker {worker}] '{query}': {status}, {count} profiles in {seconds:.1f}s")
+            sink.flush()
+            if index:
+                index.commit()
+        elif kind == "selector_cache":
+            self.selector_cache.merge(message[2])
+        elif kind == "launch_metrics":
+            DriverFactory.record_launch_metrics(message[2])
+        elif kind == "login_failed":
+            self.disabled_workers.add(message[1])
+            self.idle_workers.discard(message[1])
+            self.logger.error(f"Worker {message[1]} could not log in and was stopped")
+        elif kind == "browser_restarted":
+            self.restarts[message[1]] = self.restarts.get(message[1], 0) + 1
+        elif kind == "ready":
+            self.idle_workers.add(message[1])
+            self.logger.info(f"Worker {message[1]} is logged in and ready")
+
+    def drain_messages(self, sink, index):
+        """Handles every message already on the result queue"""
+        while True:
+            try:
+                self.handle_message(self.result_queue.get_nowait(), sink, index)
+            except queue.Empty:
+                return
+
+    def check_workers(self, sink, index):
+        """Restarts crashed worker processes and re-queues the query they were running.
+
+        Messages of dead workers are handled first, so a query they finished
+        is not re-queued and a worker that could not log in is not restarted.
+        """
+        dead = [
+            worker for worker, process in self.processes.items()
+            if not process.is_alive() and worker not in self.disabled_workers
+        ]
+        if not dead:
+            return
+        # A dead process has flushed its queued messages to the pipe
+        self.drain_messages(sink, index)
+
+        for worker in dead:
+            process = self.processes[worker]
+            if worker in self.disabled_workers or process.exitcode == 0:
+                continue
+
+            self.idle_workers.discard(worker)
+            query = self.in_flight.pop(worker, None)
+            if query is not None:
+                self.requeue(query, f"worker {worker} died (exit code {process.exitcode})")
+
+            if process.exitcode == LOGIN_FAILED_EXIT_CODE:
+                # Logging in again will not succeed - not worth a restart
+                self.disabled_workers.add(worker)
+                self.logger.error(f"Worker {worker} could not log in and was stopped")
+                continue
+
+            if self.restarts.get(worker, 0) >= self.args.max_restarts:
+                self.logger.error(f"Worker {worker} exceeded {self.args.max_restarts} restarts, not restarting")
+                self.disabled_workers.add(worker)
+                continue
+            self.restarts[worker] = self.restarts.get(worker, 0) + 1
+            self.logger.warning(f"Restarting worker {worker} (exit code {process.exitcode})")
+            self.start_worker(worker)
+
+    def requeue(self, query, reason):
+        self.attempts[query] = self.attempts.get(query, 1) + 1
+        if self.attempts[query] > MAX_QUERY_ATTEMPTS:
+            self.results[query] = {"status": "failed", "profiles": 0, "error": reason}
+        else:
+            self.logger.warning(f"Re-queuing '{query}': {reason}")
+            self.pending.append(query)
+
+    def run(self):
+        sink = create_profile_sink(self.args.output, self.args.sink, resume=self.args.resume)
+        self.output_filename = sink.filename
+        index = None
+        if self.args.skip_known:
+            if sink.rewrites_output:
+                # The rewritten output would lose every profile skipped as known
+                self.logger.warning(f"Not skipping known profiles: {sink.filename} is rewritten as a whole on close")
+            else:
+                index = ProfileIndex()
+        start = time.perf_counter()
+
+        # Pin the chromedriver path once, so workers only read the cached path
+        try:
+            DriverFactory.resolve_chromedriver_path(pin_driver=True)
+        except Exception as e:
+            self.logger.warning(f"Could not resolve chromedriver up front: {e}")
+
+        for worker in range(1, self.args.workers + 1):
+            self.start_worker(worker)
+
+        try:
+            while len(self.results) < len(self.queries):
+                self.dispatch()
+                try:
+                    self.handle_message(self.result_queue.get(timeout=RESULT_POLL_INTERVAL), sink, index)
+                except queue.Empty:
+                    pass
+                self.check_workers(sink, index)
+                if len(self.disabled_workers) == len(self.processes) and not self.in_flight:
+                    self.logger.error("No workers left, abandoning remaining queries")
+                    break
+        finally:
+            for task_queue in self.task_queues.values():
+                task_queue.put(None)
+            # Keep draining (and acking flushes) so workers can finish and exit
+            deadline = time.time() + 60
+            while any(p.is_alive() for p in self.processes.values()) and time.time() < deadline:
+                try:
+                    self.handle_message(self.result_queue.get(timeout=RESULT_POLL_INTERVAL), sink, index)
+                except queue.Empty:
+                    pass
+            for process in self.processes.values():
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+            sink.close()
+            if index:
+                index.close()
+            self.selector_cache.save()
+
+        for query in self.queries:
+            self.results.setdefault(query, {"status": "not run", "profiles": 0})
+        elapsed = time.perf_counter() - start
+        self.logger.info(
+            f"Parallel search finished in {elapsed:.1f}s: {len(self.queries)} queries, {self.written} profiles "
+            f"written to {sink.filename}, {self.duplicates} duplicates skipped, "
+            f"{sum(self.restarts.values())} browser/worker restarts"
+        )
+        return self.results
+
+
+def load_queries(filename):
+    with open(filename, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run people searches on several browsers in parallel")
+    parser.add_argument("--queries", help="file with one search query per line")
+    parser.add_argument("--query", action="append", default=[], help="search query (repeatable)")
+    parser.add_argument("--workers", type=int, default=2, help="number of browser worker processes")
+    parser.add_argument("--max-concurrent", type=int, help="global cap on simultaneously running searches")
+    parser.add_argument("--max-restarts", type=int, default=3, help="restarts allowed per worker")
+    parser.add_argument("--output", default="parallel search", help="name of the shared output (query-style)")
+    parser.add_argument("--sink", default="jsonl", help="jsonl, json, sqlite or a combination such as jsonl+sqlite")
+    parser.add_argument("--extraction-mode", default="script", choices=["script", "html", "network", "element"])
+    parser.add_argument("--resume", action="store_true", help="resume each query from its checkpoint")
+    parser.add_argument(
+        "--skip-known", action="store_true",
+        help="skip profiles collected by earlier runs (profile index); ignored for --sink json"
+    )
+    parser.add_argument("--lean", action="store_true")
+    parser.add_argument("--headless", action="store_true")
+    return parser.parse_args()
+
+
+# --- ENTRY POINT ---
+if __name__ == "__main__":
+    cli_args = parse_args()
+    search_queries = cli_args.query + (load_queries(cli_args.queries) if cli_args.queries else [])
+    if not search_queries:
+        raise SystemExit("No queries given (use --query or --queries)")
+    ParallelPeopleSearch(cli_args, search_queries).run()
@@ -0,0 +1,129 @@
+"""
+LinkedIn Bot - Cross-Run Profile Index Module
+
+SQLite index of every profile collected so far, keyed by the normalized
+profile URL, so overlapping searches skip people that are already known.
+Writes are buffered until commit() and applied in one short transaction, so
+several connections (e.g. job service driver threads) can share the file.
+"""
+import sqlite3
+import time
+from urllib.parse import unquote, urlsplit
+
+from logger_setup import LoggerSetup
+
+
+DEFAULT_INDEX_FILE = "profile_index.sqlite3"
+TRACKED_FIELDS = ["name", "title", "location", "current_company"]
+
+
+def normalize_profile_url(url):
+    """Canonical form of a profile URL: https://www.linkedin.com/in/<slug>"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    path = unquote(parts.path).rstrip("/").lower()
+    if "/in/" in path:
+        path = path[path.index("/in/"):]
+        # Drop sub-pages such as /in/<slug>/details/experience
+        path = "/".join(path.split("/")[:3])
+    return f"https://www.linkedin.com{path}"
+
+
+class ProfileIndex:
+    def __init__(self, filename=DEFAULT_INDEX_FILE, timeout=30):
+        self.filename = filename
+        # timeout: seconds to wait for another connection's commit to finish
+        self.connection = sqlite3.connect(filename, timeout=timeout)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS profiles (
+                profile_url TEXT NOT NULL,
+                name TEXT,
+                title TEXT,
+                location TEXT,
+                current_company TEXT,
+                first_query TEXT,
+                last_query TEXT,
+                first_seen REAL,
+                last_seen REAL
+            )
+        """)
+        self.connection.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_profiles_url ON profiles(profile_url)"
+        )
+        self.connection.commit()
+        # Records since the last commit, keyed by normalized URL
+        self.pending = {}
+        self.counts = {"new": 0, "known": 0, "updated": 0}
+        self.logger = LoggerSetup.get_logger("ProfileIndex")
+
+    def contains(self, url):
+        """Cheap membership check used before extracting a card"""
+        url = normalize_profile_url(url)
+        if url in self.pending:
+            return True
+        row = self.connection.execute(
+            "SELECT 1 FROM profiles WHERE profile_url = ?", (url,)
+        ).fetchone()
+        return row is not None
+
+    def classify(self, profile):
+        """Returns 'new', 'known' (unchanged) or 'updated' for an extracted profile"""
+        url = normalize_profile_url(profile["profile_url"])
+        if url in self.pending:
+            # Already recorded since the last commit
+            return "known"
+        row = self.connection.execute(
+            "SELECT * FROM profiles WHERE profile_url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return "new"
+        # Empty fields (e.g. a card without location) do not count as changes
+        changed = any(profile.get(field) and profile.get(field) != row[field] for field in TRACKED_FIELDS)
+        return "updated" if changed else "known"
+
+    def record(self, profile, query, status):
+        """Counts a new, updated or known profile; it is stored by commit()"""
+        self.counts[status] += 1
+        url = normalize_profile_url(profile["profile_url"])
+        self.pending.setdefault(url, (status, dict(profile), query, time.time()))
+
+    def commit(self):
+        """Writes the recorded profiles in one short transaction.
+
+        Records stay buffered when the write fails, e.g. because another
+        connection held the database longer than the timeout.
+        """
+        with self.connection:
+            for url, (status, profile, query, now) in self.pending.items():
+                self._write(url, status, profile, query, now)
+        self.pending.clear()
+
+    def _write(self, url, status, profile, query, now):
+        if status == "new":
+            self.connection.execute(
+                "INSERT OR IGNORE INTO profiles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, profile.get("name"), profile.get("title"), profile.get("location"),
+                 profile.get("current_company"), query, query, now, now)
+            )
+        elif status == "updated":
+            assignments = ", ".join(f"{field} = COALESCE(NULLIF(?, ''), {field})" for field in TRACKED_FIELDS)
+            self.connection.execute(
+                f"UPDATE profiles SET {assignments}, last_query = ?, last_seen = ? WHERE profile_url = ?",
+                [profile.get(field, "") for field in TRACKED_FIELDS] + [query, now, url]
+            )
+        else:
+            self.connection.execute(
+                "UPDATE profiles SET last_query = ?, last_seen = ? WHERE profile_url = ?", (query, now, url)
+            )
+
+    def close(self):
+        self.commit()
+        self.connection.close()
+
+    def log_counts(self):
+        self.logger.info(
+            f"Profile index: {self.counts['new']} new, {self.counts['known']} known (skipped), "
+            f"{self.counts['updated']} updated"
+        )
@@ -0,0 +1,357 @@
+"""
+LinkedIn Bot - Offline Search Results Parser Module
+
+Parses saved or live `page_source` HTML of people search results without a
+browser. Usage as a benchmark / batch tool:
+python3 profile_parser.py [--workers N] <page1.html> [<page2.html> ...]
+"""
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+from logger_setup import LoggerSetup
+
+
+AD_KEYWORDS = ["premium", "reaktywuj", "reactivate", "anuluj w dowolnym momencie"]
+TITLE_KEYWORDS = ["Engineer", "Developer", "Security", "Analyst", "Manager"]
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
+
+# Elements whose content is not part of the rendered (innerText-like) text
+HIDDEN_CLASSES = {"visually-hidden", "a11y-text"}
+SKIPPED_TAGS = {"script", "style", "noscript", "template"}
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main",
+    "nav", "ol", "p", "section", "table", "tr", "ul"
+}
+
+PROFILE_LINK_XPATH = ".//a[contains(@href, '/in/')]"
+TITLE_XPATH = ".//div[contains(@class, 't-14') and contains(@class, 't-black') and contains(@class, 't-normal')]"
+KEYWORD_TITLE_XPATH = ".//div[" + " or ".join(f"contains(text(), '{k}')" for k in TITLE_KEYWORDS) + "]"
+
+logger = LoggerSetup.get_logger("ProfileParser")
+
+
+# Text cleaning shared by every extraction backend
+def clean_name(text):
+    """Strips LinkedIn link decorations from a profile name"""
+    name_text = re.sub(r'Wyświetl profil użytkownika\s+', '', text)
+    name_text = re.sub(r'[•]\s+\d+\.\s+.*$', '', name_text).strip()
+    return re.sub(r'<[^>]+>', '', name_text).strip()
+
+
+def extract_company(summary_text):
+    """Extracts current company name from a profile summary"""
+    if not summary_text:
+        return ""
+
+    # Improved regex to extract company name
+    company_match = re.search(r'Obecnie:.*?\s+w\s+([^•\n]+)', summary_text, re.IGNORECASE)
+    if company_match:
+        return company_match.group(1).strip()
+
+    # Alternative pattern
+    company_match = re.search(r'Obecnie:.*?([A-Z][a-zA-Z0-9\s]+)$', summary_text)
+    if company_match:
+        return company_match.group(1).strip()
+
+    return ""
+
+
+def clean_profile_data(profile_data):
+    """Final data cleaning applied to every extracted profile"""
+    for key in profile_data:
+        if profile_data[key]:
+            profile_data[key] = re.sub(r'\n.*$', '', profile_data[key]).strip()
+            profile_data[key] = re.sub(r'<[^>]+>', '', profile_data[key]).strip()
+
+    # Final verification - make sure title isn't name
+    if profile_data["title"] == profile_data["name"]:
+        profile_data["title"] = ""
+
+    return profile_data
+
+
+def is_ad_text(text):
+    """Checks if card text belongs to an ad rather than a person"""
+    element_text = (text or "").lower()
+    return any(keyword in element_text for keyword in AD_KEYWORDS)
+
+
+def profile_from_card_record(record):
+    """Builds profile data from a raw card record.
+
+    A card record holds the raw texts of one result card:
+    name_text, href, title_texts, discovered_title_text, keyword_title_texts,
+    location_text and summary_text.
+    """
+    profile_data = {
+        "name": "",
+        "title": "",
+        "location": "",
+        "current_company": "",
+        "profile_url": ""
+    }
+
+    if record.get("name_text") and record.get("href"):
+        profile_data["name"] = clean_name(record["name_text"])
+        profile_data["profile_url"] = record["href"].split("?")[0]
+
+    # Title - same precedence as extract_profile_data
+    for text in record.get("title_texts") or []:
+        if text and text != profile_data["name"]:
+            profile_data["title"] = text
+            break
+
+    if not profile_data["title"]:
+        text = record.get("discovered_title_text") or ""
+        if text and text != profile_data["name"]:
+            profile_data["title"] = text
+
+    if not profile_data["title"]:
+        for text in record.get("keyword_title_texts") or []:
+            if text and text != profile_data["name"] and "Kontakt" not in text and "Zobacz" not in text:
+                profile_data["title"] = text
+                break
+
+    profile_data["location"] = record.get("location_text") or ""
+    profile_data["current_company"] = extract_company(record.get("summary_text"))
+
+    return clean_profile_data(profile_data)
+
+
+# HTML helpers
+def element_text(element):
+    """Approximates Selenium's rendered `.text` for an lxml element"""
+    parts = []
+
+    def walk(node):
+        if not isinstance(node.tag, str):
+            # Comments and processing instructions - keep only their tail
+            if node.tail:
+                parts.append(node.tail)
+            return
+
+        tag = node.tag.lower()
+        classes = set((node.get("class") or "").split())
+        hidden = (
+            tag in SKIPPED_TAGS
+            or classes & HIDDEN_CLASSES
+            or node.get("hidden") is not None
+            or "display:none" in (node.get("style") or "").replace(" ", "")
+        )
+
+        if not hidden:
+            if tag in BLOCK_TAGS:
+                parts.append("\n")
+            if node.text:
+                parts.append(node.text)
+            for child in node:
+                walk(child)
+            if tag in BLOCK_TAGS:
+                parts.append("\n")
+
+        if node.tail and node is not element:
+            parts.append(node.tail)
+
+    walk(element)
+
+    lines = (re.sub(r'[ \t\r\f\v\u00a0]+', ' ', line).strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def simple_selector_to_xpath(selector, relative=True):
+    """Converts a `tag.class` selector produced by selector discovery to XPath"""
+    match = re.fullmatch(r'([a-zA-Z][\w-]*)?((?:\.[\w-]+)*)', selector.strip())
+    if not match:
+        return None
+
+    tag = match.group(1) or "*"
+    conditions = [
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+        for cls in match.group(2).split(".") if cls
+    ]
+    prefix = ".//" if relative else "//"
+    return prefix + tag + "".join(f"[{condition}]" for condition in conditions)
+
+
+def first_text(element, selector):
+    """Rendered text of the first element matching a discovered selector"""
+    if not selector:
+        return ""
+    xpath = simple_selector_to_xpath(selector)
+    if not xpath:
+        return ""
+    matches = element.xpath(xpath)
+    return element_text(matches[0]) if matches else ""
+
+
+def parse_document(html):
+    """Parses an HTML string into an lxml tree"""
+    if lxml_html is None:
+        raise ImportError("lxml is required for offline page parsing (pip install lxml)")
+    return lxml_html.fromstring(html)
+
+
+# Selector discovery and card extraction
+def discover_selectors(tree):
+    """Offline counterpart of LinkedInPeopleSearchHandler.discover_selectors"""
+    selectors = {"profile": None, "title": None, "location": None, "summary": None}
+
+    profile_elements = tree.xpath("//li[.//a[contains(@href, '/in/')]]")
+    if not profile_elements:
+        containers = tree.xpath("//ul[contains(@class, 'list-style-none')]")
+        if containers:
+            profile_elements = containers[0].xpath(".//li")
+        if not profile_elements:
+            profile_elements = tree.xpath("//div[.//a[contains(@href, '/in/')]]")
+
+    if not profile_elements:
+        return selectors
+
+    sample_profile = profile_elements[0]
+
+    classes = (sample_profile.get("class") or "").split()
+    if classes:
+        selectors["profile"] = f"li.{classes[0]}"
+
+    title_candidates = sample_profile.xpath(".//div[contains(@class, 't-black')]")
+    location_candidates = sample_profile.xpath(".//div[contains(@class, 't-normal')]")
+    summary_candidates = sample_profile.xpath(".//p[contains(@class, 't-12') or contains(@class, 'entity-result__summary')]")
+
+    if title_candidates:
+        classes = (title_candidates[0].get("class") or "").split()
+        if classes:
+            selectors["title"] = f"div.{classes[0]}"
+
+    if len(location_candidates) > 1:
+        classes = (location_candidates[1].get("class") or "").split()
+        if classes:
+            selectors["location"] = f"div.{classes[0]}"
+
+    if summary_candidates:
+        classes = (summary_candidates[0].get("class") or "").split()
+        if classes:
+            selectors["summary"] = f"p.{classes[0]}"
+
+    return selectors
+
+
+def find_profile_cards(tree, profile_selector=None):
+    """Finds result cards using the same strategy order as process_search_results_page"""
+    strategies = [
+        simple_selector_to_xpath(profile_selector, relative=False) if profile_selector else None,
+        "//li[.//a[contains(@href, '/in/')]]",
+        "//li[contains(., 'Security') or contains(., 'Engineer') or contains(., 'Architect')]",
+        "//ul[contains(@class, 'list-style-none')]/li",
+        "//div[.//a[contains(@href, '/in/')]]"
+    ]
+
+    for xpath in strategies:
+        if not xpath:
+            continue
+        cards = tree.xpath(xpath)
+        if cards:
+            return cards
+    return []
+
+
+def card_link(card):
+    """(name text, absolute href) of the card's first named profile link"""
+    for link in card.xpath(PROFILE_LINK_XPATH):
+        link_text = element_text(link)
+        link_href = link.get("href") or ""
+        if link_text and link_href and '/in/' in link_href:
+            return link_text, link_href if link_href.startswith("http") else LINKEDIN_BASE_URL + link_href
+    return "", ""
+
+
+def card_record(card, selectors):
+    """Collects the raw texts of one card into a card record"""
+    name_text, href = card_link(card)
+    return {
+        "text": element_text(card),
+        "has_link": bool(card.xpath(PROFILE_LINK_XPATH)),
+        "name_text": name_text,
+        "href": href,
+        "title_texts": [element_text(elem) for elem in card.xpath(TITLE_XPATH)],
+        "discovered_title_text": first_text(card, selectors.get("title")),
+        "keyword_title_texts": [element_text(elem) for elem in card.xpath(KEYWORD_TITLE_XPATH)],
+        "location_text": first_text(card, selectors.get("location")),
+        "summary_text": first_text(card, selectors.get("summary"))
+    }
+
+
+def parse_search_results_html(html, selectors=None, skip_url=None):
+    """Parses one people search results page into profile records.
+
+    `selectors` may carry selectors discovered earlier (keys: profile, title,
+    location, summary); when omitted they are discovered from the page itself.
+    Cards whose profile URL `skip_url` returns True for are not extracted.
+    """
+    tree = parse_document(html)
+    if selectors is None:
+        selectors = discover_selectors(tree)
+
+    profiles = []
+    for card in find_profile_cards(tree, selectors.get("profile")):
+        if skip_url:
+            _, href = card_link(card)
+            if href and skip_url(href.split("?")[0]):
+                continue
+
+        record = card_record(card, selectors)
+        if is_ad_text(record["text"]) or not record["has_link"]:
+            continue
+
+        profile_data = profile_from_card_record(record)
+        if profile_data["name"] or profile_data["profile_url"]:
+            profiles.append(profile_data)
+
+    return profiles
+
+
+def parse_html_file(path):
+    """Parses a saved results page - worker entry point for parse_html_files"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return path, parse_search_results_html(f.read())
+
+
+def parse_html_files(paths, workers=None):
+    """Parses many saved results pages in a process pool, yielding (path, profiles)"""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(parse_html_file, paths)
+
+
+# --- ENTRY POINT ---
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    workers = None
+    if len(args) >= 2 and args[0] == "--workers":
+        workers = int(args[1])
+        args = args[2:]
+
+    if not args:
+        print("Usage: python profile_parser.py [--workers N] <page.html> [<page.html> ...]")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    total_profiles = 0
+    total_bytes = 0
+    for path, profiles in parse_html_files(args, workers):
+        total_profiles += len(profiles)
+        total_bytes += os.path.getsize(path)
+        logger.info(f"{path}: {len(profiles)} profiles")
+    elapsed = time.perf_counter() - started
+
+    logger.info(
+        f"Parsed {len(args)} pages ({total_bytes / 1024 / 1024:.1f} MiB, {total_profiles} profiles) "
+        f"in {elapsed:.2f}s - {len(args) / elapsed:.1f} pages/s"
+    )
@@ -0,0 +1,348 @@
+"""
+LinkedIn Bot - Profile Output Sinks Module
+"""
+import inspect
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+
+from json_stream import iter_json_array
+from login import LoggerSetup, Utils
+from profile_store import DEFAULT_STORE_FILE, ProfileStore
+
+
+# Sink interface
+class ProfileSink(ABC):
+    """Abstract destination for collected profiles"""
+    # True when close() rewrites the whole output from this run's profiles only
+    rewrites_output = False
+
+    @abstractmethod
+    def write(self, profile, page=None):
+        pass
+
+    def record_hit(self, url, page=None):
+        """Notes that the run found a profile it skipped as known from earlier runs"""
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class JsonlProfileSink(ProfileSink):
+    """Append-only JSONL writer with batched flushes.
+
+    fsync_policy:
+        "never"  - leave durability to the OS page cache
+        "batch"  - fsync after every flushed batch (default)
+        "always" - flush and fsync after every profile
+
+    With resume the existing file is continued; otherwise the output of an
+    earlier run is renamed to *.<its modification time>.jsonl first.
+    """
+    FSYNC_POLICIES = ("never", "batch", "always")
+
+    def __init__(self, filename, batch_size=20, fsync_policy="batch", resume=False):
+        if fsync_policy not in self.FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync_policy}")
+        self.filename = filename
+        self.batch_size = max(1, batch_size)
+        self.fsync_policy = fsync_policy
+        self.buffer = []
+        self.written_count = 0
+        self.logger = LoggerSetup.get_logger("JsonlProfileSink")
+
+        if resume:
+            self.recover_tail()
+        else:
+            self.rotate_previous_output()
+        self.file = open(self.filename, 'a', encoding='utf-8')
+
+    def rotate_previous_output(self):
+        """Moves an earlier run's output aside, so a fresh run starts a new file"""
+        if not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0:
+            return
+
+        base, extension = os.path.splitext(self.filename)
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(os.path.getmtime(self.filename)))
+        rotated_filename = f"{base}.{stamp}{extension}"
+        suffix = 1
+        while os.path.exists(rotated_filename):
+            suffix += 1
+            rotated_filename = f"{base}.{stamp}-{suffix}{extension}"
+        os.replace(self.filename, rotated_filename)
+        self.logger.warning(f"Moved the output of an earlier run to {rotated_filename}")
+
+    def recover_tail(self):
+        """Truncates a partially written last line left by a crash"""
+        if not os.path.exists(self.filename):
+            return
+
+        with open(self.filename, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return
+
+            f.seek(size - 1)
+            if f.read(1) == b'\n':
+                return
+
+            # Walk back to the last newline; everything after it is the tail
+            chunk_size = 4096
+            position = size
+            tail_start = 0
+            while position > 0:
+                read_size = min(chunk_size, position)
+                position -= read_size
+                f.seek(position)
+                newline_index = f.read(read_size).rfind(b'\n')
+                if newline_index != -1:
+                    tail_start = position + newline_index + 1
+                    break
+
+            f.seek(tail_start)
+            tail = f.read()
+            try:
+                json.loads(tail.decode('utf-8'))
+                f.write(b'\n')
+            except (ValueError, UnicodeDecodeError):
+                self.logger.warning(
+                    f"Dropping corrupt tail ({len(tail)} bytes) from {self.filename}"
+                )
+                f.truncate(tail_start)
+
+    def write(self, profile, page=None):
+        self.buffer.append(json.dumps(profile, ensure_ascii=False))
+        if self.fsync_policy == "always" or len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer or self.file.closed:
+            return
+
+        self.file.write("\n".join(self.buffer) + "\n")
+        self.file.flush()
+        if self.fsync_policy != "never":
+            os.fsync(self.file.fileno())
+
+        self.written_count += len(self.buffer)
+        self.buffer = []
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.flush()
+        self.file.close()
+        self.logger.info(f"Closed JSONL sink {self.filename} ({self.written_count} profiles written)")
+
+
+class JsonArrayProfileSink(ProfileSink):
+    """Compatibility sink producing the classic JSON array file.
+
+    Profiles are streamed to a JSONL staging file while collecting and the
+    final array is written in a single pass on close. With resume, the
+    profiles of the existing array are carried over into the staging file
+    so the rewritten array keeps them, and a staging file left by a crashed
+    run is continued; without resume such a file is set aside as
+    *.staging.jsonl.stale.
+    """
+    rewrites_output = True
+
+    def __init__(self, filename, batch_size=20, fsync_policy="batch", keep_staging=False, resume=False):
+        self.filename = filename
+        self.staging_filename = os.path.splitext(filename)[0] + ".staging.jsonl"
+        self.keep_staging = keep_staging
+        self.logger = LoggerSetup.get_logger("JsonArrayProfileSink")
+        if not resume and os.path.exists(self.staging_filename):
+            # Left by a crashed run - a fresh run must not carry its profiles over
+            stale_filename = self.staging_filename + ".stale"
+            os.replace(self.staging_filename, stale_filename)
+            self.logger.warning(f"Moved leftover staging file of an earlier run to {stale_filename}")
+        # A staging file left by a crashed run already holds everything collected so far
+        if resume and os.path.exists(filename) and not os.path.exists(self.staging_filename):
+            self.seed_staging()
+        # What is left in the staging file by now belongs to this run's output
+        self.staging = JsonlProfileSink(self.staging_filename, batch_size, fsync_policy, resume=True)
+
+    def seed_staging(self):
+        """Copies the profiles of the existing array into a new staging file"""
+        temp_filename = self.staging_filename + ".tmp"
+        count = 0
+        with open(temp_filename, 'w', encoding='utf-8') as f:
+            for profile in iter_json_array(self.filename):
+                f.write(json.dumps(profile, ensure_ascii=False) + "\n")
+                count += 1
+        os.replace(temp_filename, self.staging_filename)
+        self.logger.info(f"Resuming {self.filename} with its {count} existing profiles")
+
+    def write(self, profile, page=None):
+        self.staging.write(profile)
+
+    def flush(self):
+        self.staging.flush()
+
+    def close(self):
+        if self.staging.file.closed:
+            return
+        self.staging.close()
+
+        temp_filename = self.filename + ".tmp"
+        count = 0
+        with open(self.staging_filename, 'r', encoding='utf-8') as src, \
+                open(temp_filename, 'w', encoding='utf-8') as dst:
+            dst.write("[")
+            for line in src:
+                line = line.strip()
+                if not line:
+                    continue
+                profile = json.loads(line)
+                dst.write(",\n" if count else "\n")
+                dst.write(json.dumps(profile, ensure_ascii=False, indent=2))
+                count += 1
+            dst.write("\n]" if count else "]")
+        os.replace(temp_filename, self.filename)
+
+        if not self.keep_staging:
+            os.remove(self.staging_filename)
+
+        self.logger.info(f"Wrote {count} profiles to {self.filename}")
+
+
+class SqliteProfileSink(ProfileSink):
+    """Stores profiles in the SQLite profile store with query-run provenance.
+
+    Profiles are inserted in batches, one transaction per batch. fsync_policy
+    has the JsonlProfileSink meaning and maps to SQLite's synchronous mode.
+    With resume, the query's last unfinished run is continued instead of
+    starting a new one.
+    """
+    SYNCHRONOUS_BY_FSYNC_POLICY = {"never": "OFF", "batch": "FULL", "always": "FULL"}
+
+    def __init__(self, query, filename=DEFAULT_STORE_FILE, batch_size=50, fsync_policy="batch", resume=False):
+        if fsync_policy not in self.SYNCHRONOUS_BY_FSYNC_POLICY:
+            raise ValueError(f"Unknown fsync policy: {fsync_policy}")
+        self.filename = filename
+        self.batch_size = 1 if fsync_policy == "always" else max(1, batch_size)
+        self.buffer = []
+        self.store = ProfileStore(filename, synchronous=self.SYNCHRONOUS_BY_FSYNC_POLICY[fsync_policy])
+        self.run_id = (self.store.last_unfinished_run(query) if resume else None) or self.store.start_run(query)
+        self.closed = False
+        self.logger = LoggerSetup.get_logger("SqliteProfileSink")
+
+    def write(self, profile, page=None):
+        self.buffer.append((profile, page))
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def record_hit(self, url, page=None):
+        # Empty fields keep the stored profile's values, so only the hit is added
+        self.write({"profile_url": url}, page)
+
+    def flush(self):
+        if not self.buffer or self.closed:
+            return
+        self.store.insert_batch(self.run_id, self.buffer)
+        self.buffer = []
+
+    def close(self):
+        if self.closed:
+            return
+        self.flush()
+        self.store.finish_run(self.run_id)
+        self.store.close()
+        self.closed = True
+        self.logger.info(f"Closed SQLite sink {self.filename} (run {self.run_id})")
+
+
+class MultiProfileSink(ProfileSink):
+    """Writes every profile to several sinks"""
+    def __init__(self, sinks):
+        self.sinks = sinks
+        self.filename = sinks[0].filename
+        self.rewrites_output = any(sink.rewrites_output for sink in sinks)
+
+    def write(self, profile, page=None):
+        for sink in self.sinks:
+            sink.write(profile, page)
+
+    def record_hit(self, url, page=None):
+        for sink in self.sinks:
+            sink.record_hit(url, page)
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        """Closes every sink, even when one fails; the first error is re-raised"""
+        error = None
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                error = error or e
+        if error:
+            raise error
+
+
+def profile_output_filename(query, mode="jsonl"):
+    """File the sink for the given mode writes to (the first part's file for combined modes)"""
+    mode = mode.split("+")[0]
+    if mode == "sqlite":
+        return DEFAULT_STORE_FILE
+    if mode == "jsonl":
+        return Utils.create_filename_from_query(query, extension="jsonl")
+    if mode == "json":
+        return Utils.create_filename_from_query(query)
+    raise ValueError(f"Unknown sink mode: {mode}")
+
+
+SINK_CLASSES = {"jsonl": JsonlProfileSink, "json": JsonArrayProfileSink, "sqlite": SqliteProfileSink}
+
+
+def _accepted_options(sink_class, options):
+    """The options the sink class's __init__ takes"""
+    parameters = inspect.signature(sink_class.__init__).parameters
+    return {name: value for name, value in options.items() if name in parameters}
+
+
+def create_profile_sink(query, mode="jsonl", resume=False, **kwargs):
+    """Creates an output sink for the given search query.
+    
+    mode is "jsonl", "json", "sqlite" or several of them joined with "+"
+    (e.g. "jsonl+sqlite"). resume appends to an existing JSONL output, keeps
+    the profiles of an existing JSON array output and continues the query's
+    unfinished SQLite run; without it an existing JSONL output is moved aside.
+    In a combined mode each sink gets only the options it takes (e.g.
+    keep_staging goes to the json sink only).
+    """
+    if "+" in mode:
+        parts = mode.split("+")
+        for part in parts:
+            if part not in SINK_CLASSES:
+                raise ValueError(f"Unknown sink mode: {part}")
+        unknown = set(kwargs).difference(*(_accepted_options(SINK_CLASSES[part], kwargs) for part in parts))
+        if unknown:
+            raise TypeError(f"No sink in mode {mode} takes the options: {', '.join(sorted(unknown))}")
+        return MultiProfileSink([
+            create_profile_sink(query, part, resume=resume, **_accepted_options(SINK_CLASSES[part], kwargs))
+            for part in parts
+        ])
+    if mode == "sqlite":
+        return SqliteProfileSink(query, resume=resume, **kwargs)
+    if mode == "jsonl":
+        return JsonlProfileSink(profile_output_filename(query, mode), resume=resume, **kwargs)
+    if mode == "json":
+        return JsonArrayProfileSink(profile_output_filename(query, mode), resume=resume, **kwargs)
+    raise ValueError(f"Unknown sink mode: {mode}")
@@ -0,0 +1,172 @@
+"""
+LinkedIn Bot - SQLite Profile Store Module
+
+Holds collected profiles across all runs together with their provenance
+(which query run and results page found them).
+
+Querying:
+python3 profile_store.py [--title T] [--location L] [--company C] [--query Q] [--db FILE]
+"""
+import argparse
+import json
+import sqlite3
+import time
+
+from profile_index import normalize_profile_url
+
+
+DEFAULT_STORE_FILE = "linkedin_profiles.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    profile_url TEXT NOT NULL,
+    name TEXT,
+    title TEXT COLLATE NOCASE,
+    location TEXT COLLATE NOCASE,
+    current_company TEXT COLLATE NOCASE,
+    first_seen REAL,
+    last_seen REAL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_profiles_url ON profiles(profile_url);
+CREATE INDEX IF NOT EXISTS idx_profiles_company ON profiles(current_company);
+CREATE INDEX IF NOT EXISTS idx_profiles_location ON profiles(location);
+
+CREATE TABLE IF NOT EXISTS query_runs (
+    id INTEGER PRIMARY KEY,
+    query TEXT NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    profile_count INTEGER DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_query_runs_query ON query_runs(query);
+
+CREATE TABLE IF NOT EXISTS profile_hits (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    run_id INTEGER NOT NULL REFERENCES query_runs(id),
+    page INTEGER,
+    PRIMARY KEY (profile_id, run_id)
+);
+CREATE INDEX IF NOT EXISTS idx_profile_hits_run ON profile_hits(run_id);
+"""
+
+UPSERT_PROFILE_SQL = """
+INSERT INTO profiles (profile_url, name, title, location, current_company, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(profile_url) DO UPDATE SET
+    name = COALESCE(NULLIF(excluded.name, ''), name),
+    title = COALESCE(NULLIF(excluded.title, ''), title),
+    location = COALESCE(NULLIF(excluded.location, ''), location),
+    current_company = COALESCE(NULLIF(excluded.current_company, ''), current_company),
+    last_seen = excluded.last_seen
+"""
+
+INSERT_HIT_SQL = """
+INSERT OR IGNORE INTO profile_hits (profile_id, run_id, page)
+SELECT id, ?, ? FROM profiles WHERE profile_url = ?
+"""
+
+
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL")
+
+
+class ProfileStore:
+    def __init__(self, filename=DEFAULT_STORE_FILE, synchronous="NORMAL"):
+        if synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(f"Unknown synchronous mode: {synchronous}")
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(f"PRAGMA synchronous={synchronous}")
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+    def start_run(self, query):
+        cursor = self.connection.execute(
+            "INSERT INTO query_runs (query, started_at) VALUES (?, ?)", (query, time.time())
+        )
+        self.connection.commit()
+        return cursor.lastrowid
+
+    def last_unfinished_run(self, query):
+        """ID of the latest run of the query that was never finished, or None"""
+        row = self.connection.execute(
+            "SELECT id FROM query_runs WHERE query = ? AND finished_at IS NULL ORDER BY id DESC LIMIT 1", (query,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def finish_run(self, run_id):
+        self.connection.execute(
+            """UPDATE query_runs SET finished_at = ?,
+               profile_count = (SELECT COUNT(*) FROM profile_hits WHERE run_id = ?)
+               WHERE id = ?""",
+            (time.time(), run_id, run_id)
+        )
+        self.connection.commit()
+
+    def insert_batch(self, run_id, profiles_with_pages):
+        """Stores a batch of (profile, page) pairs in one transaction"""
+        now = time.time()
+        rows = []
+        hits = []
+        for profile, page in profiles_with_pages:
+            url = normalize_profile_url(profile.get("profile_url"))
+            if not url:
+                continue
+            rows.append((url, profile.get("name", ""), profile.get("title", ""), profile.get("location", ""),
+                         profile.get("current_company", ""), now, now))
+            hits.append((run_id, page, url))
+
+        with self.connection:
+            self.connection.executemany(UPSERT_PROFILE_SQL, rows)
+            self.connection.executemany(INSERT_HIT_SQL, hits)
+
+    def find_profiles(self, title=None, location=None, company=None, query=None):
+        """Profiles matching all given filters.
+
+        location and company are prefix matches served by their indexes,
+        title is a substring match, query limits to profiles found by runs of
+        that search query.
+        """
+        conditions = []
+        params = []
+        if location:
+            conditions.append("p.location LIKE ?")
+            params.append(location + "%")
+        if company:
+            conditions.append("p.current_company LIKE ?")
+            params.append(company + "%")
+        if title:
+            conditions.append("p.title LIKE ?")
+            params.append("%" + title + "%")
+        if query:
+            conditions.append("""p.id IN (SELECT h.profile_id FROM profile_hits h
+                                 JOIN query_runs r ON r.id = h.run_id WHERE r.query = ?)""")
+            params.append(query)
+
+        sql = "SELECT p.profile_url, p.name, p.title, p.location, p.current_company FROM profiles p"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY p.name"
+        return [dict(row) for row in self.connection.execute(sql, params)]
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+
+# --- ENTRY POINT ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query collected LinkedIn profiles")
+    parser.add_argument("--db", default=DEFAULT_STORE_FILE)
+    parser.add_argument("--title")
+    parser.add_argument("--location")
+    parser.add_argument("--company")
+    parser.add_argument("--query")
+    args = parser.parse_args()
+
+    store = ProfileStore(args.db)
+    for profile in store.find_profiles(args.title, args.location, args.company, args.query):
+        print(json.dumps(profile, ensure_ascii=False))
+    store.close()
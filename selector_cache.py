@@ -0,0 +1,186 @@
+"""
+LinkedIn Bot - Selector Strategy Cache Module
+
+Remembers which selector strategy won for each page type, so that later
+lookups try the proven winner first instead of walking the fixed strategy
+list from the top. Instances are thread-safe, so the shared cache can be
+used by several driver threads at once.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+
+from logger_setup import LoggerSetup
+
+
+DEFAULT_CACHE_FILE = "selector_cache.json"
+
+
+class SelectorCache:
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, filename=DEFAULT_CACHE_FILE, persist=True):
+        self.filename = filename
+        # A non-persisting cache only reads the file; its owner merges it elsewhere
+        self.persist = persist
+        self.pages = {}
+        self.dirty = False
+        # Counters for the current run
+        self.hits = 0
+        self.misses = 0
+        self.saved_lookups = 0
+        self.lock = threading.RLock()
+        self.logger = LoggerSetup.get_logger("SelectorCache")
+        self.load()
+
+    @classmethod
+    def shared(cls, persist=True):
+        """Process-wide cache instance, saved automatically on exit.
+
+        persist only applies to the call that creates the instance.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(persist=persist)
+                atexit.register(cls._shared.save)
+            return cls._shared
+
+    def load(self):
+        if not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                self.pages = json.load(f).get("pages", {})
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable selector cache {self.filename}: {e}")
+            self.pages = {}
+
+    def save(self):
+        """Writes the cache atomically if anything changed"""
+        with self.lock:
+            if not self.dirty or not self.persist:
+                return
+            temp_filename = self.filename + ".tmp"
+            try:
+                with open(temp_filename, 'w', encoding='utf-8') as f:
+                    json.dump({"pages": self.pages}, f, ensure_ascii=False, indent=2)
+                os.replace(temp_filename, self.filename)
+                self.dirty = False
+            except OSError as e:
+                self.logger.warning(f"Failed to save selector cache: {e}")
+
+    def snapshot(self):
+        """Copy of everything learnt so far, for merge() in another process"""
+        with self.lock:
+            return json.loads(json.dumps(self.pages))
+
+    def merge(self, pages):
+        """Folds another cache's snapshot in, keeping the higher win counts"""
+        with self.lock:
+            for page_type, page in pages.items():
+                target = self._page(page_type)
+                for key, stats in page.get("strategies", {}).items():
+                    current = target["strategies"].setdefault(key, {"wins": 0, "last_win": 0})
+                    current["wins"] = max(current["wins"], stats["wins"])
+                    current["last_win"] = max(current["last_win"], stats["last_win"])
+                if page.get("discovered"):
+                    target["discovered"] = page["discovered"]
+            self.dirty = True
+
+    def _page(self, page_type):
+        return self.pages.setdefault(page_type, {"strategies": {}, "discovered": None})
+
+    def best(self, page_type):
+        """Key of the strategy that won most often for the page type"""
+        with self.lock:
+            strategies = self.pages.get(page_type, {}).get("strategies", {})
+            if not strategies:
+                return None
+            return max(strategies, key=lambda k: (strategies[k]["wins"], strategies[k]["last_win"]))
+
+    def order(self, page_type, candidates, key=None):
+        """Returns candidates with proven winners first, the rest in original order"""
+        key = key or (lambda candidate: candidate)
+        with self.lock:
+            strategies = {
+                k: dict(v) for k, v in self.pages.get(page_type, {}).get("strategies", {}).items()
+            }
+        if not strategies:
+            return list(candidates)
+
+        def rank(item):
+            index, candidate = item
+            stats = strategies.get(key(candidate))
+            if not stats:
+                return (1, 0, 0, index)
+            return (0, -stats["wins"], -stats["last_win"], index)
+
+        return [candidate for _, candidate in sorted(enumerate(candidates), key=rank)]
+
+    def record_win(self, page_type, candidate, candidates=None, key=None):
+        """Records the strategy that found the element.
+
+        A hit means the cached winner was tried first and succeeded. When
+        `candidates` (in their original order) is given, a hit also counts
+        the lookups the fixed order would have spent before reaching it.
+        """
+        key = key or (lambda c: c)
+        candidate_key = key(candidate)
+
+        with self.lock:
+            if self.best(page_type) == candidate_key:
+                self.hits += 1
+                if candidates is not None:
+                    self.saved_lookups += [key(c) for c in candidates].index(candidate_key)
+            else:
+                self.misses += 1
+
+            stats = self._page(page_type)["strategies"].setdefault(candidate_key, {"wins": 0, "last_win": 0})
+            stats["wins"] += 1
+            stats["last_win"] = time.time()
+            self.dirty = True
+
+    def record_failure(self, page_type):
+        """Records that no strategy matched"""
+        with self.lock:
+            self.misses += 1
+
+    def get_discovered(self, page_type):
+        """Previously discovered selectors for the page type, or None"""
+        with self.lock:
+            discovered = self.pages.get(page_type, {}).get("discovered")
+            if discovered:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return discovered
+
+    def set_discovered(self, page_type, selectors):
+        with self.lock:
+            self._page(page_type)["discovered"] = selectors
+            self.dirty = True
+
+    def invalidate(self, page_type):
+        """Forgets everything learnt about the page type"""
+        with self.lock:
+            if self.pages.pop(page_type, None) is not None:
+                self.dirty = True
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "saved_lookups": self.saved_lookups,
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        self.logger.info(
+            f"Selector cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%} hit rate), ~{stats['saved_lookups']} lookups saved"
+        )
@@ -0,0 +1,177 @@
+"""
+LinkedIn Bot - Session Persistence Module
+
+Saves cookies and localStorage after a successful login, encrypted at rest,
+and restores them into a fresh driver so the full login flow can be skipped.
+"""
+import json
+import os
+import threading
+import time
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:
+    Fernet = None
+    InvalidToken = Exception
+
+from logger_setup import LoggerSetup
+
+
+DEFAULT_SESSION_FILE = "linkedin_session.bin"
+DEFAULT_KEY_FILE = ".linkedin_session.key"
+SESSION_KEY_ENV = "LINKEDIN_SESSION_KEY"
+
+LINKEDIN_ORIGIN = "https://www.linkedin.com"
+# Cheap same-origin page used to get a document on the LinkedIn domain before
+# cookies and localStorage can be set
+COOKIE_PRIMING_URL = LINKEDIN_ORIGIN + "/robots.txt"
+VALIDATION_URL = LINKEDIN_ORIGIN + "/feed/"
+LOGGED_IN_MARKERS = ["/feed", "/in/", "mynetwork"]
+
+READ_LOCAL_STORAGE_SCRIPT = """
+const items = {};
+for (let i = 0; i < window.localStorage.length; i++) {
+    const key = window.localStorage.key(i);
+    items[key] = window.localStorage.getItem(key);
+}
+return items;
+"""
+
+WRITE_LOCAL_STORAGE_SCRIPT = """
+const items = arguments[0];
+for (const key of Object.keys(items)) {
+    window.localStorage.setItem(key, items[key]);
+}
+"""
+
+
+class SessionStore:
+    # Driver worker threads share the session and key files
+    _file_lock = threading.Lock()
+
+    def __init__(self, filename=DEFAULT_SESSION_FILE, key_file=DEFAULT_KEY_FILE, max_age_days=14):
+        self.filename = filename
+        self.key_file = key_file
+        self.max_age_seconds = max_age_days * 24 * 3600
+        self.logger = LoggerSetup.get_logger("SessionStore")
+
+    @property
+    def available(self):
+        return Fernet is not None
+
+    def _fernet(self):
+        """Encryption key from the environment, or a private key file created on first use"""
+        key = os.environ.get(SESSION_KEY_ENV)
+        if key:
+            return Fernet(key.encode())
+
+        with self._file_lock:
+            if not os.path.exists(self.key_file):
+                self._create_key_file()
+
+            with open(self.key_file, 'rb') as f:
+                return Fernet(f.read().strip())
+
+    def _create_key_file(self):
+        """Writes a new key and links it into place, so concurrent processes all end up with one complete key"""
+        temp_filename = f"{self.key_file}.{os.getpid()}.tmp"
+        fd = os.open(temp_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(Fernet.generate_key())
+        try:
+            os.link(temp_filename, self.key_file)
+        except FileExistsError:
+            pass  # Another process created it first - use that key
+        finally:
+            os.remove(temp_filename)
+
+    def save(self, driver):
+        """Stores cookies and localStorage of the current, logged-in driver"""
+        if not self.available:
+            self.logger.warning("cryptography is not installed - session will not be saved")
+            return False
+
+        try:
+            session = {
+                "saved_at": time.time(),
+                "cookies": driver.get_cookies(),
+                "local_storage": driver.execute_script(READ_LOCAL_STORAGE_SCRIPT) or {}
+            }
+            token = self._fernet().encrypt(json.dumps(session).encode('utf-8'))
+
+            with self._file_lock:
+                temp_filename = self.filename + ".tmp"
+                fd = os.open(temp_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(token)
+                os.replace(temp_filename, self.filename)
+
+            self.logger.info(f"Session saved ({len(session['cookies'])} cookies) to {self.filename}")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to save session: {e}")
+            return False
+
+    def load(self):
+        """Returns the decrypted session or None if missing, expired or unreadable"""
+        if not self.available or not os.path.exists(self.filename):
+            return None
+
+        try:
+            with open(self.filename, 'rb') as f:
+                session = json.loads(self._fernet().decrypt(f.read()))
+        except (InvalidToken, OSError, ValueError) as e:
+            self.logger.warning(f"Stored session is unreadable, ignoring it: {e}")
+            return None
+
+        if time.time() - session.get("saved_at", 0) > self.max_age_seconds:
+            self.logger.info("Stored session is too old, ignoring it")
+            return None
+
+        return session
+
+    def restore(self, driver):
+        """Restores the stored session into the driver and validates it.
+
+        Returns True when the driver ends up logged in.
+        """
+        session = self.load()
+        if not session:
+            return False
+
+        try:
+            driver.get(COOKIE_PRIMING_URL)
+
+            restored = 0
+            for cookie in session["cookies"]:
+                cookie = dict(cookie)
+                if "expiry" in cookie:
+                    cookie["expiry"] = int(cookie["expiry"])
+                if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                    cookie.pop("sameSite", None)
+                try:
+                    driver.add_cookie(cookie)
+                    restored += 1
+                except Exception as e:
+                    self.logger.debug(f"Skipping cookie {cookie.get('name')}: {e}")
+
+            if session.get("local_storage"):
+                driver.execute_script(WRITE_LOCAL_STORAGE_SCRIPT, session["local_storage"])
+
+            # One cheap navigation tells us if LinkedIn accepts the session
+            driver.get(VALIDATION_URL)
+            current_url = driver.current_url
+            if any(marker in current_url for marker in LOGGED_IN_MARKERS) and "login" not in current_url:
+                self.logger.info(f"Restored session with {restored} cookies - login skipped")
+                return True
+
+            self.logger.info(f"Stored session rejected (landed on {current_url})")
+        except Exception as e:
+            self.logger.warning(f"Failed to restore session: {e}")
+
+        return False
+
+    def clear(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
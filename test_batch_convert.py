@@ -0,0 +1,72 @@
+"""
+LinkedIn Bot - Parallel Batch Converter Tests
+"""
+import json
+import os
+
+from batch_convert import batch_convert, dedupe_by_output, expand_inputs, is_up_to_date
+
+
+def touch(path, mtime=None, names=("A",)):
+    path.write_text("".join(json.dumps({"name": name}) + "\n" for name in names), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def test_expand_inputs_handles_directories_globs_and_duplicates(tmp_path):
+    first = touch(tmp_path / "a_linkedin_profiles.json")
+    second = touch(tmp_path / "b_linkedin_profiles.jsonl")
+    touch(tmp_path / "notes.json")
+
+    files = expand_inputs([str(tmp_path), str(tmp_path / "*_profiles.json*"), first])
+
+    assert files == [first, second]
+
+
+def test_expand_inputs_keeps_missing_paths_for_error_reporting(tmp_path):
+    missing = str(tmp_path / "missing.json")
+
+    assert expand_inputs([missing]) == [missing]
+
+
+def test_dedupe_by_output_keeps_newest_input_per_output(tmp_path):
+    old_array = touch(tmp_path / "q_linkedin_profiles.json", mtime=1000)
+    new_jsonl = touch(tmp_path / "q_linkedin_profiles.jsonl", mtime=2000)
+    other = touch(tmp_path / "other.json", mtime=1000)
+
+    assert dedupe_by_output([old_array, new_jsonl, other]) == [new_jsonl, other]
+
+
+def test_is_up_to_date_compares_output_and_input_mtimes(tmp_path):
+    source = touch(tmp_path / "q.jsonl", mtime=2000)
+    assert not is_up_to_date(source, "csv")
+
+    touch(tmp_path / "q.csv", mtime=1000)
+    assert not is_up_to_date(source, "csv")
+
+    touch(tmp_path / "q.csv", mtime=3000)
+    assert is_up_to_date(source, "csv")
+
+
+def test_batch_convert_skips_up_to_date_outputs_unless_forced(tmp_path):
+    first = touch(tmp_path / "a_linkedin_profiles.jsonl", names=("A", "B"))
+    second = touch(tmp_path / "b_linkedin_profiles.jsonl", names=("C",))
+
+    results = batch_convert([str(tmp_path)], formats=("csv",), workers=2)
+    assert sorted((result["file"], result["rows"], result["error"]) for result in results) == [
+        (first, 2, None), (second, 1, None)
+    ]
+
+    assert batch_convert([str(tmp_path)], formats=("csv",), workers=2) == []
+    assert len(batch_convert([str(tmp_path)], formats=("csv",), workers=2, force=True)) == 2
+
+
+def test_batch_convert_reports_failed_files(tmp_path):
+    broken = tmp_path / "broken_linkedin_profiles.json"
+    broken.write_text('[{"name": "A"}', encoding="utf-8")
+
+    [result] = batch_convert([str(broken)], formats=("csv",), workers=1)
+
+    assert result["rows"] == 0
+    assert "JSON" in result["error"]
@@ -0,0 +1,279 @@
+"""
+LinkedIn Bot - Comment Deletion Module Tests
+"""
+from unittest import mock
+
+import pytest
+
+import login
+
+# Config holds the account settings and is not part of the repository
+if not hasattr(login, "Config"):
+    login.Config = type("Config", (), {"AUTOR": "Damian", "COMMENTS_URL": "https://www.linkedin.com/comments/"})
+
+from delete_comments import ARTICLE_SELECTORS, COMMENT_HARVEST_SCRIPT, COMMENT_LOOKUP_SCRIPT, LinkedInCommentHandler
+from deletion_ledger import DeletionLedger
+from login import Utils
+from selector_cache import SelectorCache
+
+
+@pytest.fixture
+def handler(tmp_path, monkeypatch):
+    monkeypatch.setattr(Utils, "random_delay", staticmethod(lambda *args, **kwargs: None))
+    ledger = DeletionLedger(str(tmp_path / "deletion_ledger.sqlite3"))
+    # Comments found by an earlier run and not deleted yet
+    ledger.start_run()
+    ledger.filter_new({"1", "2"})
+    ledger.finish_run()
+
+    handler = LinkedInCommentHandler(
+        mock.MagicMock(),
+        selector_cache=SelectorCache(filename=str(tmp_path / "selector_cache.json"), persist=False),
+        ledger=ledger
+    )
+    handler.load_all_pages = lambda: True
+    handler.find_comments_container = lambda: mock.MagicMock()
+    handler.delete_comments_with_retry = mock.Mock()
+    return handler
+
+
+def test_empty_harvest_keeps_pending_comments(handler):
+    # No article selector matched
+    handler.driver.execute_script.return_value = {"articleSelector": -1, "comments": []}
+
+    handler.find_and_delete_comments()
+
+    assert not handler.listing_complete
+    assert handler.ledger.pending_ids() == {"1", "2"}
+    handler.delete_comments_with_retry.assert_called_once_with({"1", "2"})
+
+
+def comment_states(ledger):
+    return dict(ledger.connection.execute("SELECT comment_id, state FROM comments"))
+
+
+def test_complete_listing_settles_pending_comments_not_listed_as_the_authors(handler):
+    # Comment 1 is listed but its author no longer matches; comment 2 is gone
+    handler.driver.execute_script.return_value = {"articleSelector": 0, "comments": [
+        {"author": "Someone Else", "id": "1", "actorSelector": 0},
+        {"author": "Damian", "id": "3", "actorSelector": 0},
+    ]}
+
+    handler.find_and_delete_comments()
+
+    assert handler.listing_complete
+    assert comment_states(handler.ledger) == {"1": "skipped", "2": "deleted", "3": "found"}
+    handler.delete_comments_with_retry.assert_called_once_with({"3"})
+
+
+def test_skipped_comment_listed_as_the_authors_again_is_reopened(handler):
+    handler.ledger.mark_skipped("1", reason="listed under another author")
+    assert handler.ledger.pending_ids() == {"2"}
+
+    handler.ledger.filter_new({"1"})
+
+    assert handler.ledger.pending_ids() == {"1", "2"}
+
+
+def serve_comments(handler, comments, fail_ids=()):
+    """Fakes a comments page: each load lists the comments not deleted yet, all in the first batch"""
+    page = {"unseen": True}
+
+    def load_page(url):
+        page["unseen"] = True
+
+    def harvest(container, only_unseen=False):
+        records = comments if page["unseen"] else []
+        page["unseen"] = False
+        return [dict(record) for record in records]
+
+    def delete(comment_id):
+        if comment_id in fail_ids:
+            handler.last_failure_reason = "options button not found"
+            return False
+        comments[:] = [record for record in comments if record["id"] != comment_id]
+        return True
+
+    handler.driver.get.side_effect = load_page
+    handler.harvest_comment_records = harvest
+    handler.delete_comment_by_id = mock.Mock(side_effect=delete)
+    handler.find_load_more_button = lambda: None
+
+
+def test_streaming_settles_old_pending_comments_and_retries_only_its_failures(handler):
+    serve_comments(handler, [
+        {"author": "Someone Else", "id": "1"},
+        {"author": "Damian", "id": "3"},
+        {"author": "Damian", "id": "4"},
+    ], fail_ids={"4"})
+
+    handler.find_and_delete_comments(streaming=True)
+
+    # The second pass deleted nothing, so its listing is complete
+    assert handler.listing_complete
+    assert comment_states(handler.ledger) == {"1": "skipped", "2": "deleted", "3": "deleted", "4": "failed"}
+    handler.delete_comments_with_retry.assert_called_once_with({"4"})
+
+
+def test_streaming_leaves_old_pending_comments_when_loading_fails(handler):
+    serve_comments(handler, [{"author": "Damian", "id": "3"}])
+    handler.find_load_more_button = lambda: mock.MagicMock()
+    handler.driver.execute_script.side_effect = Exception("click intercepted")
+
+    handler.find_and_delete_comments(streaming=True)
+
+    assert not handler.listing_complete
+    assert comment_states(handler.ledger) == {"1": "found", "2": "found", "3": "deleted"}
+    handler.delete_comments_with_retry.assert_not_called()
+
+
+def serve_batches(handler, batches):
+    """Fakes lazy loading: each harvest returns the next batch of newly loaded comments"""
+    batches = list(batches)
+
+    def harvest(container, only_unseen=False):
+        return [dict(record) for record in batches.pop(0)] if batches else []
+
+    handler.harvest_comment_records = harvest
+    handler.delete_comment_by_id = mock.Mock(return_value=True)
+    handler.find_load_more_button = lambda: None
+
+
+def test_streaming_harvests_the_batch_loaded_by_the_final_scroll(handler):
+    serve_batches(handler, [[{"author": "Damian", "id": "3"}], [{"author": "Damian", "id": "4"}]])
+
+    assert handler.stream_delete_comments(max_passes=1) == set()
+
+    assert [call.args[0] for call in handler.delete_comment_by_id.call_args_list] == ["3", "4"]
+
+
+def test_streaming_stops_the_pass_when_loading_fails(handler):
+    serve_batches(handler, [[{"author": "Damian", "id": "3"}], [{"author": "Damian", "id": "4"}]])
+    handler.find_load_more_button = lambda: mock.MagicMock()
+    handler.driver.execute_script.side_effect = Exception("click intercepted")
+
+    handler.stream_delete_comments(max_passes=1)
+
+    assert handler.load_failed
+    handler.delete_comment_by_id.assert_called_once_with("3")
+
+
+def test_harvest_reads_every_article_in_one_script_call(handler):
+    handler.driver.execute_script.return_value = {"articleSelector": 1, "comments": [
+        {"author": "Damian\nAuthor", "id": "3", "actorSelector": 0},
+        {"author": "Someone Else", "id": "4", "actorSelector": 0},
+        {"author": None, "id": None, "actorSelector": -1},
+    ]}
+
+    records = handler.harvest_comment_records("container")
+
+    assert records == [
+        {"author": "Damian\nAuthor", "id": "3"},
+        {"author": "Someone Else", "id": "4"},
+        {"author": "", "id": None},
+    ]
+    handler.driver.execute_script.assert_called_once()
+    assert handler.driver.execute_script.call_args.args[:2] == (COMMENT_HARVEST_SCRIPT, "container")
+    assert handler.selector_cache.best("comments:articles") == ARTICLE_SELECTORS[1]
+
+
+def test_failed_harvest_script_falls_back_to_per_element_lookups(handler):
+    handler.driver.execute_script.side_effect = Exception("javascript error")
+    handler.gather_comment_ids_per_element = mock.Mock(return_value={"3"})
+
+    assert handler.gather_damian_comment_ids() == {"3"}
+    assert not handler.listing_complete
+
+
+def test_article_is_looked_up_in_the_comment_index(handler):
+    article = mock.MagicMock()
+    handler.driver.execute_script.return_value = article
+
+    assert handler.find_article_by_id("3") is article
+    assert handler.driver.execute_script.call_args.args == (COMMENT_LOOKUP_SCRIPT, "3", ARTICLE_SELECTORS)
+    handler.driver.find_element.assert_not_called()
+
+
+def test_article_missing_from_the_index_is_found_by_selector(handler):
+    article = mock.MagicMock()
+    handler.driver.execute_script.side_effect = Exception("javascript error")
+    handler.driver.find_element.return_value = article
+
+    assert handler.find_article_by_id("3") is article
+    assert "'3'" in handler.driver.find_element.call_args.args[1]
+
+
+@pytest.fixture
+def retry_handler(handler):
+    # Use the real retry loop on comment 3, found by this run
+    del handler.delete_comments_with_retry
+    handler.ledger.filter_new({"3"})
+    handler.reload_comments_page = mock.Mock(return_value=False)
+    return handler
+
+
+def failing_deletes(handler, reasons):
+    """delete_comment_by_id failing with the given reasons, then succeeding"""
+    reasons = list(reasons)
+
+    def delete(comment_id):
+        if reasons:
+            handler.last_failure_reason = reasons.pop(0)
+            return False
+        return True
+
+    handler.delete_comment_by_id = mock.Mock(side_effect=delete)
+
+
+def test_stalled_rounds_are_retried_in_place_before_reloading(retry_handler):
+    failing_deletes(retry_handler, ["options button not found"] * 3)
+
+    retry_handler.delete_comments_with_retry({"3"}, max_stalled_rounds=2)
+
+    # Two stalled rounds, a reload, one more failure, then success
+    assert retry_handler.delete_comment_by_id.call_count == 4
+    retry_handler.reload_comments_page.assert_called_once_with()
+    assert comment_states(retry_handler.ledger)["3"] == "deleted"
+
+
+def test_missing_article_reloads_after_a_round_that_deletes_nothing(retry_handler):
+    failing_deletes(retry_handler, ["article not found"])
+
+    retry_handler.delete_comments_with_retry({"3"}, max_stalled_rounds=2)
+
+    assert retry_handler.delete_comment_by_id.call_count == 2
+    retry_handler.reload_comments_page.assert_called_once_with()
+    assert comment_states(retry_handler.ledger)["3"] == "deleted"
+
+
+def test_retries_give_up_after_max_reloads(retry_handler):
+    failing_deletes(retry_handler, ["article not found"] * 10)
+
+    retry_handler.delete_comments_with_retry({"3"}, max_reloads=2)
+
+    assert retry_handler.reload_comments_page.call_count == 2
+    assert retry_handler.delete_comment_by_id.call_count == 3
+    assert comment_states(retry_handler.ledger)["3"] == "failed"
+
+
+def test_complete_reload_records_unlisted_comments_as_deleted(retry_handler):
+    failing_deletes(retry_handler, ["article not found"] * 10)
+    retry_handler.reload_comments_page.return_value = True
+    # Comment 3 is not listed after the reload
+    retry_handler.driver.execute_script.return_value = {"articleSelector": 0, "comments": [
+        {"author": "Damian", "id": "5", "actorSelector": 0},
+    ]}
+
+    retry_handler.delete_comments_with_retry({"3"})
+
+    assert retry_handler.delete_comment_by_id.call_count == 1
+    assert tuple(retry_handler.ledger.connection.execute(
+        "SELECT state, reason FROM comments WHERE comment_id = '3'"
+    ).fetchone()) == ("deleted", "no longer listed")
+
+
+def test_unreadable_listing_after_reload_keeps_the_comments(retry_handler):
+    retry_handler.driver.execute_script.return_value = {"articleSelector": -1, "comments": []}
+
+    assert retry_handler.drop_unlisted({"3"}) == {"3"}
+    assert comment_states(retry_handler.ledger)["3"] == "found"
@@ -0,0 +1,82 @@
+"""
+LinkedIn Bot - Incremental Export State Module Tests
+"""
+import json
+
+import pytest
+
+from export_state import DeltaReader, ExportState
+
+
+def write_jsonl(path, names, mode='w'):
+    with open(path, mode, encoding='utf-8') as f:
+        for name in names:
+            f.write(json.dumps({"name": name}) + "\n")
+
+
+def write_array(path, names):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump([{"name": name} for name in names], f, indent=2)
+
+
+def export(source, output):
+    """Reads the delta of source like a converter would and saves the state"""
+    output.write_text("exported", encoding="utf-8")
+    reader = DeltaReader(str(source), ExportState.load(str(output)))
+    verified = reader.verify()
+    names = [record["name"] for record in reader]
+    state = ExportState.load(str(output)) or ExportState(str(output))
+    state.update(reader)
+    return verified, names
+
+
+@pytest.fixture(params=["jsonl", "array"])
+def source(request, tmp_path):
+    path = tmp_path / ("profiles.jsonl" if request.param == "jsonl" else "profiles.json")
+
+    def write(names, append=False):
+        if request.param == "jsonl":
+            write_jsonl(path, names[-1:] if append else names, 'a' if append else 'w')
+        else:
+            write_array(path, names)
+    write.path = path
+    return write
+
+
+def test_unchanged_source_yields_nothing(source, tmp_path):
+    source(["a", "b"])
+    assert export(source.path, tmp_path / "profiles.csv") == (False, ["a", "b"])
+
+    assert export(source.path, tmp_path / "profiles.csv") == (True, [])
+
+
+def test_appended_records_yield_only_the_delta(source, tmp_path):
+    source(["a", "b"])
+    export(source.path, tmp_path / "profiles.csv")
+
+    source(["a", "b", "c"], append=True)
+
+    assert export(source.path, tmp_path / "profiles.csv") == (True, ["c"])
+
+
+def test_rewritten_source_is_read_again_in_full(source, tmp_path):
+    source(["a", "b"])
+    export(source.path, tmp_path / "profiles.csv")
+
+    source(["x", "b", "c"])
+
+    assert export(source.path, tmp_path / "profiles.csv") == (False, ["x", "b", "c"])
+
+
+def test_jsonl_line_still_being_written_is_left_for_next_run(tmp_path):
+    source = tmp_path / "profiles.jsonl"
+    write_jsonl(source, ["a"])
+    with open(source, 'a', encoding='utf-8') as f:
+        f.write('{"name": "b"')
+
+    assert export(source, tmp_path / "profiles.csv") == (False, ["a"])
+
+    with open(source, 'a', encoding='utf-8') as f:
+        f.write('}\n')
+
+    assert export(source, tmp_path / "profiles.csv") == (True, ["b"])
@@ -0,0 +1,172 @@
+"""
+LinkedIn Bot - People Search Module Tests
+"""
+import json
+import os
+from unittest import mock
+
+import pytest
+
+import find_people
+from find_people import LAST_PAGE, NAVIGATION_FAILED, NEXT_PAGE, LinkedInPeopleSearchHandler
+from login import Utils
+from profile_index import ProfileIndex
+from profile_parser import profile_from_card_record
+from profile_store import DEFAULT_STORE_FILE, ProfileStore
+from selector_cache import SelectorCache
+
+
+class ListSink:
+    filename = "test_output.jsonl"
+
+    def __init__(self):
+        self.profiles = []
+
+    def write(self, profile, page=None):
+        self.profiles.append(profile)
+
+    def record_hit(self, url, page=None):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def handler(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Utils, "random_delay", staticmethod(lambda *args, **kwargs: None))
+    driver = mock.MagicMock()
+    driver.current_url = "https://www.linkedin.com/search/results/people/?keywords=security"
+    handler = LinkedInPeopleSearchHandler(
+        driver, "security engineer", sink=ListSink(),
+        selector_cache=SelectorCache(filename=str(tmp_path / "selector_cache.json"))
+    )
+    handler.search_people = lambda query: True
+    handler.get_total_pages = lambda: 5
+    pages = iter(range(1, 101))
+
+    def process_page():
+        page = next(pages)
+        handler.page_card_count = 1
+        profile = {"name": f"Person {page}", "title": "Engineer",
+                   "profile_url": f"https://www.linkedin.com/in/person-{page}"}
+        handler.emit_profile(profile)
+        return [profile]
+
+    handler.process_search_results_page = process_page
+    return handler
+
+
+def test_last_page_before_estimate_completes_crawl(handler):
+    handler.navigate_to_next_page = mock.Mock(side_effect=[NEXT_PAGE, LAST_PAGE])
+
+    profiles = handler.search_and_collect_profiles()
+
+    assert [profile["name"] for profile in profiles] == ["Person 1", "Person 2"]
+    assert handler.crawl_completed
+    assert handler.total_card_count == 2
+    assert not os.path.exists(handler.checkpoint.filename)
+
+
+def test_navigation_failure_keeps_checkpoint(handler):
+    handler.navigate_to_next_page = mock.Mock(side_effect=[NEXT_PAGE, NAVIGATION_FAILED])
+
+    handler.search_and_collect_profiles()
+
+    assert not handler.crawl_completed
+    checkpoint = find_people.CrawlCheckpoint.load("security engineer")
+    assert checkpoint is not None
+    assert checkpoint.last_completed_page == 2
+
+
+def test_stale_cached_selectors_are_rediscovered(handler, monkeypatch):
+    handler.selector_cache.set_discovered("people_search", {
+        "profile": "li.old-card", "title": None, "location": None, "summary": None
+    })
+    monkeypatch.setattr(Utils, "wait_and_find_element", staticmethod(lambda *args, **kwargs: mock.MagicMock()))
+    card = mock.MagicMock()
+    card.get_attribute.return_value = "new-card"
+    card.find_elements.return_value = []
+    handler.driver.find_elements.side_effect = lambda by, selector: [] if selector == "li.old-card" else [card]
+
+    assert handler.discover_selectors()
+
+    assert not handler.selectors_from_cache
+    assert handler.discovered_profile_selector == "li.new-card"
+    assert handler.selector_cache.get_discovered("people_search")["profile"] == "li.new-card"
+
+
+def test_script_path_skips_known_profiles_before_extraction(handler, tmp_path, monkeypatch):
+    index = ProfileIndex(str(tmp_path / "profile_index.sqlite3"))
+    index.record({"profile_url": "https://www.linkedin.com/in/known/"}, "earlier query", "new")
+    index.commit()
+    handler.profile_index = index
+    card = {"text": "Engineer", "has_link": True, "name_text": "Someone", "title_texts": ["Engineer"]}
+    handler.driver.execute_script.return_value = [
+        dict(card, href="https://www.linkedin.com/in/known?miniProfileUrn=1"),
+        dict(card, href="https://www.linkedin.com/in/new-person"),
+    ]
+    extracted = []
+    monkeypatch.setattr(find_people, "profile_from_card_record",
+                        lambda record: extracted.append(record["href"]) or profile_from_card_record(record))
+
+    profiles = handler.extract_profiles_with_script()
+
+    assert extracted == ["https://www.linkedin.com/in/new-person"]
+    assert [profile["profile_url"] for profile in profiles] == ["https://www.linkedin.com/in/new-person"]
+    assert handler.known_card_count == 1
+
+
+def run_search(tmp_path, slugs, query="security engineer", sink_mode="json"):
+    driver = mock.MagicMock()
+    driver.current_url = "https://www.linkedin.com/search/results/people/?keywords=security"
+    handler = LinkedInPeopleSearchHandler(
+        driver, query, sink_mode=sink_mode,
+        selector_cache=SelectorCache(filename=str(tmp_path / "selector_cache.json")),
+        profile_index=ProfileIndex(str(tmp_path / "profile_index.sqlite3")), skip_known=True
+    )
+    handler.search_people = lambda query: True
+    handler.get_total_pages = lambda: 1
+
+    def process_page():
+        handler.init_json_file()
+        handler.page_card_count = len(slugs)
+        return [profile for profile in (
+            {"name": slug, "title": "Engineer", "profile_url": f"https://www.linkedin.com/in/{slug}"}
+            for slug in slugs
+        ) if handler.emit_profile(profile)]
+
+    handler.process_search_results_page = process_page
+    handler.navigate_to_next_page = mock.Mock(return_value=LAST_PAGE)
+    handler.search_and_collect_profiles()
+    return handler.json_filename
+
+
+def test_rerun_into_json_array_keeps_known_profiles(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Utils, "random_delay", staticmethod(lambda *args, **kwargs: None))
+
+    run_search(tmp_path, ["a", "b"])
+    filename = run_search(tmp_path, ["a", "b", "c"])
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        assert [profile["name"] for profile in json.load(f)] == ["a", "b", "c"]
+
+
+def test_overlapping_queries_record_provenance_of_known_profiles(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Utils, "random_delay", staticmethod(lambda *args, **kwargs: None))
+
+    run_search(tmp_path, ["a", "b"], query="security engineer", sink_mode="sqlite")
+    run_search(tmp_path, ["b", "c"], query="devops engineer", sink_mode="sqlite")
+
+    store = ProfileStore(DEFAULT_STORE_FILE)
+    found = [profile["name"] for profile in store.find_profiles(query="devops engineer")]
+    counts = dict(store.connection.execute("SELECT query, profile_count FROM query_runs").fetchall())
+    store.close()
+    assert found == ["b", "c"]
+    assert counts == {"security engineer": 2, "devops engineer": 2}
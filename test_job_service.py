@@ -0,0 +1,64 @@
+"""
+LinkedIn Bot - Job Service Module Tests
+"""
+import time
+from argparse import Namespace
+
+import login
+
+# Config holds the account settings and is not part of the repository
+if not hasattr(login, "Config"):
+    login.Config = type("Config", (), {"AUTOR": "Damian", "COMMENTS_URL": "https://www.linkedin.com/comments/"})
+
+from job_service import JobService
+
+
+def make_service(keep_finished=2, finished_ttl=3600):
+    return JobService(Namespace(workers=0, keep_finished=keep_finished, finished_ttl=finished_ttl))
+
+
+def finish(job, status="succeeded", finished_at=None):
+    job.status = status
+    job.finished_at = finished_at or time.time()
+
+
+def test_oldest_finished_jobs_beyond_limit_are_dropped():
+    service = make_service(keep_finished=2)
+    jobs = [service.submit({"action": "find-people", "query": str(i)}) for i in range(4)]
+    for offset, job in enumerate(jobs[:3]):
+        finish(job, finished_at=time.time() - 10 + offset)
+
+    listed = [job["id"] for job in service.list_jobs()]
+
+    assert listed == [jobs[1].id, jobs[2].id, jobs[3].id]
+
+
+def test_expired_finished_and_cancelled_jobs_are_dropped():
+    service = make_service(keep_finished=10, finished_ttl=60)
+    expired = service.submit({"action": "delete-comments"})
+    service.cancel(expired.id)
+    expired.finished_at -= 120
+    running = service.submit({"action": "find-people", "query": "q"})
+    running.status = "running"
+    recent = service.submit({"action": "find-people", "query": "r"})
+    finish(recent, "failed")
+
+    service.submit({"action": "delete-comments"})
+
+    assert service.get(expired.id) is None
+    assert service.get(running.id) is running
+    assert service.get(recent.id) is recent
+
+
+def test_cancel_and_claim_exclude_each_other():
+    service = make_service()
+    cancelled = service.submit({"action": "delete-comments"})
+    claimed = service.submit({"action": "delete-comments"})
+
+    assert service.cancel(cancelled.id)
+    assert not service.claim(cancelled, "driver-worker-1")
+    assert cancelled.status == "cancelled"
+
+    assert service.claim(claimed, "driver-worker-1")
+    assert not service.cancel(claimed.id)
+    assert claimed.status == "running" and claimed.worker == "driver-worker-1"
@@ -0,0 +1,63 @@
+"""
+LinkedIn Bot - Streaming JSON Reader Module Tests
+"""
+import json
+
+import pytest
+
+from json_stream import iter_json_array, iter_records
+
+
+CHUNK_SIZES = [1, 2, 3, 5, 64]
+
+
+def write(tmp_path, content):
+    path = tmp_path / "profiles.json"
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_numbers_split_at_chunk_boundaries(tmp_path, chunk_size):
+    filename = write(tmp_path, "[1e5, -12.5E-3,0, 123456789, true, null]")
+
+    assert list(iter_json_array(filename, chunk_size)) == [1e5, -12.5e-3, 0, 123456789, True, None]
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_strings_containing_separators(tmp_path, chunk_size):
+    records = [
+        {"name": "Kowalski, Jan", "title": "Engineer ]["},
+        {"name": "Zażółć \"gęślą\" jaźń", "nested": {"list": [1, "]", ","], "empty": {}}},
+        "], [",
+        [],
+    ]
+    filename = write(tmp_path, json.dumps(records, ensure_ascii=False, indent=2))
+
+    assert list(iter_json_array(filename, chunk_size)) == records
+
+
+@pytest.mark.parametrize("content", ["[]", "[ ]", "  \n[\n\t]\n", "\ufeff[]"])
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_empty_arrays(tmp_path, content, chunk_size):
+    assert list(iter_json_array(write(tmp_path, content), chunk_size)) == []
+
+
+@pytest.mark.parametrize("content", ["", "   ", "{}", "[1, 2", "[1 2]", '["open'])
+def test_malformed_arrays_raise(tmp_path, content):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(write(tmp_path, content), chunk_size=2))
+
+
+@pytest.mark.parametrize("content", ["[,1]", "[1,]", "[1,,2]", "[1, ,2]", "[ , ]", "[1,\n]", "[{}, ]"])
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_misplaced_commas_raise(tmp_path, content, chunk_size):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(write(tmp_path, content), chunk_size))
+
+
+def test_iter_records_detects_jsonl(tmp_path):
+    path = tmp_path / "profiles.jsonl"
+    path.write_text('{"name": "A"}\n\n{"name": "B"}\n', encoding="utf-8")
+
+    assert [record["name"] for record in iter_records(str(path))] == ["A", "B"]
@@ -0,0 +1,68 @@
+"""
+LinkedIn Bot - JSON to CSV Converter Tests
+"""
+import csv
+import json
+
+from json_to_csv import json_to_csv
+
+
+def append_jsonl(path, records):
+    with open(path, 'a', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def read_csv(path):
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def test_incremental_export_appends_only_new_records(tmp_path):
+    source = tmp_path / "profiles.jsonl"
+    append_jsonl(source, [{"name": "A", "title": "Engineer"}, {"name": "B", "title": "Analyst"}])
+    assert json_to_csv(str(source), incremental=True) == 2
+
+    assert json_to_csv(str(source), incremental=True) == 0
+
+    append_jsonl(source, [{"name": "C", "title": "Manager"}])
+    assert json_to_csv(str(source), incremental=True) == 1
+    assert [row["name"] for row in read_csv(tmp_path / "profiles.csv")] == ["A", "B", "C"]
+
+
+def test_incremental_export_rebuilds_rewritten_source(tmp_path):
+    source = tmp_path / "profiles.json"
+    source.write_text(json.dumps([{"name": "A"}, {"name": "B"}]), encoding='utf-8')
+    json_to_csv(str(source), incremental=True)
+
+    source.write_text(json.dumps([{"name": "X"}, {"name": "B"}, {"name": "C"}]), encoding='utf-8')
+
+    assert json_to_csv(str(source), incremental=True) == 3
+    assert [row["name"] for row in read_csv(tmp_path / "profiles.csv")] == ["X", "B", "C"]
+
+
+def test_incremental_export_rebuilds_when_new_columns_appear(tmp_path):
+    source = tmp_path / "profiles.jsonl"
+    append_jsonl(source, [{"name": "A", "title": "Engineer"}])
+    json_to_csv(str(source), incremental=True)
+
+    append_jsonl(source, [{"name": "B", "title": "Analyst", "location": "Kraków"}])
+
+    assert json_to_csv(str(source), incremental=True) == 2
+    rows = read_csv(tmp_path / "profiles.csv")
+    assert list(rows[0]) == ["name", "title", "location"]
+    assert rows[1] == {"name": "B", "title": "Analyst", "location": "Kraków"}
+
+    append_jsonl(source, [{"name": "C", "title": "Manager"}])
+    assert json_to_csv(str(source), incremental=True) == 1
+
+
+def test_fixed_fields_keep_appending_without_extra_keys(tmp_path):
+    source = tmp_path / "profiles.jsonl"
+    append_jsonl(source, [{"name": "A"}])
+    json_to_csv(str(source), fieldnames=["name"], incremental=True)
+
+    append_jsonl(source, [{"name": "B", "location": "Kraków"}])
+
+    assert json_to_csv(str(source), fieldnames=["name"], incremental=True) == 1
+    assert read_csv(tmp_path / "profiles.csv") == [{"name": "A"}, {"name": "B"}]
@@ -0,0 +1,68 @@
+"""
+LinkedIn Bot - JSON to Parquet Converter Tests
+"""
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from json_to_parquet import json_to_parquet, query_from_filename
+from json_to_xml import FIELD_ORDER
+
+
+PROFILES = [
+    {"name": "A", "title": "Engineer", "location": "Kraków", "current_company": "Acme", "profile_url": "u/a"},
+    {"name": "B", "title": "Engineer", "location": "Kraków", "profile_url": "u/b", "extra": "ignored"},
+    {"name": "C", "title": "Analyst", "location": "Warszawa", "current_company": "Acme", "profile_url": "u/c"},
+]
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "security_engineer_linkedin_profiles.jsonl"
+    path.write_text("".join(json.dumps(profile) + "\n" for profile in PROFILES), encoding="utf-8")
+    return str(path)
+
+
+def test_writes_profile_columns_with_query_and_collection_time(source):
+    collected_at = datetime.fromtimestamp(os.path.getmtime(source), tz=timezone.utc)
+
+    assert json_to_parquet(source, batch_size=2) == 3
+
+    table = pq.read_table(os.path.splitext(source)[0] + ".parquet")
+    assert table.column_names == FIELD_ORDER + ["query", "collected_at"]
+    assert table.column("name").to_pylist() == ["A", "B", "C"]
+    assert table.column("current_company").to_pylist() == ["Acme", None, "Acme"]
+    assert set(table.column("query").to_pylist()) == {"security engineer"}
+
+    metadata = table.schema.metadata
+    assert metadata[b"query"] == b"security engineer"
+    assert metadata[b"source_file"] == os.path.basename(source).encode()
+    assert metadata[b"collected_at"] == collected_at.isoformat().encode()
+    assert table.column("collected_at")[0].as_py() == collected_at.replace(microsecond=0)
+
+
+def test_text_columns_are_dictionary_encoded(source):
+    json_to_parquet(source, query="custom query")
+
+    parquet_file = pq.ParquetFile(os.path.splitext(source)[0] + ".parquet")
+    columns = parquet_file.metadata.row_group(0)
+    for index, field in enumerate(FIELD_ORDER + ["query"]):
+        assert any("DICTIONARY" in encoding for encoding in columns.column(index).encodings), field
+    assert parquet_file.schema_arrow.metadata[b"query"] == b"custom query"
+
+
+def test_query_from_filename():
+    assert query_from_filename("/data/devops_engineer_linkedin_profiles.json") == "devops engineer"
+    assert query_from_filename("export.jsonl") == "export"
+
+
+def test_invalid_json_leaves_no_output(tmp_path):
+    source = tmp_path / "broken.json"
+    source.write_text('[{"name": "A"},', encoding="utf-8")
+
+    assert json_to_parquet(str(source)) is None
+    assert sorted(os.listdir(tmp_path)) == ["broken.json"]
@@ -0,0 +1,66 @@
+"""
+LinkedIn Bot - JSON to XLSX Converter Tests
+"""
+import json
+
+from openpyxl import load_workbook
+
+from json_to_xml import FIELD_ORDER, json_to_xlsx
+
+
+def append_jsonl(path, names):
+    with open(path, 'a', encoding='utf-8') as f:
+        for name in names:
+            f.write(json.dumps({"name": name, "title": "Engineer"}) + "\n")
+
+
+def sheet_rows(xlsx_filename):
+    wb = load_workbook(xlsx_filename, read_only=True)
+    rows = {ws.title: [list(row) for row in ws.iter_rows(values_only=True)] for ws in wb.worksheets}
+    wb.close()
+    return rows
+
+
+def test_incremental_export_adds_delta_sheet(tmp_path):
+    source = tmp_path / "profiles.jsonl"
+    xlsx_filename = str(tmp_path / "profiles.xlsx")
+    append_jsonl(source, ["A", "B"])
+    assert json_to_xlsx(str(source), incremental=True) == 2
+
+    assert json_to_xlsx(str(source), incremental=True) == 0
+
+    append_jsonl(source, ["C", "D", "E"])
+    assert json_to_xlsx(str(source), incremental=True) == 3
+
+    sheets = sheet_rows(xlsx_filename)
+    assert list(sheets)[0] == "Data"
+    assert len(sheets) == 2 and list(sheets)[1].startswith("Nowe ")
+    data, delta = sheets.values()
+    assert data[0] == FIELD_ORDER and [row[0] for row in data[1:]] == ["A", "B"]
+    assert delta[0] == FIELD_ORDER and [row[0] for row in delta[1:]] == ["C", "D", "E"]
+
+
+def test_second_delta_gets_its_own_sheet_and_rollover(tmp_path):
+    source = tmp_path / "profiles.jsonl"
+    append_jsonl(source, ["A"])
+    json_to_xlsx(str(source), incremental=True)
+    append_jsonl(source, ["B", "C", "D"])
+    json_to_xlsx(str(source), incremental=True, max_rows=3)
+    append_jsonl(source, ["E"])
+    json_to_xlsx(str(source), incremental=True)
+
+    sheets = sheet_rows(str(tmp_path / "profiles.xlsx"))
+
+    assert [len(rows) - 1 for rows in sheets.values()] == [1, 2, 1, 1]
+    assert len(set(sheets)) == 4
+
+
+def test_rewritten_source_rebuilds_workbook(tmp_path):
+    source = tmp_path / "profiles.json"
+    source.write_text(json.dumps([{"name": "A"}, {"name": "B"}]), encoding='utf-8')
+    json_to_xlsx(str(source), incremental=True)
+
+    source.write_text(json.dumps([{"name": "X"}]), encoding='utf-8')
+
+    assert json_to_xlsx(str(source), incremental=True) == 1
+    assert [row[0] for row in sheet_rows(str(tmp_path / "profiles.xlsx"))["Data"][1:]] == ["X"]
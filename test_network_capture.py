@@ -0,0 +1,89 @@
+"""
+LinkedIn Bot - Network Capture Module Tests
+"""
+import base64
+import json
+from unittest import mock
+
+from network_capture import NetworkCapture, decode_search_response
+
+
+SEARCH_URL = ("https://www.linkedin.com/voyager/api/graphql?variables=(start:0,query:(keywords:security))"
+              "&queryId=voyagerSearchDashClusters.b0928897b71bd00a5a7291755dcd64f0")
+TYPEAHEAD_URL = ("https://www.linkedin.com/voyager/api/graphql?variables=(keywords:security,query:(typeaheadFilterQuery:()))"
+                 "&queryId=voyagerSearchDashTypeahead.0cd6d2ba2b1d4e3e5b5e7fd4a6a0f0b1")
+HISTORY_URL = "https://www.linkedin.com/voyager/api/graphql?queryId=voyagerSearchDashSearchHistory.3d1e5b1c2a"
+
+# Normalized voyagerSearchDashClusters response: results live in the included array
+SEARCH_PAYLOAD = {
+    "data": {"data": {"searchDashClustersByAll": {"elements": [{"items": [
+        {"item": {"*entityResult": "urn:li:fsd_entityResultViewModel:1"}},
+        {"item": {"*entityResult": "urn:li:fsd_entityResultViewModel:2"}}
+    ]}]}}},
+    "included": [
+        {
+            "$type": "com.linkedin.voyager.dash.search.EntityResultViewModel",
+            "entityUrn": "urn:li:fsd_entityResultViewModel:1",
+            "title": {"text": "Jan Kowalski"},
+            "primarySubtitle": {"text": "Security Engineer"},
+            "secondarySubtitle": {"text": "Warszawa"},
+            "summary": {"text": "Obecnie: Security Engineer w Acme"},
+            "navigationUrl": "https://www.linkedin.com/in/jan-kowalski?miniProfileUrn=urn%3Ali%3Afsd_profile%3A1"
+        },
+        {
+            "$type": "com.linkedin.voyager.dash.search.EntityResultViewModel",
+            "entityUrn": "urn:li:fsd_entityResultViewModel:2",
+            "title": {"text": "Acme"},
+            "primarySubtitle": {"text": "Computer Security"},
+            "navigationUrl": "https://www.linkedin.com/company/acme/"
+        }
+    ]
+}
+
+# voyagerSearchDashTypeahead response: suggestions link to profiles but are not results
+TYPEAHEAD_PAYLOAD = {
+    "data": {"data": {"searchDashTypeaheadByGlobalTypeahead": {"elements": [
+        {"*entityLockupView": "urn:li:fsd_typeaheadViewModel:1"}
+    ]}}},
+    "included": [
+        {
+            "$type": "com.linkedin.voyager.dash.search.TypeaheadViewModel",
+            "entityUrn": "urn:li:fsd_typeaheadViewModel:1",
+            "title": {"text": "Anna Nowak"},
+            "primarySubtitle": {"text": "Security Analyst"},
+            "navigationUrl": "https://www.linkedin.com/in/anna-nowak"
+        }
+    ]
+}
+
+
+def test_decode_search_response():
+    assert decode_search_response(SEARCH_PAYLOAD) == [{
+        "name": "Jan Kowalski",
+        "title": "Security Engineer",
+        "location": "Warszawa",
+        "current_company": "Acme",
+        "profile_url": "https://www.linkedin.com/in/jan-kowalski"
+    }]
+
+
+def test_decode_typeahead_response_yields_no_profiles():
+    assert decode_search_response(TYPEAHEAD_PAYLOAD) == []
+
+
+def test_only_search_result_queries_are_captured():
+    capture = NetworkCapture(mock.MagicMock())
+
+    assert capture._matches(SEARCH_URL)
+    assert not capture._matches(TYPEAHEAD_URL)
+    assert not capture._matches(HISTORY_URL)
+
+
+def test_base64_encoded_response_body_is_decoded():
+    driver = mock.MagicMock()
+    driver.execute_cdp_cmd.return_value = {
+        "body": base64.b64encode(json.dumps(SEARCH_PAYLOAD).encode("utf-8")).decode("ascii"),
+        "base64Encoded": True
+    }
+
+    assert NetworkCapture(driver)._response_body("1", SEARCH_URL) == SEARCH_PAYLOAD
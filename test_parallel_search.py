@@ -0,0 +1,184 @@
+"""
+LinkedIn Bot - Parallel People Search Module Tests
+"""
+import queue
+from argparse import Namespace
+
+import pytest
+
+import parallel_search
+from parallel_search import LOGIN_FAILED_EXIT_CODE, MAX_QUERY_ATTEMPTS, ParallelPeopleSearch
+
+
+class FakeProcess:
+    def __init__(self, target, name, args):
+        self.args = args
+        self.alive = False
+        self.exitcode = None
+
+    def start(self):
+        self.alive = True
+
+    def is_alive(self):
+        return self.alive
+
+    def die(self, exitcode):
+        self.alive = False
+        self.exitcode = exitcode
+
+
+class FakeContext:
+    """Stands in for the spawn context: in-process queues, processes that never run"""
+    Queue = queue.Queue
+    Process = FakeProcess
+
+
+class RecordingSink:
+    filename = "parallel_search_linkedin_profiles.jsonl"
+
+    def __init__(self):
+        self.profiles = []
+        self.flushes = 0
+
+    def write(self, profile, page=None):
+        self.profiles.append(profile)
+
+    def record_hit(self, url, page=None):
+        pass
+
+    def flush(self):
+        self.flushes += 1
+
+
+@pytest.fixture
+def search(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def make(queries, workers=3, max_concurrent=None, max_restarts=3):
+        args = Namespace(workers=workers, max_concurrent=max_concurrent, max_restarts=max_restarts,
+                         skip_known=False)
+        search = ParallelPeopleSearch(args, queries)
+        search.context = FakeContext()
+        search.result_queue = queue.Queue()
+        search.output_filename = RecordingSink.filename
+        for worker in range(1, workers + 1):
+            search.start_worker(worker)
+            search.handle_message(("ready", worker), RecordingSink(), None)
+        return search
+    return make
+
+
+def sent_tasks(search, worker):
+    tasks = []
+    while not search.task_queues[worker].empty():
+        tasks.append(search.task_queues[worker].get_nowait())
+    return tasks
+
+
+def finished(worker, query, status="succeeded"):
+    return ("finished", worker, query, status, 1, 0.5, None)
+
+
+def test_workers_get_the_parent_sink_filename(search):
+    parallel = search(["q1"], workers=1)
+
+    assert parallel.processes[1].args[-1] == RecordingSink.filename
+
+
+def test_dispatch_respects_max_concurrent(search):
+    parallel = search(["q1", "q2", "q3"], workers=3, max_concurrent=2)
+
+    parallel.dispatch()
+
+    assert parallel.in_flight == {1: "q1", 2: "q2"}
+    assert sent_tasks(parallel, 1) == ["q1"] and sent_tasks(parallel, 3) == []
+
+    parallel.handle_message(finished(2, "q2"), RecordingSink(), None)
+    parallel.dispatch()
+
+    assert parallel.in_flight == {1: "q1", 2: "q3"}
+    assert parallel.results["q2"]["status"] == "succeeded"
+
+
+def test_flush_is_acknowledged_after_the_sink_flushes(search):
+    parallel = search(["q1"], workers=1)
+    sink = RecordingSink()
+
+    parallel.handle_message(("profile", "q1", 1, {"profile_url": "https://www.linkedin.com/in/a"}), sink, None)
+    parallel.handle_message(("profile", "q1", 1, {"profile_url": "https://www.linkedin.com/in/a/"}), sink, None)
+    parallel.handle_message(("flush", 1, "token-1"), sink, None)
+
+    assert len(sink.profiles) == 1 and parallel.duplicates == 1
+    assert sink.flushes == 1
+    assert parallel.ack_queues[1].get_nowait() == "token-1"
+
+
+def test_crashed_worker_is_restarted_and_its_query_requeued(search):
+    parallel = search(["q1", "q2"], workers=1)
+    parallel.dispatch()
+    crashed = parallel.processes[1]
+
+    crashed.die(1)
+    parallel.check_workers(RecordingSink(), None)
+
+    assert parallel.processes[1] is not crashed and parallel.processes[1].is_alive()
+    assert parallel.restarts == {1: 1}
+    assert list(parallel.pending) == ["q2", "q1"]
+    assert parallel.in_flight == {}
+
+
+def test_query_fails_after_max_attempts(search):
+    parallel = search(["q1"], workers=1)
+
+    for _ in range(MAX_QUERY_ATTEMPTS):
+        parallel.handle_message(("ready", 1), RecordingSink(), None)
+        parallel.dispatch()
+        assert parallel.in_flight == {1: "q1"}
+        parallel.processes[1].die(1)
+        parallel.check_workers(RecordingSink(), None)
+
+    assert parallel.results["q1"]["status"] == "failed"
+    assert "died" in parallel.results["q1"]["error"]
+    assert not parallel.pending
+
+
+def test_query_finished_by_a_dead_worker_is_not_requeued(search):
+    parallel = search(["q1"], workers=1)
+    parallel.dispatch()
+
+    parallel.result_queue.put(finished(1, "q1"))
+    parallel.processes[1].die(1)
+    parallel.check_workers(RecordingSink(), None)
+
+    assert parallel.results["q1"]["status"] == "succeeded"
+    assert not parallel.pending
+
+
+def test_worker_that_cannot_log_in_is_not_restarted(search):
+    parallel = search(["q1"], workers=2)
+    parallel.dispatch()
+    crashed = parallel.processes[1]
+
+    crashed.die(LOGIN_FAILED_EXIT_CODE)
+    parallel.check_workers(RecordingSink(), None)
+
+    assert parallel.processes[1] is crashed
+    assert parallel.disabled_workers == {1}
+    assert list(parallel.pending) == ["q1"]
+
+    parallel.dispatch()
+    assert parallel.in_flight == {2: "q1"}
+
+
+def test_worker_exceeding_max_restarts_is_disabled(search, monkeypatch):
+    parallel = search(["q1", "q2", "q3"], workers=1, max_restarts=1)
+    monkeypatch.setattr(parallel_search, "MAX_QUERY_ATTEMPTS", 10)
+
+    for _ in range(2):
+        parallel.handle_message(("ready", 1), RecordingSink(), None)
+        parallel.dispatch()
+        parallel.processes[1].die(1)
+        parallel.check_workers(RecordingSink(), None)
+
+    assert parallel.restarts == {1: 1}
+    assert parallel.disabled_workers == {1}
@@ -0,0 +1,88 @@
+"""
+LinkedIn Bot - Offline Search Results Parser Module Tests
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("lxml")
+
+from profile_parser import discover_selectors, parse_document, parse_html_files, parse_search_results_html
+
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE = os.path.join(REPO_DIR, "fixtures", "people_search_page.html")
+
+
+@pytest.fixture
+def page_html():
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_discovers_selectors_from_first_card(page_html):
+    assert discover_selectors(parse_document(page_html)) == {
+        "profile": "li.reusable-search__result-container",
+        "title": "div.entity-result__primary-subtitle",
+        "location": "div.entity-result__secondary-subtitle",
+        "summary": "p.entity-result__summary"
+    }
+
+
+def test_parses_name_title_location_and_company(page_html):
+    profiles = parse_search_results_html(page_html)
+
+    assert profiles[0] == {
+        "name": "Jan Kowalski",
+        "title": "Security Engineer",
+        "location": "Warszawa, Mazowieckie, Polska",
+        "current_company": "Acme Corp",
+        "profile_url": "https://www.linkedin.com/in/jan-kowalski"
+    }
+    assert profiles[1]["name"] == "Anna Nowak"
+    assert profiles[1]["title"] == "DevOps Engineer"
+    assert profiles[1]["location"] == "Kraków"
+    assert profiles[1]["current_company"] == ""
+
+
+def test_profile_urls_are_absolute_without_query(page_html):
+    urls = [profile["profile_url"] for profile in parse_search_results_html(page_html)]
+
+    assert urls == ["https://www.linkedin.com/in/jan-kowalski", "https://www.linkedin.com/in/anna-nowak-123/"]
+
+
+def test_skips_empty_and_ad_cards(page_html):
+    names = [profile["name"] for profile in parse_search_results_html(page_html)]
+
+    # The photo-only card has no named link and the Premium card is an ad
+    assert names == ["Jan Kowalski", "Anna Nowak"]
+
+
+def test_skip_url_drops_known_cards_before_extraction(page_html):
+    skipped = []
+
+    def skip_url(url):
+        skipped.append(url)
+        return url == "https://www.linkedin.com/in/jan-kowalski"
+
+    profiles = parse_search_results_html(page_html, skip_url=skip_url)
+
+    assert [profile["name"] for profile in profiles] == ["Anna Nowak"]
+    assert "https://www.linkedin.com/in/jan-kowalski" in skipped
+
+
+def test_page_without_cards_yields_no_profiles():
+    assert parse_search_results_html("<html><body><ul class='list-style-none'></ul></body></html>") == []
+
+
+def test_parse_html_files_and_cli():
+    assert [(path, len(profiles)) for path, profiles in parse_html_files([FIXTURE], workers=1)] == [(FIXTURE, 2)]
+
+    result = subprocess.run(
+        [sys.executable, "profile_parser.py", FIXTURE],
+        cwd=REPO_DIR, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0
+    assert f"{FIXTURE}: 2 profiles" in result.stderr
@@ -0,0 +1,124 @@
+"""
+LinkedIn Bot - Profile Output Sinks Module Tests
+"""
+import json
+
+import pytest
+
+from profile_sink import JsonArrayProfileSink, JsonlProfileSink, MultiProfileSink, ProfileSink, create_profile_sink
+
+
+def write_staging(path, names):
+    with open(path, 'w', encoding='utf-8') as f:
+        for name in names:
+            f.write(json.dumps({"name": name}) + "\n")
+
+
+def read_names(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [profile["name"] for profile in json.load(f)]
+
+
+def test_fresh_run_sets_leftover_staging_aside(tmp_path):
+    filename = str(tmp_path / "query_linkedin_profiles.json")
+    write_staging(str(tmp_path / "query_linkedin_profiles.staging.jsonl"), ["Old"])
+
+    with JsonArrayProfileSink(filename) as sink:
+        sink.write({"name": "New"})
+
+    assert read_names(filename) == ["New"]
+    assert (tmp_path / "query_linkedin_profiles.staging.jsonl.stale").exists()
+
+
+def test_resumed_run_continues_leftover_staging(tmp_path):
+    filename = str(tmp_path / "query_linkedin_profiles.json")
+    write_staging(str(tmp_path / "query_linkedin_profiles.staging.jsonl"), ["Old"])
+
+    with JsonArrayProfileSink(filename, resume=True) as sink:
+        sink.write({"name": "New"})
+
+    assert read_names(filename) == ["Old", "New"]
+
+
+def read_jsonl_names(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line)["name"] for line in f]
+
+
+def test_fresh_jsonl_run_moves_earlier_output_aside(tmp_path):
+    filename = tmp_path / "query_linkedin_profiles.jsonl"
+    write_staging(str(filename), ["Old"])
+
+    with JsonlProfileSink(str(filename)) as sink:
+        sink.write({"name": "New"})
+
+    assert read_jsonl_names(filename) == ["New"]
+    rotated = [path for path in tmp_path.iterdir() if path != filename]
+    assert len(rotated) == 1 and rotated[0].name.startswith("query_linkedin_profiles.")
+    assert read_jsonl_names(rotated[0]) == ["Old"]
+
+
+def test_resumed_jsonl_run_appends_after_dropping_corrupt_tail(tmp_path):
+    filename = tmp_path / "query_linkedin_profiles.jsonl"
+    write_staging(str(filename), ["Old"])
+    with open(filename, 'a', encoding='utf-8') as f:
+        f.write('{"name": "Cut')
+
+    with JsonlProfileSink(str(filename), resume=True) as sink:
+        sink.write({"name": "New"})
+
+    assert read_jsonl_names(filename) == ["Old", "New"]
+    assert list(tmp_path.iterdir()) == [filename]
+
+
+class FailingSink(ProfileSink):
+    filename = "failing"
+
+    def write(self, profile, page=None):
+        pass
+
+    def close(self):
+        raise OSError("disk full")
+
+
+def test_multi_sink_closes_every_sink_when_one_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    jsonl_sink = create_profile_sink("query", mode="jsonl")
+    sink = MultiProfileSink([FailingSink(), jsonl_sink])
+
+    with pytest.raises(OSError, match="disk full"):
+        sink.close()
+
+    assert jsonl_sink.file.closed
+
+
+def test_sqlite_sink_honours_options_and_resumes_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    interrupted = create_profile_sink("query", mode="sqlite", batch_size=5, fsync_policy="never")
+    assert interrupted.batch_size == 5
+    interrupted.write({"profile_url": "https://www.linkedin.com/in/first"}, page=1)
+    interrupted.flush()
+    interrupted.store.close()
+
+    with create_profile_sink("query", mode="sqlite", resume=True) as resumed:
+        assert resumed.run_id == interrupted.run_id
+        resumed.write({"profile_url": "https://www.linkedin.com/in/second"}, page=2)
+
+    with create_profile_sink("query", mode="sqlite", resume=True) as fresh:
+        assert fresh.run_id != interrupted.run_id
+
+
+def test_combined_sink_passes_each_sink_only_its_options(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    sink = create_profile_sink("query", mode="jsonl+json", keep_staging=True, batch_size=5)
+    jsonl_sink, json_sink = sink.sinks
+    sink.write({"name": "A"})
+    sink.close()
+
+    assert jsonl_sink.batch_size == 5
+    assert json_sink.keep_staging and json_sink.staging.batch_size == 5
+    assert read_names(json_sink.filename) == ["A"]
+
+    with pytest.raises(TypeError, match="keep_stagin"):
+        create_profile_sink("query", mode="jsonl+sqlite", keep_stagin=True)